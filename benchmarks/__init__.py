@@ -0,0 +1 @@
+"""Benchmarks for the gybe render pipeline."""
@@ -0,0 +1,84 @@
+"""Synthetic chart that emits a Deployment, Service and ConfigMap per app.
+
+ConfigMap is not a `K8sResource`, so a transpiler cannot return it yet; the benchmark runs
+the chart function and the render stages directly instead of through output validation.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from gybe import k8s
+from gybe.k8s.v1_31.core.v1 import ConfigMap, ConfigMapEnvSource
+
+
+@dataclass
+class App:
+    """Values for one synthetic app."""
+
+    name: str
+    image: str
+    replicas: int = 1
+    port: int = 8080
+    env: dict[str, str] = field(default_factory=dict)
+
+
+def apps(apps: list[App], namespace: str = 'default') -> list[Any]:
+    """Emit a Deployment, Service and ConfigMap for every app."""
+    resources: list[Any] = []
+    for app in apps:
+        metadata = k8s.ObjectMeta(name=app.name, namespace=namespace, labels={'app': app.name})
+        resources.append(
+            k8s.Deployment(
+                apiVersion='apps/v1',
+                kind='Deployment',
+                metadata=metadata,
+                spec=k8s.DeploymentSpec(
+                    replicas=app.replicas,
+                    selector=k8s.LabelSelector(matchLabels={'app': app.name}),
+                    template=k8s.PodTemplateSpec(
+                        metadata=k8s.ObjectMeta(labels={'app': app.name}),
+                        spec=k8s.PodSpec(
+                            containers=[
+                                k8s.Container(
+                                    name=app.name,
+                                    image=app.image,
+                                    ports=[k8s.ContainerPort(containerPort=app.port)],
+                                    envFrom=[
+                                        k8s.EnvFromSource(configMapRef=ConfigMapEnvSource(name=app.name))
+                                    ],
+                                )
+                            ]
+                        ),
+                    ),
+                ),
+            )
+        )
+        resources.append(
+            k8s.Service(
+                apiVersion='v1',
+                kind='Service',
+                metadata=metadata,
+                spec=k8s.ServiceSpec(
+                    selector={'app': app.name},
+                    ports=[k8s.ServicePort(port=80, targetPort=str(app.port))],
+                ),
+            )
+        )
+        resources.append(ConfigMap(apiVersion='v1', kind='ConfigMap', metadata=metadata, data=app.env))
+    return resources
+
+
+def values(size: int) -> dict[str, Any]:
+    """Values for `apps` that emit at least `size` resources."""
+    return {
+        'namespace': 'bench',
+        'apps': [
+            {
+                'name': f'app-{i}',
+                'image': f'registry.local/app-{i}:1.0',
+                'replicas': 2,
+                'env': {'APP_ID': str(i)},
+            }
+            for i in range(-(-size // 3))
+        ],
+    }
@@ -0,0 +1,137 @@
+"""Benchmark importing gybe and every generated `gybe.k8s.v1_XX` package.
+
+Each module is imported in fresh interpreters: once under `-X importtime` for wall and
+cumulative import time, and once under tracemalloc for the memory and bytecode its import
+loads. Run from the repository root:
+
+    python -m benchmarks.imports             # compare against benchmarks/import_baselines.json
+    python -m benchmarks.imports --update    # store the results as the new baselines
+
+Baselines are only comparable on the machine they were recorded on.
+"""
+
+import argparse
+import importlib
+import json
+import marshal
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.run import child_env, compare, run_child
+
+ROOT = Path(__file__).parent.parent
+BASELINES = Path(__file__).with_name('import_baselines.json')
+VERSION_MODULES = ('core.v1', 'apps.v1', 'meta.v1')
+METRICS = ('import_seconds', 'cumulative_import_seconds', 'memory_bytes', 'bytecode_bytes')
+
+
+def targets() -> list[str]:
+    """Modules to benchmark: gybe, gybe.k8s and the core, apps and meta models of every version."""
+    versions = sorted(p.name for p in (ROOT / 'gybe' / 'k8s').glob('v1_*') if p.is_dir())
+    return ['gybe', 'gybe.k8s', *(f'gybe.k8s.{v}.{m}' for v in versions for m in VERSION_MODULES)]
+
+
+def _child(module: str, mode: str) -> dict[str, float]:
+    if mode == 'time':
+        start = time.perf_counter()
+        # __import__ goes through the C import machinery that -X importtime instruments,
+        # importlib.import_module does not
+        __import__(module)
+        return {'import_seconds': time.perf_counter() - start}
+
+    before = set(sys.modules)
+    tracemalloc.start()
+    importlib.import_module(module)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bytecode = 0
+    for name in set(sys.modules) - before:
+        spec = sys.modules[name].__spec__
+        if spec is None or spec.name != name:
+            # aliases such as multiprocessing's __mp_main__
+            continue
+        get_code = getattr(spec.loader, 'get_code', None)
+        code = get_code(name) if get_code is not None else None
+        bytecode += len(marshal.dumps(code)) if code is not None else 0
+    return {'memory_bytes': memory, 'bytecode_bytes': bytecode}
+
+
+def _cumulative_us(importtime: str, module: str) -> int:
+    match = re.search(rf'^import time:\s+\d+ \|\s+(\d+) \|\s*{re.escape(module)}$', importtime, re.MULTILINE)
+    return int(match.group(1)) if match else 0
+
+
+def measure_import(module: str, env: dict[str, str], repeat: int = 3) -> dict[str, float]:
+    """Measure importing `module` in fresh interpreters, keeping the fastest of `repeat` imports.
+
+    A first, untimed import writes the bytecode cache, see `child_env`.
+    """
+    child = ['-m', 'benchmarks.imports', '--child', module, '--mode']
+    run_child([*child, 'time'], env)
+    metrics: dict[str, float] = {'import_seconds': float('inf'), 'cumulative_import_seconds': float('inf')}
+    for _ in range(repeat):
+        result = run_child(['-X', 'importtime', *child, 'time'], env)
+        seconds = json.loads(result.stdout)['import_seconds']
+        metrics['import_seconds'] = min(metrics['import_seconds'], seconds)
+        cumulative = _cumulative_us(result.stderr, module) / 1e6
+        metrics['cumulative_import_seconds'] = min(metrics['cumulative_import_seconds'], cumulative)
+    metrics.update(json.loads(run_child([*child, 'memory'], env).stdout))
+    return metrics
+
+
+def _format(results: dict[str, dict[str, float]]) -> str:
+    rows = [['module', 'import', 'cumulative', 'memory', 'bytecode']]
+    for module, m in results.items():
+        rows.append(
+            [
+                module,
+                f'{m["import_seconds"] * 1000:.1f} ms',
+                f'{m["cumulative_import_seconds"] * 1000:.1f} ms',
+                f'{m["memory_bytes"] / 2**20:.1f} MiB',
+                f'{m["bytecode_bytes"] / 2**20:.1f} MiB',
+            ]
+        )
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+    return '\n'.join('  '.join(c.rjust(w) for c, w in zip(r, widths)) for r in rows)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the import benchmarks and compare them to the stored baselines."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('modules', nargs='*', help='modules to import, all targets by default')
+    parser.add_argument('--repeat', type=int, default=3, help='imports per module, the fastest is kept')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown over the baseline')
+    parser.add_argument('--baselines', type=Path, default=BASELINES, help='baselines JSON file')
+    parser.add_argument('--update', action='store_true', help='store the results as the new baselines')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=['time', 'memory'], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        print(json.dumps(_child(args.child, args.mode)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = child_env(pycache_prefix)
+        results = {m: measure_import(m, env, args.repeat) for m in args.modules or targets()}
+    print(_format(results))
+    if args.update:
+        baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+        args.baselines.write_text(json.dumps({**baselines, **results}, indent=2, sort_keys=True) + '\n')
+        return 0
+
+    regressions = compare(results, json.loads(args.baselines.read_text()), args.threshold, label='{}')
+    for r in regressions:
+        print('REGRESSION', r, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
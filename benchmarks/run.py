@@ -0,0 +1,184 @@
+"""Benchmark importing gybe and rendering 1 to 100k resources.
+
+Every size runs in a fresh interpreter so import time and peak RSS are its own. Run from the
+repository root:
+
+    python -m benchmarks.run             # compare against benchmarks/baselines.json
+    python -m benchmarks.run --update    # store the results as the new baselines
+
+Baselines are only comparable on the machine they were recorded on.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+SIZES = (1, 100, 10_000, 100_000)
+BASELINES = Path(__file__).with_name('baselines.json')
+METRICS = (
+    'import_seconds',
+    'structure_seconds',
+    'build_seconds',
+    'unstructure_seconds',
+    'yaml_dumps_seconds',
+    'peak_rss_bytes',
+)
+
+
+def _best(repeat: int, fn: Callable[[], Any]) -> tuple[float, Any]:
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def measure(size: int, repeat: int = 3) -> dict[str, float]:
+    """Measure every stage of rendering `size` resources, best of `repeat` runs.
+
+    Import time and peak RSS are only meaningful in a fresh interpreter, see `run`.
+    """
+    start = time.perf_counter()
+    from benchmarks import charts
+    from gybe.rendering import Transpiler
+    from gybe.serialization import unstructure
+    from gybe.yaml import yaml_dumps
+
+    import_seconds = time.perf_counter() - start
+
+    transpiler = Transpiler(charts.apps)
+    values = charts.values(size)
+    structure_seconds, kwargs = _best(repeat, lambda: transpiler.structure_inputs(values))
+    build_seconds, resources = _best(repeat, lambda: charts.apps(**kwargs)[:size])
+    unstructure_seconds, documents = _best(repeat, lambda: [unstructure(r) for r in resources])
+    yaml_dumps_seconds, _ = _best(repeat, lambda: '---\n'.join(yaml_dumps(d) for d in documents))
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'import_seconds': import_seconds,
+        'structure_seconds': structure_seconds,
+        'build_seconds': build_seconds,
+        'unstructure_seconds': unstructure_seconds,
+        'yaml_dumps_seconds': yaml_dumps_seconds,
+        # kilobytes on Linux, bytes on macOS
+        'peak_rss_bytes': peak_rss if sys.platform == 'darwin' else peak_rss * 1024,
+    }
+
+
+def child_env(pycache_prefix: str) -> dict[str, str]:
+    """Environment for benchmark interpreters that cache bytecode under `pycache_prefix`.
+
+    Bytecode is written even when PYTHONDONTWRITEBYTECODE is set, so imports are timed the way
+    installed packages are imported rather than compiled from source every time.
+    """
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    env['PYTHONPYCACHEPREFIX'] = pycache_prefix
+    return env
+
+
+def run_child(args: list[str], env: dict[str, str]) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter from the repository root."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        cwd=Path(__file__).parent.parent,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def run(sizes: list[int], repeat: int = 3) -> dict[str, dict[str, float]]:
+    """Measure each size in its own interpreter, keyed by size."""
+    results = {}
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = child_env(pycache_prefix)
+        run_child(['-c', 'import benchmarks.charts'], env)
+        for size in sizes:
+            out = run_child(
+                ['-m', 'benchmarks.run', '--child', str(size), '--repeat', str(repeat)], env
+            ).stdout
+            results[str(size)] = json.loads(out)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baselines: dict[str, dict[str, float]],
+    threshold: float,
+    min_seconds: float = 0.001,
+    label: str = '{} resources',
+) -> list[str]:
+    """Describe every metric that is more than `threshold` worse than its baseline.
+
+    Timings within `min_seconds` of their baseline are never regressions, since sub-millisecond
+    stages are mostly noise.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        for metric, value in metrics.items():
+            baseline = baselines.get(key, {}).get(metric)
+            if baseline is None or value <= baseline * (1 + threshold):
+                continue
+            if metric.endswith('_seconds') and value - baseline < min_seconds:
+                continue
+            regressions.append(f'{label.format(key)}: {metric} {value:.6g} > baseline {baseline:.6g}')
+    return regressions
+
+
+def _format(results: dict[str, dict[str, float]]) -> str:
+    header = ['resources', *(m.removesuffix('_seconds').removesuffix('_bytes') for m in METRICS)]
+    rows = [header]
+    for size, metrics in results.items():
+        row = [size]
+        for m in METRICS:
+            row.append(
+                f'{metrics[m] / 2**20:.1f} MiB' if m.endswith('_bytes') else f'{metrics[m] * 1000:.2f} ms'
+            )
+        rows.append(row)
+    widths = [max(len(r[i]) for r in rows) for i in range(len(header))]
+    return '\n'.join('  '.join(c.rjust(w) for c, w in zip(r, widths)) for r in rows)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmarks and compare them to the stored baselines."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='resource counts to render')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per stage, the fastest is kept')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown over the baseline')
+    parser.add_argument('--baselines', type=Path, default=BASELINES, help='baselines JSON file')
+    parser.add_argument('--update', action='store_true', help='store the results as the new baselines')
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        print(json.dumps(measure(args.child, args.repeat)))
+        return 0
+
+    results = run(args.sizes, args.repeat)
+    print(_format(results))
+    if args.update:
+        baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+        args.baselines.write_text(json.dumps({**baselines, **results}, indent=2, sort_keys=True) + '\n')
+        return 0
+
+    baselines = json.loads(args.baselines.read_text())
+    regressions = compare(results, baselines, args.threshold)
+    for r in regressions:
+        print('REGRESSION', r, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
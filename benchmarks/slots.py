@@ -0,0 +1,104 @@
+"""Compare generated models with and without `__slots__`.
+
+Builds a `slots=True` copy of a few of the most frequently instantiated models, declared the
+way `python -m gybe.codegen <version> --slots` declares them, and measures memory per
+instance, construction, attribute access and unstructuring for both. Run from the repository
+root:
+
+    python -m benchmarks.slots
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import MISSING, dataclass, fields
+from operator import attrgetter
+from typing import Any, Callable, Optional
+
+from gybe import k8s
+from gybe.serialization import unstructure
+
+MODELS: dict[str, dict[str, Any]] = {
+    'EnvVar': {'name': 'LOG_LEVEL', 'value': 'info'},
+    'VolumeMount': {'name': 'config', 'mountPath': '/etc/app', 'readOnly': True},
+    'ObjectMeta': {'name': 'web', 'namespace': 'prod', 'labels': {'app': 'web'}},
+    'Container': {'name': 'web', 'image': 'registry.local/web:1.0', 'args': ['--port', '8080']},
+}
+
+
+def slotted(cls: type) -> type:
+    """Copy a generated model class with `@dataclass(slots=True)`."""
+    namespace: dict[str, Any] = {
+        '__annotations__': dict(cls.__annotations__),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__doc__': cls.__doc__,
+    }
+    for f in fields(cls):
+        if f.default is not MISSING:
+            namespace[f.name] = f.default
+    return dataclass(slots=True)(type(cls.__name__, cls.__bases__, namespace))
+
+
+def _best(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(cls: type, kwargs: dict[str, Any], count: int, repeat: int = 3) -> dict[str, float]:
+    """Measure `count` instances of `cls`, per instance."""
+    tracemalloc.start()
+    instances = [cls(**kwargs) for _ in range(count)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    names = list(kwargs)
+    get = attrgetter(*names)
+
+    def read():
+        for obj in instances:
+            get(obj)
+
+    return {
+        'bytes': memory / count,
+        'construct_ns': _best(repeat, lambda: [cls(**kwargs) for _ in range(count)]) / count * 1e9,
+        'getattr_ns': _best(repeat, read) / (count * len(names)) * 1e9,
+        'unstructure_ns': _best(repeat, lambda: [unstructure(obj) for obj in instances]) / count * 1e9,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Print per-instance costs of each model with and without slots."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--count', type=int, default=100_000, help='instances per model')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, the fastest is kept')
+    args = parser.parse_args(argv)
+
+    rows = [['model', 'bytes', 'construct', 'getattr', 'unstructure']]
+    for name, kwargs in MODELS.items():
+        cls = getattr(k8s, name)
+        for label, model in (('dict', cls), ('slots', slotted(cls))):
+            m = measure(model, kwargs, args.count, args.repeat)
+            rows.append(
+                [
+                    f'{name} ({label})',
+                    f'{m["bytes"]:.0f} B',
+                    f'{m["construct_ns"]:.0f} ns',
+                    f'{m["getattr_ns"]:.1f} ns',
+                    f'{m["unstructure_ns"]:.0f} ns',
+                ]
+            )
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+    print('\n'.join('  '.join(c.rjust(w) for c, w in zip(r, widths)) for r in rows))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
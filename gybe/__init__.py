@@ -4,6 +4,17 @@ __version__ = '0.4.1'
 
 
 from gybe import k8s
-from gybe.decorators import Manifest, transpiler
+from gybe.decorators import Manifest, ManifestIterator, transpiler
+from gybe.loading import load_manifests
+from gybe.rendering import render, render_json, render_yaml
 
-__all__ = ['k8s', 'Manifest', 'transpiler']
+__all__ = [
+    'k8s',
+    'Manifest',
+    'ManifestIterator',
+    'load_manifests',
+    'render',
+    'render_json',
+    'render_yaml',
+    'transpiler',
+]
@@ -0,0 +1,5 @@
+"""Run the gybe command line interface."""
+
+from gybe.cli import main
+
+main()
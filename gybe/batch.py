@@ -0,0 +1,91 @@
+"""Render one transpiler against many values files in a single process."""
+
+import multiprocessing
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from gybe.cache import RenderCache
+from gybe.exceptions import InvalidInputError
+from gybe.rendering import Transpiler
+from gybe.yaml import yaml_loads
+
+# transpiler and cache inherited by forked workers, since functions from a chart's
+# `__main__` module cannot be pickled by reference
+_worker_args: Optional[tuple[Transpiler, Optional[RenderCache]]] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of rendering a single values file."""
+
+    values_path: Path
+    output_path: Path
+    seconds: float
+    error: Optional[str] = None
+
+
+def output_paths(values_paths: list[Path], out_dir: Path) -> list[Path]:
+    """Map each values file to `<out_dir>/<values file stem>.yaml`."""
+    paths = [out_dir / f'{p.stem}.yaml' for p in values_paths]
+    seen: dict[Path, Path] = {}
+    for values_path, path in zip(values_paths, paths):
+        if path in seen:
+            raise ValueError(f'{seen[path]} and {values_path} would both be written to {path}')
+        seen[path] = values_path
+    return paths
+
+
+def render_many(
+    transpiler: Transpiler,
+    values_paths: list[Path],
+    out_dir: Path,
+    jobs: int = 1,
+    cache: Optional[RenderCache] = None,
+) -> list[BatchResult]:
+    """Render every values file to its own manifest, optionally across forked workers."""
+    global _worker_args
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = list(zip(values_paths, output_paths(values_paths, out_dir)))
+    if jobs <= 1 or len(tasks) <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [_render_file(transpiler, cache, *task) for task in tasks]
+
+    _worker_args = (transpiler, cache)
+    try:
+        # forked workers share the modules and models already imported by this process
+        with multiprocessing.get_context('fork').Pool(min(jobs, len(tasks))) as pool:
+            return pool.starmap(_render_worker_file, tasks)
+    finally:
+        _worker_args = None
+
+
+def _render_worker_file(values_path: Path, output_path: Path) -> BatchResult:
+    if _worker_args is None:  # pragma: no cover
+        raise RuntimeError('batch worker started without a transpiler')
+    return _render_file(*_worker_args, values_path, output_path)
+
+
+def _render_file(
+    transpiler: Transpiler,
+    cache: Optional[RenderCache],
+    values_path: Path,
+    output_path: Path,
+) -> BatchResult:
+    start = time.perf_counter()
+    error = None
+    try:
+        input_data = yaml_loads(values_path.read_text()) or dict()
+        with output_path.open('w') as output:
+            if cache is None:
+                transpiler.render_to_stream(input_data, output)
+            else:
+                cache.render(transpiler, input_data, output)
+    except InvalidInputError as exc:
+        error = '; '.join(exc.errors)
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+    if error is not None:
+        output_path.unlink(missing_ok=True)
+    return BatchResult(values_path, output_path, time.perf_counter() - start, error)
@@ -0,0 +1,122 @@
+"""Content-addressed on-disk cache of rendered manifests."""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import gybe
+from gybe import k8s
+from gybe.rendering import TextWriter, Transpiler
+
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class RenderCache:
+    """Rendered manifests keyed on chart source, gybe and k8s versions, and values.
+
+    Entries are evicted least recently used first once the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """Initialize a RenderCache.
+
+        Attributes
+        ----------
+        directory: Cache directory, created on first write.
+        max_bytes: Total size of cached manifests to keep.
+
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, transpiler: Transpiler, input_data: dict[str, Any]) -> str:
+        """Hash everything that can change the manifest a transpiler renders."""
+        f = transpiler.function
+        h = hashlib.sha256()
+        for part in (gybe.__version__, k8s.current_version(), f.__module__, f.__qualname__):
+            h.update(part.encode() + b'\0')
+        for path in chart_source_files(f):
+            h.update(str(path).encode() + b'\0' + path.read_bytes() + b'\0')
+        h.update(json.dumps(input_data, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def render(self, transpiler: Transpiler, input_data: dict[str, Any], output: TextWriter) -> bool:
+        """Write the manifest for `input_data` from cache, or render and cache it.
+
+        Returns whether the manifest was served from the cache.
+        """
+        key = self.key(transpiler, input_data)
+        path = self.directory / f'{key}.yaml'
+        try:
+            # touched first, so an entry evicted in between fails before anything is written
+            os.utime(path)
+            with path.open() as cached:
+                shutil.copyfileobj(cached, output)
+            output.flush()
+            return True
+        except FileNotFoundError:
+            pass
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with tmp_path.open('w') as tmp:
+                transpiler.render_to_stream(input_data, _TeeWriter(output, tmp))
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self.evict()
+        return False
+
+    def evict(self) -> None:
+        """Remove least recently used manifests until the cache fits in `max_bytes`."""
+        entries = []
+        for p in self.directory.glob('*.yaml'):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, p))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+
+class _TeeWriter:
+    def __init__(self, *writers: TextWriter):
+        self._writers = writers
+
+    def write(self, s: str, /) -> int:
+        for w in self._writers:
+            w.write(s)
+        return len(s)
+
+    def flush(self) -> None:
+        for w in self._writers:
+            w.flush()
+
+
+def chart_source_files(f: Callable[..., Any]) -> list[Path]:
+    """Source of the transpiler's module plus local helper modules imported next to it."""
+    module_file = getattr(sys.modules.get(f.__module__), '__file__', None)
+    if module_file is None:
+        return []
+    chart_path = Path(module_file).resolve()
+    chart_dir = chart_path.parent
+    paths = {chart_path}
+    for module in list(sys.modules.values()):
+        file = getattr(module, '__file__', None)
+        if file is None or not file.endswith('.py'):
+            continue
+        path = Path(file).resolve()
+        if path.is_relative_to(chart_dir) and not {'site-packages', 'dist-packages'} & set(path.parts):
+            paths.add(path)
+    return sorted(paths)
@@ -0,0 +1,60 @@
+"""gybe command line interface."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import click
+
+if TYPE_CHECKING:
+    from gybe.server import RenderHTTPServer, UnixRenderHTTPServer
+
+
+@click.group()
+def main():
+    """Tools for running gybe transpilers."""
+
+
+@main.command()
+@click.argument(
+    'charts',
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Listen on a Unix domain socket instead of TCP.',
+)
+@click.option('--host', default='127.0.0.1', show_default=True, help='TCP address to listen on.')
+@click.option('--port', default=8734, show_default=True, help='TCP port to listen on.')
+@click.option('--quiet', is_flag=True, help='Do not log requests.')
+def serve(charts: tuple[Path, ...], socket_path: Optional[Path], host: str, port: int, quiet: bool):
+    """Serve renders of the transpilers defined in CHARTS over HTTP.
+
+    Charts stay imported between requests and are reloaded when their file changes.
+    `POST /render/<chart>` with a YAML or JSON values body returns the manifest.
+    """
+    from gybe.server import ChartRegistry, RenderHTTPServer, UnixRenderHTTPServer
+
+    registry = ChartRegistry(list(charts))
+    server: Union['RenderHTTPServer', 'UnixRenderHTTPServer']
+    if socket_path is not None:
+        try:
+            server = UnixRenderHTTPServer(socket_path, registry, quiet=quiet)
+        except OSError as exc:
+            raise click.BadParameter(exc.strerror or str(exc), param_hint="'--socket'") from exc
+        where = f'unix:{socket_path}'
+    else:
+        server = RenderHTTPServer((host, port), registry, quiet=quiet)
+        where = f'http://{host}:{server.server_address[1]}'
+    click.echo(f'serving {", ".join(registry.names())} on {where}', err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
@@ -1,13 +1,80 @@
 """gybe.k8s codegen cli"""
 
 import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
 
-from gybe.codegen.k8s_modules import write_module
+from gybe.codegen.k8s_modules import write_modules
+
+
+def _version_module_ref(arg: str) -> tuple[str, Optional[str]]:
+    version_module, _, ref = arg.partition('=')
+    return version_module, ref or None
+
+
+def format_files(paths: list[Path]) -> None:
+    """Fix and format generated files with ruff, leaving every other file alone."""
+    files = [str(p) for p in paths if p.suffix in ('.py', '.pyi')]
+    if not files:
+        return  # ruff would check the working directory instead
+    for args in (['check', '--quiet', '--fix'], ['format', '--quiet']):
+        subprocess.run([sys.executable, '-m', 'ruff', *args, *files], check=True)  # noqa: S603
 
 
 def main():
     """Run gybe.k8s code generator cli"""
     parser = argparse.ArgumentParser()
-    parser.add_argument('k8s_version_module')
+    parser.add_argument(
+        'k8s_version_modules',
+        nargs='+',
+        type=_version_module_ref,
+        metavar='k8s_version_module[=ref]',
+        help='version modules to generate (ex: v1_30), each read from a git ref of the kubernetes '
+        'checkout (ex: v1_30=v1.30.8) or from its checked out files',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='worker processes that generate modules, one per CPU by default',
+    )
+    parser.add_argument(
+        '--format',
+        action='store_true',
+        help='run ruff check --fix and ruff format over the files written by this run',
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='rebuild every module, even when its schemas did not change since the last run',
+    )
+    parser.add_argument(
+        '--serializers',
+        action='store_true',
+        help='emit static to_dict() and from_dict() methods on every model',
+    )
+    parser.add_argument(
+        '--slots',
+        action='store_true',
+        help='emit @dataclass(slots=True) models without a per-instance __dict__',
+    )
+    parser.add_argument(
+        '--stubs',
+        action='store_true',
+        help='write model docstrings to .pyi stubs and leave them out of the runtime modules',
+    )
     args = parser.parse_args()
-    write_module(args.k8s_version_module)
+    written = write_modules(
+        dict(args.k8s_version_modules),
+        jobs=args.jobs,
+        serializers=args.serializers,
+        slots=args.slots,
+        stubs=args.stubs,
+        force=args.force,
+    )
+    if args.format:
+        format_files(written)
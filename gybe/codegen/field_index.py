@@ -0,0 +1,145 @@
+"""Index the fields and kinds of a generated k8s version package.
+
+The index lets tools check rendered manifests against a version without importing and
+reflecting over all of its models. It is written to `gybe/k8s/<version>/field_index.json`
+and read at runtime with `gybe.k8s.field_index.load_field_index`:
+
+    {
+      "kinds": {"apps/v1/Deployment": "apps.v1.Deployment", ...},
+      "models": {"apps.v1.Deployment": {"spec": "apps.v1.DeploymentSpec", "kind": null, ...}, ...}
+    }
+
+Model fields map to the model they hold, `[model]` for lists of models, or `null` for plain
+values. Kinds are keyed by the API group of their package, like the version's kind registry.
+"""
+
+import argparse
+import dataclasses
+import importlib
+import json
+import types
+import typing
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from gybe.codegen.schema_index import SCALAR_TYPES, SchemaIndex, load_schema_index, resource_api_versions
+from gybe.k8s import types as k8s_types
+from gybe.k8s.field_index import INDEX_FILE
+from gybe.k8s.types import K8sSpec
+
+KIND_FIELDS = {'apiVersion', 'kind', 'metadata'}
+# API groups by package. Packages missing here, like core and meta, are in the legacy group:
+# `apiVersion: v1`.
+API_GROUPS = {package.rpartition('.')[2]: group for package, group in resource_api_versions.items() if group}
+
+
+def build_field_index(version: str, k8s_dir: Path = Path('gybe/k8s')) -> dict[str, Any]:
+    """Import every module of a version package and index its models."""
+    models: dict[str, dict[str, Optional[str]]] = {}
+    kinds: dict[str, str] = {}
+    for path in sorted((k8s_dir / version).rglob('*.py')):
+        if path.name == '__init__.py':
+            continue
+        module_name = '.'.join(path.relative_to(k8s_dir / version).with_suffix('').parts)
+        module = importlib.import_module(f'gybe.k8s.{version}.{module_name}')
+        for value in vars(module).values():
+            if not (
+                isinstance(value, type) and issubclass(value, K8sSpec) and dataclasses.is_dataclass(value)
+            ):
+                continue
+            key = model_key(value)
+            if key is None or key in models:
+                continue
+            # JSONDict's forward references resolve in gybe.k8s.types, not the model's module
+            hints = typing.get_type_hints(value, localns=vars(k8s_types))
+            models[key] = {f.name: _field_ref(hints[f.name]) for f in dataclasses.fields(value)}
+            if KIND_FIELDS <= models[key].keys():
+                kinds[package_api_version_kind(key)] = key
+    return {'kinds': dict(sorted(kinds.items())), 'models': dict(sorted(models.items()))}
+
+
+def field_index_from_schemas(index: SchemaIndex) -> dict[str, Any]:
+    """Index a version from its codegen schema index, without importing any of its modules.
+
+    Kinds are the resources served by the version's API paths and their lists, keyed like the
+    version's kind registry, see `gybe.codegen.kind_registry`.
+    """
+    schemas = {key: model for key, model in index['models'].items() if model['fields']}
+    models = {
+        key: {name: _schema_ref(f['type'], schemas) for name, f in model['fields'].items()}
+        for key, model in schemas.items()
+    }
+    kinds: dict[str, str] = {}
+    for api_version_kind, resource in index['resources'].items():
+        key = resource['model']
+        if key in models:
+            kinds[api_version_kind] = key
+        if key + 'List' in models:
+            kinds[api_version_kind + 'List'] = key + 'List'
+    return {'kinds': dict(sorted(kinds.items())), 'models': dict(sorted(models.items()))}
+
+
+def _schema_ref(field_type: str, schemas: dict[str, Any]) -> Optional[str]:
+    if field_type.startswith('['):
+        item = _schema_ref(field_type[1:-1], schemas)
+        return None if item is None or item.startswith('[') else f'[{item}]'
+    if field_type in SCALAR_TYPES or field_type not in schemas:
+        return None
+    return field_type
+
+
+def model_key(cls: type) -> Optional[str]:
+    """Name a model relative to its version or shared package, like `core.v1.Pod`."""
+    parts = cls.__module__.split('.')
+    if parts[:2] != ['gybe', 'k8s'] or len(parts) < 4:
+        return None
+    return '.'.join([*parts[3:], cls.__qualname__])
+
+
+def package_api_version_kind(key: str) -> str:
+    """Name a top level model's `apiVersion`/`kind` from the API group of its package."""
+    package, version, kind = key.split('.')[-3:]
+    group = API_GROUPS.get(package)
+    return f'{group}/{version}/{kind}' if group else f'{version}/{kind}'
+
+
+def _field_ref(hint: Any) -> Optional[str]:
+    if typing.get_origin(hint) in (Union, types.UnionType):
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        hint = args[0]
+    if typing.get_origin(hint) is list:
+        item = _field_ref(typing.get_args(hint)[0])
+        return None if item is None or item.startswith('[') else f'[{item}]'
+    if isinstance(hint, type) and issubclass(hint, K8sSpec):
+        return model_key(hint)
+    return None
+
+
+def write_field_index(version: str, k8s_dir: Path = Path('gybe/k8s')) -> Path:
+    """Write a version package's field index next to its modules.
+
+    Built from the version's codegen schema index when there is one, and by importing its
+    modules otherwise.
+    """
+    path = k8s_dir / version / INDEX_FILE
+    schemas = load_schema_index(version)
+    index = build_field_index(version, k8s_dir) if schemas is None else field_index_from_schemas(schemas)
+    path.write_text(json.dumps(index, indent=None, separators=(',', ':')) + '\n')
+    return path
+
+
+def main():
+    """Run the gybe.k8s field index cli"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('k8s_version_modules', nargs='+', help='version modules to index (ex: v1_29 v1_30)')
+    args = parser.parse_args()
+    for version in args.k8s_version_modules:
+        print(f'wrote {write_field_index(version)}')
+
+
+if __name__ == '__main__':
+    main()
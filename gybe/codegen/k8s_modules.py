@@ -3,153 +3,121 @@
 from __future__ import annotations
 
 import ast
+import copy
 import json
+import multiprocessing
 import textwrap
 from pathlib import Path
-from typing import Optional, TypeAlias, TypedDict, Union
-
-k8s_openapi_dir = Path('kubernetes/api/openapi-spec/v3')
-# a json-serializable dict
-JSONObj: TypeAlias = Union[dict[str, 'JSONObj'], list['JSONObj'], str, int, float, bool, None]
-JSONDict: TypeAlias = dict[str, Union['JSONObj', 'JSONDict']]
-schema_type_map = dict(
-    string='str',
-    boolean='bool',
-    integer='int',
-    number='float',
-    object='JSONDict',
+from typing import Any, Optional
+
+from gybe.codegen.kind_registry import kind_registry_from_schemas, write_kind_registry
+from gybe.codegen.schema_index import (
+    SCALAR_TYPES,
+    FieldSchema,
+    ModelSchema,
+    schema_index,
+    schema_type_map,
+    sha256,
 )
-# ignored models fallback to `JSONObj`
-ignore_models = {
-    # includes hyphenated fields
-    'JSONSchemaProps',
-    # 'except` reserved: `IPBlock.except`
-    'IPBlock',
-    # `from` reserved: `NetworkPolicyIngressRule.from`
-    'NetworkPolicyIngressRule',
-    # `continue` reserved: `ListMeta.continue`
-    'ListMeta',
-    # `RawExtension` is strange
-    'RawExtension',
-    # Undefined models
-    'CustomResourceSubresourceStatus',
-    'StorageVersionSpec',
-    'FieldsV1',
-}
-# NOTE: The expected `apiVersion` values for k8s resources are documented here:
-# https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.30/
-# in the tables with `Group`, `Version` and `Kind`. This data does not exist in
-# the kubernetes JSON schema, so it's manually mapped below.
-resource_api_versions = {
-    'io.k8s.api.admissionregistration': 'admissionregistration.k8s.io',
-    'io.k8s.api.apiserverinternal': 'admissionregistration.k8s.io',
-    'io.k8s.api.apps': 'apps',
-    'io.k8s.api.authentication': 'authentication.k8s.io',
-    'io.k8s.api.authorization': 'rbac.authorization.k8s.io',
-    'io.k8s.api.autoscaling': 'autoscaling',
-    'io.k8s.api.batch': 'batch',
-    'io.k8s.api.certificates': 'certificates.k8s.io',
-    'io.k8s.api.core': '',  # `apiVersion: v1`, `apiVersion: v2`, ect.
-    'io.k8s.api.flowcontrol': 'flowcontrol.apiserver.k8s.io',
-    'io.k8s.api.networking': 'networking.k8s.io',
-    'io.k8s.api.policy': 'policy',
-    'io.k8s.api.resource': 'policy',
-    'io.k8s.api.storage': 'storage.k8s.io',
-    'io.k8s.api.storagemigration': 'storage.k8s.io',
-    'io.k8s.apiextensions-apiserver.pkg.apis.apiextensions': 'apiextensions.k8s.io',
-    'io.k8s.kube-aggregator.pkg.apis.apiregistration': 'apiregistration.k8s.io',
-}
-resource_prop_names = {'apiVersion', 'kind', 'metadata', 'spec', 'status'}
-
-
-class JSONSchemaProperties(TypedDict):
-    """A subset of attributes expected in kubernetes' JSON schema spec."""
-
-    type: str
-    items: JSONSchemaProperties
-    allOf: Optional[list[JSONSchemaProperties]]
+
+# content hashes of each version's inputs and the modules built from them, see `write_modules`
+codegen_manifest_dir = Path('codegen/manifests')
 
 
 class K8sModule:
     """An abstract representation of a kubernetes module in gybe."""
 
-    def __init__(self, version_module: str, module_name: str):
+    def __init__(
+        self,
+        version_module: str,
+        module_name: str,
+        serializers: bool = False,
+        slots: bool = False,
+        stubs: bool = False,
+    ):
         """Initialize a K8sModule.
 
         Attributes
         ----------
         version_module: Python version submodule under the k8s module (ex: 'v1_30')
         module_name: Python non-relative import path (ex: 'gybe.k8s.v1_30.apps.v1').
+        serializers: Emit static `to_dict()` and `from_dict()` methods on every model.
+        slots: Emit `@dataclass(slots=True)` models, which have no per-instance `__dict__`.
+        stubs: Write model docstrings to a `.pyi` stub next to a runtime module without them.
 
         """
         self._version_module = version_module
         self._module_name = module_name
+        self._serializers = serializers
+        self._slots = slots
+        self._stubs = stubs
         self._module_path = Path(self._module_name.replace('.', '/') + '.py')
         self._module_path.parent.mkdir(exist_ok=True)
         self._module_imports: set[str] = set()
         self._class_defs: list[ast.ClassDef] = []
         self._line_length = 110
 
-    def write_module(self):
-        """Write abstract module to python file."""
+    def write_module(self) -> list[Path]:
+        """Write abstract module to python file, and its stub when writing stubs."""
         with open(self._module_path, 'w') as f:
-            f.write(self._unparse())
-
-    def add_model(
-        self,
-        name: str,
-        properties: dict[str, JSONSchemaProperties],
-        description: str,
-        required: list[str],
-    ) -> None:
-        """Add a kubernetes JSON schema specification to the module as a dataclass ast."""
-        name_parts = name.split('.')
-        prop_names = set(properties.keys())
+            f.write(self._unparse(docstrings=not self._stubs))
+        if not self._stubs:
+            # a stub left from a run with stubs would shadow the module for type checkers
+            self._module_path.with_suffix('.pyi').unlink(missing_ok=True)
+            return [self._module_path]
+        with open(self._module_path.with_suffix('.pyi'), 'w') as f:
+            f.write(self._unparse(stub=True))
+        return [self._module_path, self._module_path.with_suffix('.pyi')]
+
+    def add_model(self, model: ModelSchema) -> None:
+        """Add a model from the schema index to the module as a dataclass ast."""
         literal_properties = dict()
-        if len(resource_prop_names - prop_names) == 0:
-            k = '.'.join(name_parts[:-2])
-            api_group = resource_api_versions.get(k)
-            if api_group:
-                api_version = api_group + '/' + name_parts[-2]
-            else:
-                api_version = name_parts[-2]
-            literal_properties['apiVersion'] = api_version
-            literal_properties['kind'] = name_parts[-1]
+        if model['gvk'] is not None:
+            group, version, kind = model['gvk']
+            literal_properties['apiVersion'] = f'{group}/{version}' if group else version
+            literal_properties['kind'] = kind
         model_def = self._model_def(
-            name=name_parts[-1],
-            properties=properties,
-            description=description or f'Schema model {name}.',
-            required=required or [],
+            name=model['schema'].split('.')[-1],
+            properties=model['fields'],
+            description=model['description'] or f'Schema model {model["schema"]}.',
+            required=model['required'],
             resource_properties=literal_properties,
         )
         self._class_defs.append(model_def)
 
-    def _unparse(self):
+    def _unparse(self, docstrings: bool = True, stub: bool = False):
         if self._module_name.endswith('api.resource'):
             return '"""Models generated from Kubernetes OpenAPI Spec."""\nQuantity = str | int | float'
 
         imports = [
             '"""Models generated from Kubernetes OpenAPI Spec."""',
             'from __future__ import annotations',
-            'from typing import List, Optional, Literal',
+            'from typing import Any, List, Mapping, Optional, Literal'
+            if self._serializers
+            else 'from typing import List, Optional, Literal',
             'from dataclasses import dataclass',
             'from gybe.k8s.types import JSONObj, JSONDict, K8sSpec, K8sResource',
         ] + sorted(list(self._module_imports))
         mod = ast.parse('\n'.join(imports))
         for c in self._class_defs:
+            if stub:
+                c = _stub_class_def(c)
+            elif not docstrings:
+                c = _strip_docstring(c)
             mod.body.append(c)
         return ast.unparse(mod)
 
     def _model_def(
         self,
         name: str,
-        properties: dict[str, JSONSchemaProperties],
+        properties: dict[str, FieldSchema],
         description: str,
         required: list[str],
         resource_properties: dict[str, str],
     ) -> ast.ClassDef:
         base_cls = 'K8sSpec' if len(resource_properties) == 0 else 'K8sResource'
-        cdef = ast.parse('@dataclass\nclass ' + name + f'({base_cls}):\n    pass').body[0]
+        decorator = '@dataclass(slots=True)' if self._slots else '@dataclass'
+        cdef = ast.parse(f'{decorator}\nclass {name}({base_cls}):\n    pass').body[0]
         if not isinstance(cdef, ast.ClassDef):
             raise ValueError(f'{cdef} is not expected ast.ClassDef')
         sections = [
@@ -169,22 +137,61 @@ class K8sModule:
                 literal_value = literal_props[k]
                 fields.append((f"{k}: Literal['{literal_value}'] = '{literal_value}'", 200))
             elif k in required:
-                field_type = self._type_hint_for(properties[k])
+                field_type = self._type_hint_for(v['type'])
                 field = f'{k}: {field_type}'
                 fields.append((field, required.index(k)))
             else:
-                field_type = self._type_hint_for(v)
+                field_type = self._type_hint_for(v['type'])
                 field = f'{k}: Optional[{field_type}] = None'
                 fields.append((field, 300))
 
         for field, _ in sorted(fields, key=lambda f: f[1]):
             cdef.body.append(ast.parse(field).body[0])
+
+        if self._serializers:
+            hints = {
+                k: self._type_hint_for(v['type']) for k, v in properties.items() if k not in literal_props
+            }
+            cdef.body.extend(self._serializer_defs(name, list(properties), hints, required))
         return cdef
 
-    def _prop_desc(self, properties: dict[str, JSONSchemaProperties]) -> str:
+    def _serializer_defs(
+        self,
+        name: str,
+        prop_names: list[str],
+        hints: dict[str, str],
+        required: list[str],
+    ) -> list[ast.stmt]:
+        """Straight-line `to_dict()`/`from_dict()` methods for a model's known fields."""
+        to_dict = ['def to_dict(self) -> dict[str, Any]:', '    d: dict[str, Any] = {}']
+        from_dict = [
+            '@classmethod',
+            f'def from_dict(cls, d: Mapping[str, Any]) -> {name}:',
+            '    kwargs: dict[str, Any] = {}',
+        ]
+        for k in prop_names:
+            # literal `apiVersion`/`kind` properties are plain values
+            hint = hints.get(k, 'str')
+            to_dict += [
+                f'    if self.{k} is not None:',
+                f"        d['{k}'] = {_to_dict_expr(hint, f'self.{k}')}",
+            ]
+            if k in required:
+                from_dict.append(f"    kwargs['{k}'] = {_from_dict_expr(hint, f'd[{k!r}]')}")
+            else:
+                from_dict += [
+                    f"    v = d.get('{k}')",
+                    '    if v is not None:',
+                    f"        kwargs['{k}'] = {_from_dict_expr(hint, 'v')}",
+                ]
+        to_dict.append('    return d')
+        from_dict.append('    return cls(**kwargs)')
+        return ast.parse('\n'.join(to_dict + from_dict)).body
+
+    def _prop_desc(self, properties: dict[str, FieldSchema]) -> str:
         descriptions = []
         for k, v in properties.items():
-            d = str(v.get('description', '...'))
+            d = '...' if v['description'] is None else str(v['description'])
             # Removes noisy "More info:" links
             n = 'More info:'
             if n in d:
@@ -196,84 +203,192 @@ class K8sModule:
         fd = '\n'.join(descriptions)
         return textwrap.indent(fd, '    ')
 
-    def _type_hint_for(self, v: JSONSchemaProperties) -> str:
-        json_type = v.get('type')
-        if json_type == 'array':
-            item_type = self._type_hint_for(v['items'])
-            return f'List[{item_type}]'
-        elif json_type is not None:
-            try:
-                return schema_type_map[json_type]
-            except KeyError as e:
-                raise NotImplementedError(json_type) from e
-
-        ref = v.get('$ref')
-        if ref is None:
-            allof = v.get('allOf')
-            if allof is not None:
-                ref = allof[0].get('$ref')
-        if ref is not None:
-            ref = str(ref)
-            import_ = _ref_to_module_name(ref, version_module=self._version_module)
-            for m in ignore_models:
-                if m in ref:
-                    return 'JSONObj'
-            if ref.endswith('IntOrString') or 'Time' in ref:
-                return 'str'
-            if import_ != self._module_name:
-                self._module_imports.add('import ' + import_)
-                return _ref_to_model_path(ref, version_module=self._version_module)
-            else:
-                return ref.split('.')[-1]
-
-        return schema_type_map['string']
-
-
-def _write_k8s_models(k8s_version_module: str) -> None:
-    model_schemas = dict()
-    for p in k8s_openapi_dir.iterdir():
-        with p.open() as f:
-            spec = json.load(f)
-        schemas = spec.get('components', dict()).get('schemas') or dict()
-        for name, schema in schemas.items():
-            if name.startswith('io.k8s'):
-                if not any(m in name for m in ignore_models):
-                    model_schemas[name] = schema
-
-    k8s_modules: dict[str, K8sModule] = dict()
-    for name in model_schemas.keys():
-        if name not in k8s_modules:
-            module_name = _ref_to_module_name(name, k8s_version_module)
-            k8s_modules[module_name] = K8sModule(k8s_version_module, module_name)
-
-    for name, schema in model_schemas.items():
-        properties = schema.get('properties')
-        description = schema.get('description')
-        required = schema.get('required')
-        if properties:
-            k8s_module = k8s_modules[_ref_to_module_name(name, k8s_version_module)]
-            k8s_module.add_model(name, properties, description, required)
-
-    for k8s_module in k8s_modules.values():
-        k8s_module.write_module()
-
-
-def _write_module_init(k8s_version_module: str) -> None:
+    def _type_hint_for(self, field_type: str) -> str:
+        if field_type.startswith('['):
+            return f'List[{self._type_hint_for(field_type[1:-1])}]'
+        if field_type in SCALAR_TYPES:
+            return field_type
+        module_name, _, name = field_type.rpartition('.')
+        import_ = f'gybe.k8s.{self._version_module}.{module_name}'
+        if import_ != self._module_name:
+            self._module_imports.add('import ' + import_)
+            return f'{import_}.{name}'
+        return name
+
+
+def _strip_docstring(cdef: ast.ClassDef) -> ast.ClassDef:
+    # attribute docs are compiled into bytecode and kept alive on `__doc__` at every import.
+    # A one line summary is kept, since `@dataclass` renders a signature for classes without
+    # a docstring, which is slower to import than the docstring itself
+    cdef = copy.deepcopy(cdef)
+    first = cdef.body[0]
+    if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant):
+        description = str(first.value.value).split('Attributes:')[0]
+        summary = ' '.join(description.split()).split('. ')[0].rstrip('.')
+        first.value.value = textwrap.shorten(f'{summary}.', width=90, placeholder='...')
+    return cdef
+
+
+def _stub_class_def(cdef: ast.ClassDef) -> ast.ClassDef:
+    cdef = copy.deepcopy(cdef)
+    for stmt in cdef.body:
+        if isinstance(stmt, ast.FunctionDef):
+            stmt.body = [ast.Expr(ast.Constant(...))]
+    return cdef
+
+
+def _is_model_hint(hint: str) -> bool:
+    return hint not in schema_type_map.values() and hint != 'JSONObj' and not hint.endswith('Quantity')
+
+
+def _to_dict_expr(hint: str, expr: str, depth: int = 0) -> str:
+    if hint.startswith('List['):
+        item_hint = hint[len('List[') : -1]
+        if not _is_model_hint(item_hint) and not item_hint.startswith('List['):
+            return f'list({expr})'
+        item = f'i{depth}'
+        return f'[{_to_dict_expr(item_hint, item, depth + 1)} for {item} in {expr}]'
+    if _is_model_hint(hint):
+        return f'{expr}.to_dict()'
+    return expr
+
+
+def _from_dict_expr(hint: str, expr: str, depth: int = 0) -> str:
+    if hint.startswith('List['):
+        item_hint = hint[len('List[') : -1]
+        if not _is_model_hint(item_hint) and not item_hint.startswith('List['):
+            return f'list({expr})'
+        item = f'i{depth}'
+        return f'[{_from_dict_expr(item_hint, item, depth + 1)} for {item} in {expr}]'
+    if _is_model_hint(hint):
+        return f'{hint}.from_dict({expr})'
+    return expr
+
+
+def _codegen_hash(serializers: bool, slots: bool, stubs: bool) -> str:
+    """Hash this module's source and the options, since either changes every generated module."""
+    source = Path(__file__).read_text()
+    return sha256(json.dumps([source, serializers, slots, stubs]))
+
+
+def _load_manifest(k8s_version_module: str) -> dict:
+    path = codegen_manifest_dir / f'{k8s_version_module}.json'
+    return json.loads(path.read_text()) if path.exists() else dict()
+
+
+def _write_manifest(k8s_version_module: str, manifest: dict) -> None:
+    if manifest == _load_manifest(k8s_version_module):
+        return
+    codegen_manifest_dir.mkdir(parents=True, exist_ok=True)
+    path = codegen_manifest_dir / f'{k8s_version_module}.json'
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+
+
+def _write_k8s_module(
+    k8s_version_module: str,
+    module_name: str,
+    models: dict[str, ModelSchema],
+    serializers: bool = False,
+    slots: bool = False,
+    stubs: bool = False,
+) -> list[Path]:
+    k8s_module = K8sModule(k8s_version_module, module_name, serializers=serializers, slots=slots, stubs=stubs)
+    for model in models.values():
+        if model['fields']:
+            k8s_module.add_model(model)
+    return k8s_module.write_module()
+
+
+def _write_module_init(k8s_version_module: str) -> Optional[Path]:
     module_path = Path('gybe/k8s/' + k8s_version_module)
     module_path.mkdir(exist_ok=True)
-    with open(module_path / '__init__.py', 'w') as f:
+    init_path = module_path / '__init__.py'
+    if init_path.exists():
+        return None
+    with open(init_path, 'w') as f:
         f.write('"""k8s dataclass models generated by gybe"""')
+    return init_path
 
 
-def _ref_to_model_path(ref: str, version_module: str) -> str:
-    return f'gybe.k8s.{version_module}.' + '.'.join(ref.split('/')[-1].split('.')[-3:])
-
-
-def _ref_to_module_name(ref: str, version_module: str) -> str:
-    return '.'.join(_ref_to_model_path(ref, version_module).split('.')[:-1])
-
-
-def write_module(k8s_version_module):
+def write_module(k8s_version_module, serializers=False, slots=False, stubs=False):
     """Write generated k8s module based on kubernetes JSON schema."""
-    _write_module_init(k8s_version_module)
-    _write_k8s_models(k8s_version_module)
+    return write_modules({k8s_version_module: None}, serializers=serializers, slots=slots, stubs=stubs)
+
+
+def write_modules(
+    k8s_version_modules: dict[str, Optional[str]],
+    jobs: int = 1,
+    serializers: bool = False,
+    slots: bool = False,
+    stubs: bool = False,
+    force: bool = False,
+) -> list[Path]:
+    """Write generated k8s modules for several versions, across `jobs` worker processes.
+
+    Maps each version module to the git ref of the kubernetes checkout to read its JSON schema
+    from, or `None` for the checked out files. Returns every file written, including each
+    version's kind registry when it changed, see `gybe.k8s.registry`.
+
+    Modules are written from each version's schema index, see `gybe.codegen.schema_index`.
+    Only modules whose input schemas changed since the last run are rebuilt, unless `force` is
+    set. A manifest in `codegen/manifests/<version>.json` keeps a content hash of every JSON
+    schema file and of the normalized schemas behind every module. Any change to this module or to the
+    options rebuilds everything. Files of the previous run that this one did not write again, like
+    stubs after a run without `stubs` or modules whose schemas were removed, are deleted. Other
+    files, and their mtimes, are left alone.
+    """
+    codegen = _codegen_hash(serializers, slots, stubs)
+    written = []
+    tasks: list[tuple] = []
+    manifests: dict[str, dict] = dict()
+    previous_files: dict[str, set[str]] = dict()
+    for k8s_version_module, ref in k8s_version_modules.items():
+        init_path = _write_module_init(k8s_version_module)
+        written.extend([init_path] if init_path is not None else [])
+        previous = _load_manifest(k8s_version_module)
+        index = schema_index(k8s_version_module, ref)
+        registry_path = write_kind_registry(k8s_version_module, kind_registry_from_schemas(index))
+        written.extend([registry_path] if registry_path is not None else [])
+        manifest: dict[str, Any] = {'codegen': codegen, 'specs': index['specs'], 'modules': dict()}
+        reusable = previous.get('codegen') == codegen and not force
+        previous_modules = previous.get('modules', dict()) if reusable else dict()
+        if previous.get('specs') == manifest['specs'] and _outputs_exist(previous_modules):
+            # no schema file changed, so neither did any module's schemas
+            manifests[k8s_version_module] = previous
+            continue
+        previous_files[k8s_version_module] = {
+            f for m in previous.get('modules', dict()).values() for f in m['files']
+        }
+
+        modules: dict[str, dict[str, ModelSchema]] = dict()
+        for key, model in index['models'].items():
+            module_name = f'gybe.k8s.{k8s_version_module}.{key.rpartition(".")[0]}'
+            modules.setdefault(module_name, dict())[key] = model
+        for module_name, models in modules.items():
+            entry = {'input': sha256(json.dumps(models, sort_keys=True)), 'files': []}
+            manifest['modules'][module_name] = entry
+            old = previous_modules.get(module_name)
+            if old is not None and old['input'] == entry['input'] and _outputs_exist({module_name: old}):
+                entry['files'] = old['files']
+            else:
+                tasks.append((k8s_version_module, module_name, models, serializers, slots, stubs))
+        manifests[k8s_version_module] = manifest
+
+    if jobs <= 1 or len(tasks) <= 1:
+        results = [_write_k8s_module(*task) for task in tasks]
+    else:
+        with multiprocessing.Pool(min(jobs, len(tasks))) as pool:
+            results = pool.starmap(_write_k8s_module, tasks)
+    for (k8s_version_module, module_name, *_), paths in zip(tasks, results):
+        manifests[k8s_version_module]['modules'][module_name]['files'] = [str(p) for p in paths]
+        written.extend(paths)
+    for k8s_version_module, manifest in manifests.items():
+        files = {f for m in manifest['modules'].values() for f in m['files']}
+        for file in previous_files.get(k8s_version_module, set()) - files:
+            Path(file).unlink(missing_ok=True)
+        _write_manifest(k8s_version_module, manifest)
+    return written
+
+
+def _outputs_exist(modules: dict[str, dict]) -> bool:
+    return bool(modules) and all(Path(f).exists() for m in modules.values() for f in m['files'])
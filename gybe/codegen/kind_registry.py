@@ -0,0 +1,132 @@
+"""Write the kind registry of a generated k8s version package.
+
+The registry maps every kind served by a version to the module and class of its model, its REST
+plural and whether it is namespaced, so `gybe.k8s.registry` can dispatch on `apiVersion`/`kind`
+without importing the version's modules. Codegen writes it from the version's schema index, see
+`gybe.codegen.schema_index`.
+
+For packages generated before the schema index existed, this cli rebuilds it from the package's
+field index instead: plurals are then guessed like kubectl does for unknown kinds, and the scope
+comes from the built-in kinds known to be cluster scoped.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from gybe.codegen.schema_index import SchemaIndex, load_schema_index
+from gybe.k8s.field_index import INDEX_FILE
+from gybe.k8s.registry import REGISTRY_FILE
+
+# kinds in the field index that are not served as resources of their own
+NON_RESOURCE_KINDS = {'Eviction', 'Scale', 'Status', 'TokenRequest'}
+CLUSTER_SCOPED_KINDS = {
+    'APIService',
+    'CSIDriver',
+    'CSINode',
+    'CertificateSigningRequest',
+    'ClusterRole',
+    'ClusterRoleBinding',
+    'ClusterTrustBundle',
+    'ComponentStatus',
+    'CustomResourceDefinition',
+    'DeviceClass',
+    'FlowSchema',
+    'IPAddress',
+    'IngressClass',
+    'MutatingAdmissionPolicy',
+    'MutatingAdmissionPolicyBinding',
+    'MutatingWebhookConfiguration',
+    'Namespace',
+    'Node',
+    'PersistentVolume',
+    'PriorityClass',
+    'PriorityLevelConfiguration',
+    'ResourceClass',
+    'ResourceSlice',
+    'RuntimeClass',
+    'SelfSubjectAccessReview',
+    'SelfSubjectReview',
+    'SelfSubjectRulesReview',
+    'ServiceCIDR',
+    'StorageClass',
+    'StorageVersion',
+    'StorageVersionMigration',
+    'SubjectAccessReview',
+    'TokenReview',
+    'ValidatingAdmissionPolicy',
+    'ValidatingAdmissionPolicyBinding',
+    'ValidatingWebhookConfiguration',
+    'VolumeAttachment',
+    'VolumeAttributesClass',
+}
+
+
+def kind_registry_from_schemas(index: SchemaIndex) -> dict[str, list[Any]]:
+    """Build a version's registry from the resources of its schema index."""
+    registry = {}
+    for key, resource in index['resources'].items():
+        model = index['models'].get(resource['model'])
+        if model is not None and model['fields']:
+            module, _, name = resource['model'].rpartition('.')
+            registry[key] = [module, name, resource['plural'], resource['namespaced']]
+    return registry
+
+
+def guess_kind_registry(field_index: dict[str, Any]) -> dict[str, list[Any]]:
+    """Build a version's registry from the models of its field index, without the specs."""
+    registry = {}
+    for api_version_kind, model_key in field_index['kinds'].items():
+        module, _, kind = model_key.rpartition('.')
+        if not (kind.endswith('List') or kind in NON_RESOURCE_KINDS):
+            registry[api_version_kind] = [module, kind, guess_plural(kind), kind not in CLUSTER_SCOPED_KINDS]
+    return dict(sorted(registry.items()))
+
+
+def guess_plural(kind: str) -> str:
+    """Pluralize a kind into its REST resource name, like `NetworkPolicy` to `networkpolicies`."""
+    name = kind.lower()
+    if name == 'endpoints':
+        return name
+    if name.endswith('s'):
+        return name + 'es'
+    if name.endswith('y'):
+        return name[:-1] + 'ies'
+    return name + 's'
+
+
+def write_kind_registry(
+    version: str, registry: dict[str, list[Any]], k8s_dir: Path = Path('gybe/k8s')
+) -> Optional[Path]:
+    """Write a version package's registry next to its modules, unless it is unchanged."""
+    path = k8s_dir / version / REGISTRY_FILE
+    text = json.dumps(registry, separators=(',', ':')) + '\n'
+    if path.exists() and path.read_text() == text:
+        return None
+    path.write_text(text)
+    return path
+
+
+def main():
+    """Run the gybe.k8s kind registry cli"""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        'k8s_version_modules', nargs='+', help='version modules to register (ex: v1_29 v1_30)'
+    )
+    args = parser.parse_args()
+    k8s_dir = Path('gybe/k8s')
+    for version in args.k8s_version_modules:
+        schemas = load_schema_index(version)
+        if schemas is not None and 'resources' in schemas:
+            registry = kind_registry_from_schemas(schemas)
+        else:
+            registry = guess_kind_registry(json.loads((k8s_dir / version / INDEX_FILE).read_text()))
+        path = write_kind_registry(version, registry, k8s_dir)
+        print(f'wrote {path}' if path is not None else f'{version} registry unchanged')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""Normalize the OpenAPI schemas of a kubernetes version into one index.
+
+The index is the first codegen stage: every `$ref`, `allOf` and JSON type is resolved once, and
+module writing, stubs and reports read the result instead of re-walking the raw specs. It is
+cached per version in `codegen/schema_index/<version>.json.gz` and rebuilt when a schema file
+or this module changes:
+
+    {
+      "codegen": "<hash of this module>",
+      "specs": {"api__v1_openapi.json": "<content hash>", ...},
+      "models": {
+        "core.v1.Pod": {
+          "schema": "io.k8s.api.core.v1.Pod",
+          "description": "Pod is a collection of containers...",
+          "required": [],
+          "gvk": ["", "v1", "Pod"],
+          "fields": {"spec": {"type": "core.v1.PodSpec", "description": "..."}, ...}
+        },
+        ...
+      },
+      "resources": {
+        "v1/Pod": {"model": "core.v1.Pod", "plural": "pods", "namespaced": true},
+        ...
+      }
+    }
+
+Models are keyed by their module, relative to the version package, and class name. Field types
+are `str`, `bool`, `int`, `float`, `JSONDict`, `JSONObj`, a model key, or `[type]` for lists.
+`gvk` is the group, version and kind of resources, and `null` for every other model. Models
+and fields keep the order of the specs.
+
+`resources` are the kinds served by the API, keyed by `apiVersion/kind` as read from the specs'
+`x-kubernetes-group-version-kind` extensions, with the plural and scope of their REST paths.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+from typing import Optional, TypeAlias, TypedDict, Union
+
+k8s_repo_dir = Path('kubernetes')
+k8s_openapi_dir = k8s_repo_dir / 'api/openapi-spec/v3'
+# normalized schemas of each version, see `schema_index`
+schema_index_dir = Path('codegen/schema_index')
+# a json-serializable dict
+JSONObj: TypeAlias = Union[dict[str, 'JSONObj'], list['JSONObj'], str, int, float, bool, None]
+JSONDict: TypeAlias = dict[str, Union['JSONObj', 'JSONDict']]
+schema_type_map = dict(
+    string='str',
+    boolean='bool',
+    integer='int',
+    number='float',
+    object='JSONDict',
+)
+# ignored models fallback to `JSONObj`
+ignore_models = {
+    # includes hyphenated fields
+    'JSONSchemaProps',
+    # 'except` reserved: `IPBlock.except`
+    'IPBlock',
+    # `from` reserved: `NetworkPolicyIngressRule.from`
+    'NetworkPolicyIngressRule',
+    # `continue` reserved: `ListMeta.continue`
+    'ListMeta',
+    # `RawExtension` is strange
+    'RawExtension',
+    # Undefined models
+    'CustomResourceSubresourceStatus',
+    'StorageVersionSpec',
+    'FieldsV1',
+}
+# NOTE: The expected `apiVersion` values for k8s resources are documented here:
+# https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.30/
+# in the tables with `Group`, `Version` and `Kind`. Schemas of served kinds name theirs in
+# `x-kubernetes-group-version-kind`; for any other schema it is mapped from its package below.
+resource_api_versions = {
+    'io.k8s.api.admissionregistration': 'admissionregistration.k8s.io',
+    'io.k8s.api.apiserverinternal': 'internal.apiserver.k8s.io',
+    'io.k8s.api.apps': 'apps',
+    'io.k8s.api.authentication': 'authentication.k8s.io',
+    'io.k8s.api.authorization': 'authorization.k8s.io',
+    'io.k8s.api.autoscaling': 'autoscaling',
+    'io.k8s.api.batch': 'batch',
+    'io.k8s.api.certificates': 'certificates.k8s.io',
+    'io.k8s.api.coordination': 'coordination.k8s.io',
+    'io.k8s.api.core': '',  # `apiVersion: v1`, `apiVersion: v2`, ect.
+    'io.k8s.api.discovery': 'discovery.k8s.io',
+    'io.k8s.api.events': 'events.k8s.io',
+    'io.k8s.api.flowcontrol': 'flowcontrol.apiserver.k8s.io',
+    'io.k8s.api.networking': 'networking.k8s.io',
+    'io.k8s.api.node': 'node.k8s.io',
+    'io.k8s.api.policy': 'policy',
+    'io.k8s.api.rbac': 'rbac.authorization.k8s.io',
+    'io.k8s.api.resource': 'resource.k8s.io',
+    'io.k8s.api.scheduling': 'scheduling.k8s.io',
+    'io.k8s.api.storage': 'storage.k8s.io',
+    'io.k8s.api.storagemigration': 'storagemigration.k8s.io',
+    'io.k8s.apiextensions-apiserver.pkg.apis.apiextensions': 'apiextensions.k8s.io',
+    'io.k8s.kube-aggregator.pkg.apis.apiregistration': 'apiregistration.k8s.io',
+}
+resource_prop_names = {'apiVersion', 'kind', 'metadata', 'spec', 'status'}
+
+
+class JSONSchemaProperties(TypedDict):
+    """A subset of attributes expected in kubernetes' JSON schema spec."""
+
+    type: str
+    items: JSONSchemaProperties
+    allOf: Optional[list[JSONSchemaProperties]]
+
+
+SCALAR_TYPES = {*schema_type_map.values(), 'JSONObj'}
+
+
+class FieldSchema(TypedDict):
+    """A model field: its normalized type and description."""
+
+    type: str
+    description: Optional[str]
+
+
+class ModelSchema(TypedDict):
+    """A model: the schema it comes from, its fields and, for resources, its group/version/kind."""
+
+    schema: str
+    description: Optional[str]
+    required: list[str]
+    gvk: Optional[list[str]]
+    fields: dict[str, FieldSchema]
+
+
+class ResourceSchema(TypedDict):
+    """A kind served by the API: its model, REST plural and whether it lives in a namespace."""
+
+    model: str
+    plural: str
+    namespaced: bool
+
+
+class SchemaIndex(TypedDict):
+    """Every model of a kubernetes version, with the hashes of the inputs it was built from."""
+
+    codegen: str
+    specs: dict[str, str]
+    models: dict[str, ModelSchema]
+    resources: dict[str, ResourceSchema]
+
+
+def read_specs(ref: Optional[str] = None) -> dict[str, str]:
+    """Read the JSON schema files of the kubernetes checkout, or of a git ref of it, by name."""
+    if ref is None:
+        return {p.name: p.read_text() for p in sorted(k8s_openapi_dir.iterdir())}
+    # read straight from git, so several versions are generated without checking each out
+    path = k8s_openapi_dir.relative_to(k8s_repo_dir)
+    names = _git('ls-tree', '--name-only', ref, f'{path}/').split()
+    return {Path(name).name: _git('show', f'{ref}:{name}') for name in names}
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(  # noqa: S603
+        ['git', '-C', str(k8s_repo_dir), *args],  # noqa: S607
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def sha256(text: str) -> str:
+    """Hash text, for the codegen manifests and caches."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def model_key(ref: str) -> str:
+    """Key a schema name or `$ref` by module and class name, like `core.v1.Pod`."""
+    return '.'.join(ref.split('/')[-1].split('.')[-3:])
+
+
+def build_schema_index(specs: dict[str, str]) -> dict[str, ModelSchema]:
+    """Resolve every kubernetes model schema of a version's JSON schema files."""
+    models: dict[str, ModelSchema] = dict()
+    for text in specs.values():
+        schemas = json.loads(text).get('components', dict()).get('schemas') or dict()
+        for name, schema in schemas.items():
+            if name.startswith('io.k8s') and not any(m in name for m in ignore_models):
+                models[model_key(name)] = _model_schema(name, schema)
+    return models
+
+
+def build_resource_index(specs: dict[str, str]) -> dict[str, ResourceSchema]:
+    """Find the kinds served by a version's API paths, with their plural and scope."""
+    resources: dict[str, ResourceSchema] = dict()
+    for text in specs.values():
+        spec = json.loads(text)
+        schemas = spec.get('components', dict()).get('schemas') or dict()
+        models = {
+            (gvk['group'], gvk['version'], gvk['kind']): model_key(name)
+            for name, schema in schemas.items()
+            for gvk in schema.get('x-kubernetes-group-version-kind') or []
+        }
+        for path, item in (spec.get('paths') or dict()).items():
+            segments = path.strip('/').split('/')
+            # collection paths only, not single objects, their subresources or the legacy watches
+            if segments[-1].startswith('{') or '{name}' in segments or 'watch' in segments:
+                continue
+            for operation in item.values():
+                gvk = (
+                    operation.get('x-kubernetes-group-version-kind') if isinstance(operation, dict) else None
+                )
+                model = models.get((gvk['group'], gvk['version'], gvk['kind'])) if gvk else None
+                if gvk is None or model is None:
+                    continue
+                api_version = f'{gvk["group"]}/{gvk["version"]}' if gvk['group'] else gvk['version']
+                resource = resources.setdefault(
+                    f'{api_version}/{gvk["kind"]}',
+                    ResourceSchema(model=model, plural=segments[-1], namespaced=False),
+                )
+                # namespaced kinds are also listed across all namespaces
+                resource['namespaced'] = resource['namespaced'] or '{namespace}' in segments
+    return dict(sorted(resources.items()))
+
+
+def _model_schema(name: str, schema: dict) -> ModelSchema:
+    properties = schema.get('properties') or dict()
+    gvk = None
+    if len(resource_prop_names - properties.keys()) == 0:
+        name_parts = name.split('.')
+        served = schema.get('x-kubernetes-group-version-kind') or []
+        if len(served) == 1:
+            gvk = [served[0]['group'], served[0]['version'], served[0]['kind']]
+        else:
+            group = resource_api_versions.get('.'.join(name_parts[:-2])) or ''
+            gvk = [group, name_parts[-2], name_parts[-1]]
+    return ModelSchema(
+        schema=name,
+        description=schema.get('description'),
+        required=schema.get('required') or [],
+        gvk=gvk,
+        fields={
+            k: FieldSchema(type=_field_type(v), description=v.get('description'))
+            for k, v in properties.items()
+        },
+    )
+
+
+def _field_type(v: JSONSchemaProperties) -> str:
+    json_type = v.get('type')
+    if json_type == 'array':
+        return f'[{_field_type(v["items"])}]'
+    elif json_type is not None:
+        try:
+            return schema_type_map[json_type]
+        except KeyError as e:
+            raise NotImplementedError(json_type) from e
+
+    ref = v.get('$ref')
+    if ref is None:
+        allof = v.get('allOf')
+        if allof is not None:
+            ref = allof[0].get('$ref')
+    if ref is not None:
+        ref = str(ref)
+        for m in ignore_models:
+            if m in ref:
+                return 'JSONObj'
+        if ref.endswith('IntOrString') or 'Time' in ref:
+            return 'str'
+        return model_key(ref)
+
+    return schema_type_map['string']
+
+
+def _index_path(k8s_version_module: str) -> Path:
+    return schema_index_dir / f'{k8s_version_module}.json.gz'
+
+
+def _codegen_hash() -> str:
+    return sha256(Path(__file__).read_text())
+
+
+def load_schema_index(k8s_version_module: str) -> Optional[SchemaIndex]:
+    """Read a version's cached schema index, if codegen has built one."""
+    path = _index_path(k8s_version_module)
+    if not path.exists():
+        return None
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+def schema_index(k8s_version_module: str, ref: Optional[str] = None) -> SchemaIndex:
+    """Return a version's schema index, only rebuilding the cached one when its inputs changed.
+
+    The JSON schema files are always read to hash them, but only parsed when rebuilding.
+    """
+    specs = read_specs(ref)
+    hashes = {name: sha256(text) for name, text in specs.items()}
+    cached = load_schema_index(k8s_version_module)
+    if cached is not None and cached['codegen'] == _codegen_hash() and cached['specs'] == hashes:
+        return cached
+
+    index = SchemaIndex(
+        codegen=_codegen_hash(),
+        specs=hashes,
+        models=build_schema_index(specs),
+        resources=build_resource_index(specs),
+    )
+    schema_index_dir.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(index, separators=(',', ':')).encode()
+    # mtime=0 keeps the file identical for identical indexes
+    _index_path(k8s_version_module).write_bytes(gzip.compress(data, mtime=0))
+    return index
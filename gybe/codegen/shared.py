@@ -0,0 +1,274 @@
+"""Share structurally identical models between generated k8s version packages.
+
+Models with the same fields, types, defaults and methods in every version, ignoring their
+docstrings, are written once to `gybe.k8s.shared` and re-exported by each version module with
+`from gybe.k8s.shared.<module> import Model as Model`. A model is only shared when every model
+it refers to is shared too, so shared modules never import a version package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import copy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from gybe.codegen.cli import format_files
+
+SHARED_MODULE = 'shared'
+MODULE_DOCSTRING = '"""Models generated from Kubernetes OpenAPI Spec."""'
+SHARED_DOCSTRING = '"""k8s dataclass models shared by several kubernetes versions"""'
+
+
+@dataclass
+class _Module:
+    """Top level definitions of one generated module, in source order."""
+
+    header: list[ast.stmt] = field(default_factory=list)
+    definitions: dict[str, ast.stmt] = field(default_factory=dict)
+
+
+def share_models(
+    versions: list[str], k8s_dir: Path = Path('gybe/k8s'), written: Optional[list[Path]] = None
+) -> dict[str, list[str]]:
+    """Move models identical in every version into `gybe.k8s.shared` and return them by module.
+
+    Runs on already generated version packages and can be re-run after a version is added or
+    regenerated: models shared by a previous run are inlined again before comparing. The modules
+    actually rewritten are appended to `written`, when given.
+    """
+    if written is None:
+        written = []
+    if len(versions) < 2:
+        raise ValueError('models can only be shared between two or more versions')
+    shared_dir = k8s_dir / SHARED_MODULE
+    modules = {v: _load_version(k8s_dir, v) for v in versions}
+    shared = _shared_definitions(modules, versions)
+
+    # everything is parsed before the previous shared package is replaced, since version
+    # modules may still re-export from it
+    stubs = {
+        (v, module_name): _load_module(k8s_dir, v, module_name, '.pyi')
+        for v in versions
+        for module_name in modules[v]
+        if _module_path(k8s_dir, v, module_name, '.pyi').exists()
+    }
+    stale = set(shared_dir.rglob('*.py*')) if shared_dir.exists() else set()
+    shared_dir.mkdir(exist_ok=True)
+    stale.discard(_write_if_changed(shared_dir / '__init__.py', SHARED_DOCSTRING + '\n', written))
+
+    latest = versions[-1]
+    for suffix, loaded in (
+        ('.py', {(v, m): modules[v][m] for v in versions for m in modules[v]}),
+        ('.pyi', stubs),
+    ):
+        for module_name, names in shared.items():
+            if (latest, module_name) in loaded:
+                definitions = loaded[latest, module_name].definitions
+                path = _module_path(k8s_dir, SHARED_MODULE, module_name, suffix)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                source = _shared_source(latest, [definitions[n] for n in names])
+                stale.discard(_write_if_changed(path, source, written))
+        for (v, module_name), module in loaded.items():
+            source = _version_source(module, module_name, shared.get(module_name, []))
+            _write_if_changed(_module_path(k8s_dir, v, module_name, suffix), source, written)
+    for path in stale:
+        path.unlink()
+    return shared
+
+
+def _write_if_changed(path: Path, text: str, written: list[Path]) -> Path:
+    """Write a module unless it already defines the same models, keeping its mtime and bytecode.
+
+    Written modules are fixed and formatted by ruff afterwards, so they are compared by their
+    definitions and shared re-exports rather than their text.
+    """
+    if not path.exists() or _source_key(path.read_text()) != _source_key(text):
+        path.write_text(text)
+        written.append(path)
+    return path
+
+
+def _source_key(source: str) -> list[str]:
+    shared_prefix = f'gybe.k8s.{SHARED_MODULE}.'
+    key: list[str] = []
+    for stmt in ast.parse(source).body:
+        if isinstance(stmt, ast.ImportFrom) and (stmt.module or '').startswith(shared_prefix):
+            key.extend(f'{stmt.module}.{alias.name}' for alias in stmt.names)
+        elif isinstance(stmt, ast.Import):
+            key.extend(f'import {alias.name}' for alias in stmt.names)
+        elif not isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            stmt = copy.deepcopy(stmt)
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    # ruff re-indents docstrings and strips their trailing whitespace
+                    node.value = ' '.join(node.value.split())
+            key.append(ast.dump(stmt))
+    return sorted(key)
+
+
+def _module_path(k8s_dir: Path, version: str, module_name: str, suffix: str = '.py') -> Path:
+    return k8s_dir / version / (module_name.replace('.', '/') + suffix)
+
+
+def _load_version(k8s_dir: Path, version: str) -> dict[str, _Module]:
+    modules = {}
+    for path in sorted((k8s_dir / version).rglob('*.py')):
+        if path.name != '__init__.py':
+            module_name = '.'.join(path.relative_to(k8s_dir / version).with_suffix('').parts)
+            modules[module_name] = _load_module(k8s_dir, version, module_name)
+    return modules
+
+
+def _load_module(k8s_dir: Path, version: str, module_name: str, suffix: str = '.py') -> _Module:
+    """Parse a version module, inlining models it re-exports from the shared package."""
+    module = _Module()
+    shared_prefix = f'gybe.k8s.{SHARED_MODULE}.'
+    for stmt in ast.parse(_module_path(k8s_dir, version, module_name, suffix).read_text()).body:
+        if isinstance(stmt, ast.ImportFrom) and (stmt.module or '').startswith(shared_prefix):
+            shared_name = (stmt.module or '')[len(shared_prefix) :]
+            shared = _load_module(k8s_dir, SHARED_MODULE, shared_name, suffix).definitions
+            for alias in stmt.names:
+                module.definitions[alias.name] = _retarget(shared[alias.name], SHARED_MODULE, version)
+        elif _definition_name(stmt) is not None:
+            module.definitions[str(_definition_name(stmt))] = stmt
+        else:
+            module.header.append(stmt)
+    return module
+
+
+def _definition_name(stmt: ast.stmt) -> str | None:
+    if isinstance(stmt, ast.ClassDef):
+        return stmt.name
+    if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+        return stmt.targets[0].id
+    return None
+
+
+def _retarget(node: ast.stmt, from_version: str, to_version: str) -> ast.stmt:
+    source = ast.unparse(node).replace(f'gybe.k8s.{from_version}.', f'gybe.k8s.{to_version}.')
+    return ast.parse(source).body[0]
+
+
+def _structure(node: ast.stmt, version: str) -> str:
+    node = copy.deepcopy(node)
+    if isinstance(node, ast.ClassDef):
+        first = node.body[0]
+        if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant):
+            node.body = node.body[1:]
+    return ast.unparse(_retarget(node, version, SHARED_MODULE))
+
+
+def _references(node: ast.stmt, module_name: str, version: str) -> set[tuple[str, str]]:
+    prefix = f'gybe.k8s.{version}.'
+    refs = set()
+    # `ast.walk` visits outer attributes first, so `gybe.k8s.v1_31.meta.v1` is skipped after
+    # `gybe.k8s.v1_31.meta.v1.ObjectMeta`
+    inner: set[ast.AST] = set()
+    for n in ast.walk(node):
+        if isinstance(n, ast.Name):
+            refs.add((module_name, n.id))
+        elif isinstance(n, ast.Attribute):
+            inner.add(n.value)
+            if n in inner:
+                continue
+            dotted = ast.unparse(n)
+            if dotted.startswith(prefix):
+                target_module, _, name = dotted[len(prefix) :].rpartition('.')
+                refs.add((target_module, name))
+    return refs
+
+
+def _shared_definitions(modules: dict[str, dict[str, _Module]], versions: list[str]) -> dict[str, list[str]]:
+    latest = versions[-1]
+    candidates: set[tuple[str, str]] = set()
+    for module_name, module in modules[latest].items():
+        for name, node in module.definitions.items():
+            structure = _structure(node, latest)
+            if all(
+                name in modules[v].get(module_name, _Module()).definitions
+                and _structure(modules[v][module_name].definitions[name], v) == structure
+                for v in versions[:-1]
+            ):
+                candidates.add((module_name, name))
+
+    # a shared model can only refer to shared models, so drop candidates until that holds
+    definitions = {(m, n) for m, module in modules[latest].items() for n in module.definitions}
+    references = {
+        (m, n): _references(modules[latest][m].definitions[n], m, latest) & definitions for m, n in candidates
+    }
+    changed = True
+    while changed:
+        changed = False
+        for candidate in list(candidates):
+            if not references[candidate] <= candidates:
+                candidates.remove(candidate)
+                changed = True
+
+    shared: dict[str, list[str]] = {}
+    for module_name, module in modules[latest].items():
+        names = [n for n in module.definitions if (module_name, n) in candidates]
+        if names:
+            shared[module_name] = names
+    return shared
+
+
+def _imports(definitions: list[ast.stmt], version: str) -> list[str]:
+    modules = {
+        ref_module for node in definitions for ref_module, _ in _references(node, '', version) if ref_module
+    }
+    return [f'import gybe.k8s.{version}.{m}' for m in sorted(modules)]
+
+
+def _header(definitions: list[ast.stmt], version: str) -> list[str]:
+    if not any(isinstance(d, ast.ClassDef) for d in definitions):
+        return [MODULE_DOCSTRING]
+    return [
+        MODULE_DOCSTRING,
+        'from __future__ import annotations',
+        'from typing import Any, List, Literal, Mapping, Optional',
+        'from dataclasses import dataclass',
+        'from gybe.k8s.types import JSONObj, JSONDict, K8sSpec, K8sResource',
+        *_imports(definitions, version),
+    ]
+
+
+def _shared_source(version: str, definitions: list[ast.stmt]) -> str:
+    shared = [_retarget(d, version, SHARED_MODULE) for d in definitions]
+    mod = ast.parse('\n'.join(_header(shared, SHARED_MODULE)))
+    mod.body.extend(shared)
+    return ast.unparse(mod) + '\n'
+
+
+def _version_source(module: _Module, module_name: str, shared: list[str]) -> str:
+    mod = ast.Module(body=list(module.header), type_ignores=[])
+    if shared:
+        names = ', '.join(f'{n} as {n}' for n in shared)
+        mod.body.extend(ast.parse(f'from gybe.k8s.{SHARED_MODULE}.{module_name} import {names}').body)
+    mod.body.extend(d for n, d in module.definitions.items() if n not in shared)
+    return ast.unparse(mod) + '\n'
+
+
+def main():
+    """Run the gybe.k8s model sharing cli"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'k8s_version_modules', nargs='+', help='version modules, oldest first (ex: v1_29 v1_30)'
+    )
+    parser.add_argument(
+        '--format',
+        action='store_true',
+        help='run ruff check --fix and ruff format over the modules rewritten by this run',
+    )
+    args = parser.parse_args()
+    written: list[Path] = []
+    shared = share_models(args.k8s_version_modules, written=written)
+    if args.format:
+        format_files(written)
+    print(f'shared {sum(len(names) for names in shared.values())} models in {len(shared)} modules')
+
+
+if __name__ == '__main__':
+    main()
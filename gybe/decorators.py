@@ -1,68 +1,323 @@
 """Decorators for building CLI commands."""
 
+import dataclasses
 import inspect
+import json
 import sys
-from dataclasses import fields
-from typing import Any, Callable
+import time
+from pathlib import Path
+from typing import Any, Callable, NoReturn, Optional, Union
 
 import click
-from cattrs import Converter, transform_error
 
-from gybe.exceptions import InvalidOutputError
-from gybe.k8s.types import K8sResource, K8sSpec, Manifest
-from gybe.modeling import create_input_model
+from gybe import k8s
+from gybe.cache import DEFAULT_CACHE_MAX_BYTES, RenderCache
+from gybe.exceptions import InvalidInputError
+from gybe.k8s.types import Manifest, ManifestIterator
+from gybe.rendering import Transpiler
+from gybe.rendering import render as gybe_render
 from gybe.yaml import yaml_dumps, yaml_loads
 
 
-def _omit_none_values(obj: K8sSpec) -> dict[str, Any]:
-    u = {}
-    for f in fields(obj):
-        v = getattr(obj, f.name)
-        if v is not None:
-            if inspect.isclass(f.type) and issubclass(f.type, K8sSpec):
-                u[f.name] = _c.unstructure(v, f.type)
-            else:
-                u[f.name] = _c.unstructure(v)
-    return u
+class TranspilerGroup(click.Group):
+    """Transpiler command group that runs `render` when no subcommand is given.
+
+    Keeps `python chart.py values.yaml` working next to `python chart.py render-many ...`.
+    """
+
+    default_command = 'render'
+
+    def __init__(self, transpiler: Transpiler, **kwargs: Any):
+        """Initialize a group with the commands for `transpiler`."""
+        super().__init__(**kwargs)
+        self.transpiler = transpiler
+        self.add_command(_render_command(transpiler))
+        self.add_command(_render_many_command(transpiler))
+        self.add_command(_matrix_command(transpiler))
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Route arguments to the default command unless they start with a subcommand."""
+        if not args or (args[0] not in self.commands and args[0] != '--help'):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+def _cache_options(func):
+    func = click.option(
+        '--no-cache',
+        is_flag=True,
+        help='Always render, even when a cache directory is configured.',
+    )(func)
+    func = click.option(
+        '--cache-max-bytes',
+        type=click.IntRange(min=0),
+        default=DEFAULT_CACHE_MAX_BYTES,
+        show_default=True,
+        envvar='GYBE_CACHE_MAX_BYTES',
+        help='Evict least recently used manifests once the cache grows past this size.',
+    )(func)
+    return click.option(
+        '--cache-dir',
+        type=click.Path(file_okay=False, path_type=Path),
+        envvar='GYBE_CACHE_DIR',
+        help='Serve manifests for unchanged charts and values from this cache directory.',
+    )(func)
+
+
+def _use_k8s_version(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> Optional[str]:
+    try:
+        if value is not None:
+            k8s.use_version(value)
+        else:
+            k8s.current_version()  # reports a bad $GYBE_K8S_VERSION before rendering
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), ctx=ctx, param=param) from exc
+    return value
+
 
+def _k8s_version_option(func):
+    return click.option(
+        '--k8s-version',
+        callback=_use_k8s_version,
+        expose_value=False,
+        help='Kubernetes version package that gybe.k8s models resolve from, like v1_30 or 1.30. '
+        'Defaults to $GYBE_K8S_VERSION, then v1_31.',
+    )(func)
 
-_c = Converter()
-_c.register_unstructure_hook(K8sSpec, _omit_none_values)
 
+def _render_cache(cache_dir: Optional[Path], cache_max_bytes: int, no_cache: bool) -> Optional[RenderCache]:
+    if cache_dir is None or no_cache:
+        return None
+    return RenderCache(cache_dir, max_bytes=cache_max_bytes)
 
-def _bind_function(f):
+
+def _render_command(transpiler: Transpiler) -> click.Command:
     @click.argument('file', required=True, type=click.File('r'))
-    def func(file):
+    @click.option(
+        '-o',
+        '--output',
+        type=click.Path(dir_okay=False, allow_dash=True, path_type=Path),
+        default='-',
+        help='Write the manifest to a file instead of stdout.',
+    )
+    @click.option(
+        '--out-dir',
+        type=click.Path(file_okay=False, path_type=Path),
+        help='Write each manifest document to its own <kind>-<name>.yaml file in this directory.',
+    )
+    @click.option(
+        '--watch',
+        is_flag=True,
+        help='Re-render whenever the values file or the chart source changes.',
+    )
+    @click.option(
+        '--interval',
+        type=click.FloatRange(min=0),
+        default=0.5,
+        show_default=True,
+        help='Seconds between checks for changes with --watch.',
+    )
+    @click.option(
+        '--timings',
+        is_flag=True,
+        help='Report wall time, net and peak allocated bytes per render phase and resource kind as '
+        'JSON on stderr. Allocations are traced with tracemalloc, which slows the render down.',
+    )
+    @click.option(
+        '--profile',
+        type=click.Path(dir_okay=False, path_type=Path),
+        help='Also run the render under cProfile and dump pstats to this file. Implies --timings.',
+    )
+    @_k8s_version_option
+    @_cache_options
+    def render(
+        file, output, out_dir, watch, interval, timings, profile, cache_dir, cache_max_bytes, no_cache
+    ):
+        """Render a values file to a kubernetes manifest."""
+        if out_dir is not None and str(output) != '-':
+            raise click.UsageError('--output and --out-dir are mutually exclusive')
+        if (timings or profile is not None) and (watch or out_dir is not None):
+            raise click.UsageError('--timings and --profile cannot be combined with --watch or --out-dir')
+        if timings or profile is not None:
+            # always rendered, since timing a cache hit says nothing about the chart
+            _timed_render(transpiler, file.read(), output, profile)
+            return
+        if watch:
+            _watch(transpiler, file, output, out_dir, interval)
+            return
+
         input_data = yaml_loads(file.read()) or dict()
-        input_model = create_input_model(f)
+        cache = _render_cache(cache_dir, cache_max_bytes, no_cache)
+        try:
+            if out_dir is not None:
+                from gybe.watch import DocumentDirectory
+
+                DocumentDirectory(out_dir).write(gybe_render(transpiler, input_data))
+            else:
+                with click.open_file(str(output), 'w', lazy=True) as stream:
+                    if cache is None:
+                        transpiler.render_to_stream(input_data, stream)
+                    else:
+                        cache.render(transpiler, input_data, stream)
+        except InvalidInputError as exc:
+            _exit_with_errors(exc)
+
+    return click.command('render')(render)
+
+
+def _exit_with_errors(exc: InvalidInputError) -> NoReturn:
+    print('validation errors:')
+    for m in exc.errors:
+        print('-', m)
+    sys.exit(-1)
+
+
+def _timed_render(transpiler: Transpiler, values: str, output: Path, profile: Optional[Path]) -> None:
+    # subcommand modules are imported on use, keeping them out of every chart's startup
+    from gybe.timings import timed_render
+
+    try:
+        with click.open_file(str(output), 'w', lazy=True) as stream:
+            timings = timed_render(transpiler, values, stream, profile_path=profile)
+    except InvalidInputError as exc:
+        _exit_with_errors(exc)
+    click.echo(json.dumps(timings.to_dict()), err=True)
+
+
+def _watch(transpiler: Transpiler, file, output: Path, out_dir: Optional[Path], interval: float) -> None:
+    from gybe.watch import ChartWatcher, DocumentDirectory
+
+    if file.name == '<stdin>':
+        raise click.UsageError('--watch needs a values file, not stdin')
+
+    if out_dir is not None:
+        directory = DocumentDirectory(out_dir)
+
+        def write(documents):
+            changed = directory.write(documents)
+            click.echo(f'{len(changed)} of {len(documents)} documents changed in {out_dir}', err=True)
+
+    else:
+
+        def write(documents):
+            text = '---\n'.join(yaml_dumps(d) for d in documents) + '\n'
+            if str(output) == '-':
+                click.echo(text, nl=False)
+            elif not output.exists() or output.read_text() != text:
+                output.write_text(text)
+                click.echo(f'wrote {output}', err=True)
+
+    watcher = ChartWatcher(transpiler, Path(file.name), write, log=lambda m: click.echo(m, err=True))
+    try:
+        watcher.run(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _render_many_command(transpiler: Transpiler) -> click.Command:
+    @click.argument(
+        'files',
+        nargs=-1,
+        required=True,
+        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    )
+    @click.option(
+        '--out-dir',
+        required=True,
+        type=click.Path(file_okay=False, path_type=Path),
+        help='Directory to write one <values file stem>.yaml manifest per values file into.',
+    )
+    @click.option(
+        '-j',
+        '--jobs',
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help='Number of forked worker processes.',
+    )
+    @_k8s_version_option
+    @_cache_options
+    def render_many_(files, out_dir, jobs, cache_dir, cache_max_bytes, no_cache):
+        """Render many values files in one process, writing one manifest per file."""
+        from gybe.batch import render_many
+
+        start = time.perf_counter()
+        cache = _render_cache(cache_dir, cache_max_bytes, no_cache)
         try:
-            input_obj = _c.structure(input_data, input_model)
-        except Exception as exc:
-            print('validation errors:')
-            for m in transform_error(exc):
-                print('-', m)
-            sys.exit(-1)
+            results = render_many(transpiler, list(files), out_dir, jobs=jobs, cache=cache)
+        except ValueError as exc:
+            raise click.UsageError(str(exc)) from exc
+
+        failures = [r for r in results if r.error is not None]
+        for r in results:
+            if r.error is None:
+                click.echo(f'ok    {r.values_path} -> {r.output_path} ({r.seconds * 1000:.1f} ms)', err=True)
+            else:
+                click.echo(f'FAIL  {r.values_path}: {r.error}', err=True)
+        click.echo(
+            f'{len(results) - len(failures)} rendered, {len(failures)} failed '
+            f'in {time.perf_counter() - start:.2f} s',
+            err=True,
+        )
+        if failures:
+            sys.exit(1)
+
+    return click.command('render-many')(render_many_)
 
-        input_fields = [f.name for f in fields(input_model)]
-        _kwargs = {kwarg: getattr(input_obj, kwarg) for kwarg in input_fields}
-        manifest = f(**_kwargs)
 
-        # Validate outputs
-        if not isinstance(manifest, list):
-            raise InvalidOutputError()
+def _k8s_versions(ctx: click.Context, param: click.Parameter, value: tuple[str, ...]) -> list[str]:
+    try:
+        return [k8s.version_package(v) for v in value] or k8s.available_versions()
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), ctx=ctx, param=param) from exc
+
+
+def _matrix_command(transpiler: Transpiler) -> click.Command:
+    @click.argument('file', required=True, type=click.File('r'))
+    @click.option(
+        '--versions',
+        multiple=True,
+        callback=_k8s_versions,
+        help='Kubernetes version package to check, like v1_30 or 1.30. Repeatable, all by default.',
+    )
+    @click.option(
+        '-j',
+        '--jobs',
+        type=click.IntRange(min=1),
+        help='Number of forked worker processes.  [default: one per version]',
+    )
+    @click.option('--json', 'as_json', is_flag=True, help='Print the report as JSON on stdout.')
+    def matrix(file, versions, jobs, as_json):
+        """Render a values file against every kubernetes version and report missing kinds and fields."""
+        from gybe.matrix import render_matrix
+
+        input_data = yaml_loads(file.read()) or dict()
+        results = render_matrix(transpiler, input_data, versions, jobs=jobs or len(versions))
 
-        for resource in manifest:
-            if not isinstance(resource, K8sResource):
-                raise InvalidOutputError()
+        if as_json:
+            click.echo(json.dumps([dataclasses.asdict(r) for r in results], indent=2))
+        else:
+            for r in results:
+                if r.error is not None:
+                    click.echo(f'FAIL  {r.version}: {r.error}')
+                else:
+                    status = 'ok   ' if not r.problems else 'WARN '
+                    click.echo(f'{status} {r.version} ({r.seconds * 1000:.1f} ms)')
+                for problem in r.problems:
+                    click.echo(f'      - {problem}')
+        if any(r.error is not None or r.problems for r in results):
+            sys.exit(1)
 
-        # Print manifest
-        print('---\n'.join([yaml_dumps(_c.unstructure(r)) for r in manifest]))
+    return click.command('matrix')(matrix)
 
-    func.__name__ = f.__name__
-    return func
 
+def transpiler(f: Callable[..., Union[Manifest, ManifestIterator]]):
+    """Command that takes in a YAML file and outputs a Kubernetes manifest YAML file.
 
-def transpiler(f: Callable[..., Manifest]):
-    """Command that takes in a YAML file and outputs a Kubernetes manifest YAML file."""
-    func = _bind_function(f)
-    return click.command()(func)
+    The decorated function either returns a list of resources or yields them one by one, in
+    which case each resource is validated and written as soon as it is yielded. The command
+    also has a `render-many` subcommand for rendering several values files in one process, and
+    a `matrix` subcommand for checking one values file against every kubernetes version.
+    """
+    # input model and structure hook are built once here and reused by every render
+    return TranspilerGroup(Transpiler(f), name=f.__name__, help=inspect.getdoc(f))
@@ -1,9 +1,44 @@
 """Gybe transpiler validation errors."""
 
+from typing import Union
 
-class InvalidOutputError(Exception):
+
+class TranspilerError(Exception):
+    """Base class for errors raised while rendering a transpiler."""
+
+
+class InvalidInputError(TranspilerError):
+    """Raised when values do not match a transpiler's inputs."""
+
+    def __init__(self, errors: list[str]):
+        """Raise validation error with one message per invalid value."""
+        self.errors = errors
+        return super().__init__('validation errors:\n' + '\n'.join(f'- {e}' for e in errors))
+
+
+class InvalidOutputError(TranspilerError):
     """Raised when a transpiler returns an invalid type."""
 
     def __init__(self):
         """Raise generic validation error message."""
-        return super().__init__('Must be a list of gybe.types.K8sResource')
+        return super().__init__('Must be a list or generator of gybe.types.K8sResource')
+
+
+class InvalidManifestError(Exception):
+    """Raised when a loaded manifest document does not fit the model of its kind."""
+
+    def __init__(self, index: int, message: str):
+        """Raise error for the document at `index` in its stream, counting from 0."""
+        self.index = index
+        return super().__init__(f'document {index}: {message}')
+
+
+class StructureError(ValueError):
+    """Raised when data does not fit the model it is structured into."""
+
+    def __init__(self, reason: str, path: tuple[Union[str, int], ...] = ()):
+        """Raise error for the value at `path`, the field names and list indexes leading to it."""
+        self.reason = reason
+        self.path = path
+        location = ''.join(f'[{p}]' if isinstance(p, int) else f'.{p}' for p in path).lstrip('.')
+        return super().__init__(f'{location}: {reason}' if path else reason)
@@ -1,59 +1,179 @@
-"""Kubernetes models as dataclasses copied from k8s' OpenAPI V3 Spec."""
+"""Kubernetes models as dataclasses copied from k8s' OpenAPI V3 Spec.
+
+The shortcut models below are resolved lazily on first access, so a chart only pays for
+importing the generated modules it actually uses. They come from the version package named
+by the `GYBE_K8S_VERSION` environment variable (ex: `v1_30` or `1.30`), `v1_31` by default,
+or the one chosen with `use_version()`. The variable is only read when a version is first needed,
+so importing gybe never fails on it and `use_version()` can still override a bad value.
+"""
+
+import importlib
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 from gybe.k8s.types import K8sResource, K8sSpec
-from gybe.k8s.v1_31.apps.v1 import (
-    DaemonSet,
-    DaemonSetSpec,
-    Deployment,
-    DeploymentSpec,
-    DeploymentStrategy,
-    StatefulSet,
-    StatefulSetSpec,
-)
-from gybe.k8s.v1_31.batch.v1 import Job, JobSpec
-from gybe.k8s.v1_31.core.v1 import (
-    Affinity,
-    Container,
-    ContainerPort,
-    EnvFromSource,
-    EnvVar,
-    EnvVarSource,
-    HTTPGetAction,
-    ObjectFieldSelector,
-    PersistentVolume,
-    PersistentVolumeClaim,
-    PersistentVolumeClaimSpec,
-    PersistentVolumeSpec,
-    Pod,
-    PodAffinityTerm,
-    PodAntiAffinity,
-    PodSpec,
-    PodTemplateSpec,
-    Probe,
-    ResourceRequirements,
-    Secret,
-    SecretEnvSource,
-    SecretKeySelector,
-    SecretVolumeSource,
-    SecurityContext,
-    Service,
-    ServicePort,
-    ServiceSpec,
-    Volume,
-    VolumeMount,
-    VolumeResourceRequirements,
-    WeightedPodAffinityTerm,
-)
-from gybe.k8s.v1_31.meta.v1 import LabelSelector, LabelSelectorRequirement, ObjectMeta
-from gybe.k8s.v1_31.networking.v1 import (
-    Ingress,
-    IngressBackend,
-    IngressServiceBackend,
-    IngressSpec,
-    ServiceBackendPort,
-)
+
+if TYPE_CHECKING:
+    from gybe.k8s.v1_31.apps.v1 import (
+        DaemonSet,
+        DaemonSetSpec,
+        Deployment,
+        DeploymentSpec,
+        DeploymentStrategy,
+        StatefulSet,
+        StatefulSetSpec,
+    )
+    from gybe.k8s.v1_31.batch.v1 import Job, JobSpec
+    from gybe.k8s.v1_31.core.v1 import (
+        Affinity,
+        Container,
+        ContainerPort,
+        EnvFromSource,
+        EnvVar,
+        EnvVarSource,
+        HTTPGetAction,
+        ObjectFieldSelector,
+        PersistentVolume,
+        PersistentVolumeClaim,
+        PersistentVolumeClaimSpec,
+        PersistentVolumeSpec,
+        Pod,
+        PodAffinityTerm,
+        PodAntiAffinity,
+        PodSpec,
+        PodTemplateSpec,
+        Probe,
+        ResourceRequirements,
+        Secret,
+        SecretEnvSource,
+        SecretKeySelector,
+        SecretVolumeSource,
+        SecurityContext,
+        Service,
+        ServicePort,
+        ServiceSpec,
+        Volume,
+        VolumeMount,
+        VolumeResourceRequirements,
+        WeightedPodAffinityTerm,
+    )
+    from gybe.k8s.v1_31.meta.v1 import LabelSelector, LabelSelectorRequirement, ObjectMeta
+    from gybe.k8s.v1_31.networking.v1 import (
+        Ingress,
+        IngressBackend,
+        IngressServiceBackend,
+        IngressSpec,
+        ServiceBackendPort,
+    )
+
+DEFAULT_VERSION = 'v1_31'
+
+
+def available_versions() -> list[str]:
+    """List the generated version packages, oldest first."""
+    paths = Path(__file__).parent.glob('v1_*')
+    return sorted((p.name for p in paths if p.is_dir()), key=lambda v: tuple(map(int, v[1:].split('_'))))
+
+
+def version_package(version: str) -> str:
+    """Map `v1_30`, `v1.30` or `1.30` to the `v1_30` package, checking that it exists."""
+    name = 'v' + re.sub(r'[._]', '_', version.strip().removeprefix('v'))
+    if name not in available_versions():
+        raise ValueError(f'unknown kubernetes version {version!r}, expected one of {available_versions()}')
+    return name
+
+
+def current_version() -> str:
+    """Name the version package that the shortcut models currently resolve from.
+
+    Raises `ValueError` naming `GYBE_K8S_VERSION` when it is the source and not a known version.
+    """
+    global _version_module
+
+    if _version_module is None:
+        try:
+            _version_module = version_package(os.environ.get('GYBE_K8S_VERSION') or DEFAULT_VERSION)
+        except ValueError as exc:
+            raise ValueError(f'GYBE_K8S_VERSION environment variable: {exc}') from None
+    return _version_module
+
+
+def use_version(version: str) -> None:
+    """Resolve the shortcut models from another kubernetes version package from now on.
+
+    Only `gybe.k8s.<Model>` lookups made afterwards are affected, names already imported with
+    `from gybe.k8s import <Model>` stay bound to the previous version.
+    """
+    global _version_module
+
+    _version_module = version_package(version)
+    for name in _lazy_models:
+        globals().pop(name, None)
+
+
+# resolved from the environment on first use, see `current_version`
+_version_module: Optional[str] = None
+
+# model name -> generated module (relative to the version module) that defines it
+_lazy_models = {
+    'DaemonSet': 'apps.v1',
+    'DaemonSetSpec': 'apps.v1',
+    'Deployment': 'apps.v1',
+    'DeploymentSpec': 'apps.v1',
+    'DeploymentStrategy': 'apps.v1',
+    'StatefulSet': 'apps.v1',
+    'StatefulSetSpec': 'apps.v1',
+    'Job': 'batch.v1',
+    'JobSpec': 'batch.v1',
+    'Affinity': 'core.v1',
+    'Container': 'core.v1',
+    'ContainerPort': 'core.v1',
+    'EnvFromSource': 'core.v1',
+    'EnvVar': 'core.v1',
+    'EnvVarSource': 'core.v1',
+    'HTTPGetAction': 'core.v1',
+    'ObjectFieldSelector': 'core.v1',
+    'PersistentVolume': 'core.v1',
+    'PersistentVolumeClaim': 'core.v1',
+    'PersistentVolumeClaimSpec': 'core.v1',
+    'PersistentVolumeSpec': 'core.v1',
+    'Pod': 'core.v1',
+    'PodAffinityTerm': 'core.v1',
+    'PodAntiAffinity': 'core.v1',
+    'PodSpec': 'core.v1',
+    'PodTemplateSpec': 'core.v1',
+    'Probe': 'core.v1',
+    'ResourceRequirements': 'core.v1',
+    'Secret': 'core.v1',
+    'SecretEnvSource': 'core.v1',
+    'SecretKeySelector': 'core.v1',
+    'SecretVolumeSource': 'core.v1',
+    'SecurityContext': 'core.v1',
+    'Service': 'core.v1',
+    'ServicePort': 'core.v1',
+    'ServiceSpec': 'core.v1',
+    'Volume': 'core.v1',
+    'VolumeMount': 'core.v1',
+    'VolumeResourceRequirements': 'core.v1',
+    'WeightedPodAffinityTerm': 'core.v1',
+    'LabelSelector': 'meta.v1',
+    'LabelSelectorRequirement': 'meta.v1',
+    'ObjectMeta': 'meta.v1',
+    'Ingress': 'networking.v1',
+    'IngressBackend': 'networking.v1',
+    'IngressServiceBackend': 'networking.v1',
+    'IngressSpec': 'networking.v1',
+    'ServiceBackendPort': 'networking.v1',
+}
 
 __all__ = [
+    'DEFAULT_VERSION',
+    'available_versions',
+    'current_version',
+    'version_package',
+    'use_version',
     'Affinity',
     'Container',
     'ContainerPort',
@@ -69,7 +189,6 @@ __all__ = [
     'Ingress',
     'IngressBackend',
     'IngressServiceBackend',
-    'IngressServiceBackendPort',
     'IngressSpec',
     'Job',
     'JobSpec',
@@ -82,7 +201,6 @@ __all__ = [
     'PersistentVolume',
     'PersistentVolumeClaim',
     'PersistentVolumeClaimSpec',
-    'PersistentVolumeClaimSpec',
     'PersistentVolumeSpec',
     'Pod',
     'PodAffinityTerm',
@@ -107,3 +225,20 @@ __all__ = [
     'VolumeResourceRequirements',
     'WeightedPodAffinityTerm',
 ]
+
+# hidden from mypy so unknown attributes are still reported instead of typed as `Any`
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = _lazy_models[name]
+        except KeyError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+        module = importlib.import_module(f'{__name__}.{current_version()}.{module_name}')
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_models))
@@ -0,0 +1,18 @@
+"""Read the field index shipped with each version package.
+
+The index is written by codegen, see `gybe.codegen.field_index` for its format, and lets
+`matrix` check rendered documents against a version without importing its modules.
+"""
+
+import functools
+import json
+from pathlib import Path
+from typing import Any
+
+INDEX_FILE = 'field_index.json'
+
+
+@functools.cache
+def load_field_index(version: str, k8s_dir: Path = Path(__file__).parent) -> dict[str, Any]:
+    """Read the field index shipped with a version package, once per process."""
+    return json.loads((k8s_dir / version / INDEX_FILE).read_text())
@@ -0,0 +1,75 @@
+"""Look up generated models by `apiVersion` and `kind` without importing every module.
+
+Each version package ships a `kinds.json` registry written by codegen:
+
+    {"apps/v1/Deployment": ["apps.v1", "Deployment", "deployments", true], ...}
+
+mapping every kind served by that kubernetes version to the module (relative to the version
+package) and class of its model, its REST plural and whether it is namespaced. Reading it costs
+a single small JSON file per version; a model's module is only imported when its class is
+first asked for.
+"""
+
+import functools
+import importlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from gybe import k8s
+from gybe.k8s.types import K8sSpec
+
+REGISTRY_FILE = 'kinds.json'
+
+
+@dataclass(frozen=True)
+class KindInfo:
+    """A kind served by a kubernetes version, and where its generated model lives."""
+
+    version: str
+    api_version: str
+    kind: str
+    module: str
+    name: str
+    plural: str
+    namespaced: bool
+
+    @property
+    def model(self) -> type[K8sSpec]:
+        """Import the kind's model class, on first access only."""
+        return _import_model(f'gybe.k8s.{self.version}.{self.module}', self.name)
+
+
+@functools.cache
+def _import_model(module: str, name: str) -> type[K8sSpec]:
+    return getattr(importlib.import_module(module), name)
+
+
+@functools.cache
+def _load_registry(version: str) -> dict[tuple[str, str], KindInfo]:
+    entries = json.loads((Path(__file__).parent / version / REGISTRY_FILE).read_text())
+    registry = {}
+    for key, (module, name, plural, namespaced) in entries.items():
+        api_version, _, kind = key.rpartition('/')
+        registry[api_version, kind] = KindInfo(version, api_version, kind, module, name, plural, namespaced)
+    return registry
+
+
+def kind_registry(version: Optional[str] = None) -> dict[tuple[str, str], KindInfo]:
+    """Read a version's kinds by `(apiVersion, kind)`, once per process.
+
+    Defaults to the version the shortcut models resolve from, see `gybe.k8s.use_version`.
+    """
+    return _load_registry(k8s.current_version() if version is None else k8s.version_package(version))
+
+
+def lookup_kind(api_version: str, kind: str, version: Optional[str] = None) -> Optional[KindInfo]:
+    """Find a kind in a version's registry, or `None` when that version does not serve it."""
+    return kind_registry(version).get((api_version, kind))
+
+
+def model_for(api_version: str, kind: str, version: Optional[str] = None) -> Optional[type[K8sSpec]]:
+    """Return the model class of a kind, importing only the module that defines it."""
+    info = lookup_kind(api_version, kind, version)
+    return None if info is None else info.model
@@ -0,0 +1 @@
+"""k8s dataclass models shared by several kubernetes versions"""
@@ -0,0 +1,3 @@
+"""Models generated from Kubernetes OpenAPI Spec."""
+
+Quantity = str | int | float
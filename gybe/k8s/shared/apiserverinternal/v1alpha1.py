@@ -0,0 +1,30 @@
+"""Models generated from Kubernetes OpenAPI Spec."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from gybe.k8s.types import K8sSpec
+
+
+@dataclass
+class ServerStorageVersion(K8sSpec):
+    """An API server instance reports the version it can decode and the version it encodes objects to when
+    persisting objects in the backend.
+
+    Attributes:
+        apiServerID: The ID of the reporting API server.
+        decodableVersions: The API server can decode objects encoded in these versions. The encodingVersion
+            must be included in the decodableVersions.
+        encodingVersion: The API server encodes the object to this version when persisting it in the backend
+            (e.g., etcd).
+        servedVersions: The API server can serve these versions. DecodableVersions must include all
+            ServedVersions.
+
+    """
+
+    apiServerID: Optional[str] = None
+    decodableVersions: Optional[List[str]] = None
+    encodingVersion: Optional[str] = None
+    servedVersions: Optional[List[str]] = None
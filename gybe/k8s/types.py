@@ -1,22 +1,28 @@
 """Type aliases for JSON serializable objects."""
 
 from dataclasses import dataclass
-from typing import Mapping, TypeAlias, Union
+from typing import Iterator, Mapping, TypeAlias, Union
 
 JSONObj: TypeAlias = Union[Mapping[str, 'JSONObj'], list['JSONObj'], str, int, float, bool, None]
 JSONDict: TypeAlias = Mapping[str, Union['JSONObj', 'JSONDict']]
 
 
 # decorating the base classes with @dataclass has no runtime effect but tells `mypy` to
-# expect subclasses to each be a dataclass
+# expect subclasses to each be a dataclass. Empty `__slots__` keep models generated with
+# `slots=True` free of a per-instance `__dict__`.
 @dataclass
 class K8sSpec:
     """Base model class for all kubernetes dataclasses."""
 
+    __slots__ = ()
+
 
 @dataclass
 class K8sResource(K8sSpec):
     """Base model for kubernetes resources, like Deployment, Service and StatefulSet"""
 
+    __slots__ = ()
+
 
 Manifest: TypeAlias = list[K8sResource]
+ManifestIterator: TypeAlias = Iterator[K8sResource]
@@ -6,31 +6,10 @@ from dataclasses import dataclass
 from typing import List, Literal, Optional
 
 import gybe.k8s.v1_29.meta.v1
+from gybe.k8s.shared.apiserverinternal.v1alpha1 import ServerStorageVersion as ServerStorageVersion
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
-class ServerStorageVersion(K8sSpec):
-    """An API server instance reports the version it can decode and the version it encodes objects to when
-    persisting objects in the backend.
-
-    Attributes:
-        apiServerID: The ID of the reporting API server.
-        decodableVersions: The API server can decode objects encoded in these versions. The encodingVersion
-            must be included in the decodableVersions.
-        encodingVersion: The API server encodes the object to this version when persisting it in the backend
-            (e.g., etcd).
-        servedVersions: The API server can serve these versions. DecodableVersions must include all
-            ServedVersions.
-
-    """
-
-    apiServerID: Optional[str] = None
-    decodableVersions: Optional[List[str]] = None
-    encodingVersion: Optional[str] = None
-    servedVersions: Optional[List[str]] = None
-
-
 @dataclass
 class StorageVersion(K8sResource):
     """Storage version of a specific resource.
@@ -50,7 +29,7 @@ class StorageVersion(K8sResource):
 
     spec: JSONObj
     status: StorageVersionStatus
-    apiVersion: Literal['admissionregistration.k8s.io/v1alpha1'] = 'admissionregistration.k8s.io/v1alpha1'
+    apiVersion: Literal['internal.apiserver.k8s.io/v1alpha1'] = 'internal.apiserver.k8s.io/v1alpha1'
     kind: Literal['StorageVersion'] = 'StorageVersion'
     metadata: Optional[gybe.k8s.v1_29.meta.v1.ObjectMeta] = None
 
@@ -7,6 +7,18 @@ from typing import List, Literal, Optional
 
 import gybe.k8s.v1_30.core.v1
 import gybe.k8s.v1_30.meta.v1
+from gybe.k8s.shared.batch.v1 import CronJobStatus as CronJobStatus
+from gybe.k8s.shared.batch.v1 import JobCondition as JobCondition
+from gybe.k8s.shared.batch.v1 import JobStatus as JobStatus
+from gybe.k8s.shared.batch.v1 import PodFailurePolicy as PodFailurePolicy
+from gybe.k8s.shared.batch.v1 import (
+    PodFailurePolicyOnExitCodesRequirement as PodFailurePolicyOnExitCodesRequirement,
+)
+from gybe.k8s.shared.batch.v1 import (
+    PodFailurePolicyOnPodConditionsPattern as PodFailurePolicyOnPodConditionsPattern,
+)
+from gybe.k8s.shared.batch.v1 import PodFailurePolicyRule as PodFailurePolicyRule
+from gybe.k8s.shared.batch.v1 import UncountedTerminatedPods as UncountedTerminatedPods
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
@@ -96,22 +108,6 @@ class CronJobSpec(K8sSpec):
     timeZone: Optional[str] = None
 
 
-@dataclass
-class CronJobStatus(K8sSpec):
-    """CronJobStatus represents the current state of a cron job.
-
-    Attributes:
-        active: A list of pointers to currently running jobs.
-        lastScheduleTime: Information when was the last time the job was successfully scheduled.
-        lastSuccessfulTime: Information when was the last time the job successfully completed.
-
-    """
-
-    active: Optional[List[gybe.k8s.v1_30.core.v1.ObjectReference]] = None
-    lastScheduleTime: Optional[str] = None
-    lastSuccessfulTime: Optional[str] = None
-
-
 @dataclass
 class Job(K8sResource):
     """Job represents the configuration of a single job.
@@ -135,28 +131,6 @@ class Job(K8sResource):
     status: Optional[JobStatus] = None
 
 
-@dataclass
-class JobCondition(K8sSpec):
-    """JobCondition describes current state of a job.
-
-    Attributes:
-        lastProbeTime: Last time the condition was checked.
-        lastTransitionTime: Last time the condition transit from one status to another.
-        message: Human readable message indicating details about last transition.
-        reason: (brief) reason for the condition's last transition.
-        status: Status of the condition, one of True, False, Unknown.
-        type: Type of job condition, Complete or Failed.
-
-    """
-
-    type: str
-    status: str
-    lastProbeTime: Optional[str] = None
-    lastTransitionTime: Optional[str] = None
-    message: Optional[str] = None
-    reason: Optional[str] = None
-
-
 @dataclass
 class JobList(K8sSpec):
     """JobList is a collection of jobs.
@@ -291,73 +265,6 @@ class JobSpec(K8sSpec):
     ttlSecondsAfterFinished: Optional[int] = None
 
 
-@dataclass
-class JobStatus(K8sSpec):
-    """JobStatus represents the current state of a Job.
-
-    Attributes:
-        active: The number of pending and running pods which are not terminating (without a
-            deletionTimestamp). The value is zero for finished jobs.
-        completedIndexes: completedIndexes holds the completed indexes when .spec.completionMode = 'Indexed'
-            in a text format. The indexes are represented as decimal integers separated by commas. The numbers
-            are listed in increasing order. Three or more consecutive numbers are compressed and represented
-            by the first and last element of the series, separated by a hyphen. For example, if the completed
-            indexes are 1, 3, 4, 5 and 7, they are represented as '1,3-5,7'.
-        completionTime: Represents time when the job was completed. It is not guaranteed to be set in happens-
-            before order across separate operations. It is represented in RFC3339 form and is in UTC. The
-            completion time is set when the job finishes successfully, and only then. The value cannot be
-            updated or removed. The value indicates the same or later point in time as the startTime field.
-        conditions: The latest available observations of an object's current state. When a Job fails, one of
-            the conditions will have type 'Failed' and status true. When a Job is suspended, one of the
-            conditions will have type 'Suspended' and status true; when the Job is resumed, the status of this
-            condition will become false. When a Job is completed, one of the conditions will have type
-            'Complete' and status true.  A job is considered finished when it is in a terminal condition,
-            either 'Complete' or 'Failed'. A Job cannot have both the 'Complete' and 'Failed' conditions.
-            Additionally, it cannot be in the 'Complete' and 'FailureTarget' conditions. The 'Complete',
-            'Failed' and 'FailureTarget' conditions cannot be disabled.
-        failed: The number of pods which reached phase Failed. The value increases monotonically.
-        failedIndexes: FailedIndexes holds the failed indexes when spec.backoffLimitPerIndex is set. The
-            indexes are represented in the text format analogous as for the `completedIndexes` field, ie. they
-            are kept as decimal integers separated by commas. The numbers are listed in increasing order.
-            Three or more consecutive numbers are compressed and represented by the first and last element of
-            the series, separated by a hyphen. For example, if the failed indexes are 1, 3, 4, 5 and 7, they
-            are represented as '1,3-5,7'. The set of failed indexes cannot overlap with the set of completed
-            indexes.  This field is beta-level. It can be used when the `JobBackoffLimitPerIndex` feature gate
-            is enabled (enabled by default).
-        ready: The number of pods which have a Ready condition.
-        startTime: Represents time when the job controller started processing a job. When a Job is created in
-            the suspended state, this field is not set until the first time it is resumed. This field is reset
-            every time a Job is resumed from suspension. It is represented in RFC3339 form and is in UTC.
-            Once set, the field can only be removed when the job is suspended. The field cannot be modified
-            while the job is unsuspended or finished.
-        succeeded: The number of pods which reached phase Succeeded. The value increases monotonically for a
-            given spec. However, it may decrease in reaction to scale down of elastic indexed jobs.
-        terminating: The number of pods which are terminating (in phase Pending or Running and have a
-            deletionTimestamp).  This field is beta-level. The job controller populates the field when the
-            feature gate JobPodReplacementPolicy is enabled (enabled by default).
-        uncountedTerminatedPods: uncountedTerminatedPods holds the UIDs of Pods that have terminated but the
-            job controller hasn't yet accounted for in the status counters.  The job controller creates pods
-            with a finalizer. When a pod terminates (succeeded or failed), the controller does three steps to
-            account for it in the job status:  1. Add the pod UID to the arrays in this field. 2. Remove the
-            pod finalizer. 3. Remove the pod UID from the arrays while increasing the corresponding
-            counter.  Old jobs might not be tracked using this field, in which case the field remains null.
-            The structure is empty for finished jobs.
-
-    """
-
-    active: Optional[int] = None
-    completedIndexes: Optional[str] = None
-    completionTime: Optional[str] = None
-    conditions: Optional[List[JobCondition]] = None
-    failed: Optional[int] = None
-    failedIndexes: Optional[str] = None
-    ready: Optional[int] = None
-    startTime: Optional[str] = None
-    succeeded: Optional[int] = None
-    terminating: Optional[int] = None
-    uncountedTerminatedPods: Optional[UncountedTerminatedPods] = None
-
-
 @dataclass
 class JobTemplateSpec(K8sSpec):
     """JobTemplateSpec describes the data a Job should have when created from a template
@@ -371,96 +278,6 @@ class JobTemplateSpec(K8sSpec):
     spec: Optional[JobSpec] = None
 
 
-@dataclass
-class PodFailurePolicy(K8sSpec):
-    """PodFailurePolicy describes how failed pods influence the backoffLimit.
-
-    Attributes:
-        rules: A list of pod failure policy rules. The rules are evaluated in order. Once a rule matches a Pod
-            failure, the remaining of the rules are ignored. When no rule matches the Pod failure, the default
-            handling applies - the counter of pod failures is incremented and it is checked against the
-            backoffLimit. At most 20 elements are allowed.
-
-    """
-
-    rules: List[PodFailurePolicyRule]
-
-
-@dataclass
-class PodFailurePolicyOnExitCodesRequirement(K8sSpec):
-    """PodFailurePolicyOnExitCodesRequirement describes the requirement for handling a failed pod based on
-    its container exit codes. In particular, it lookups the .state.terminated.exitCode for each app
-    container and init container status, represented by the .status.containerStatuses and
-    .status.initContainerStatuses fields in the Pod status, respectively. Containers completed with
-    success (exit code 0) are excluded from the requirement check.
-
-    Attributes:
-        containerName: Restricts the check for exit codes to the container with the specified name. When null,
-            the rule applies to all containers. When specified, it should match one the container or
-            initContainer names in the pod template.
-        operator: Represents the relationship between the container exit code(s) and the specified values.
-            Containers completed with success (exit code 0) are excluded from the requirement check. Possible
-            values are:  - In: the requirement is satisfied if at least one container exit code   (might be
-            multiple if there are multiple containers not restricted   by the 'containerName' field) is in the
-            set of specified values. - NotIn: the requirement is satisfied if at least one container exit code
-            (might be multiple if there are multiple containers not restricted   by the 'containerName' field)
-            is not in the set of specified values. Additional values are considered to be added in the future.
-            Clients should react to an unknown operator by assuming the requirement is not satisfied.
-        values: Specifies the set of values. Each returned container exit code (might be multiple in case of
-            multiple containers) is checked against this set of values with respect to the operator. The list
-            of values must be ordered and must not contain duplicates. Value '0' cannot be used for the In
-            operator. At least one element is required. At most 255 elements are allowed.
-
-    """
-
-    operator: str
-    values: List[int]
-    containerName: Optional[str] = None
-
-
-@dataclass
-class PodFailurePolicyOnPodConditionsPattern(K8sSpec):
-    """PodFailurePolicyOnPodConditionsPattern describes a pattern for matching an actual pod condition type.
-
-    Attributes:
-        status: Specifies the required Pod condition status. To match a pod condition it is required that the
-            specified status equals the pod condition status. Defaults to True.
-        type: Specifies the required Pod condition type. To match a pod condition it is required that
-            specified type equals the pod condition type.
-
-    """
-
-    type: str
-    status: str
-
-
-@dataclass
-class PodFailurePolicyRule(K8sSpec):
-    """PodFailurePolicyRule describes how a pod failure is handled when the requirements are met. One of
-    onExitCodes and onPodConditions, but not both, can be used in each rule.
-
-    Attributes:
-        action: Specifies the action taken on a pod failure when the requirements are satisfied. Possible
-            values are:  - FailJob: indicates that the pod's job is marked as Failed and all   running pods
-            are terminated. - FailIndex: indicates that the pod's index is marked as Failed and will   not be
-            restarted.   This value is beta-level. It can be used when the   `JobBackoffLimitPerIndex` feature
-            gate is enabled (enabled by default). - Ignore: indicates that the counter towards the
-            .backoffLimit is not   incremented and a replacement pod is created. - Count: indicates that the
-            pod is handled in the default way - the   counter towards the .backoffLimit is incremented.
-            Additional values are considered to be added in the future. Clients should react to an unknown
-            action by skipping the rule.
-        onExitCodes: Represents the requirement on the container exit codes.
-        onPodConditions: Represents the requirement on the pod conditions. The requirement is represented as a
-            list of pod condition patterns. The requirement is satisfied if at least one pattern matches an
-            actual pod condition. At most 20 elements are allowed.
-
-    """
-
-    action: str
-    onExitCodes: Optional[PodFailurePolicyOnExitCodesRequirement] = None
-    onPodConditions: Optional[List[PodFailurePolicyOnPodConditionsPattern]] = None
-
-
 @dataclass
 class SuccessPolicy(K8sSpec):
     """SuccessPolicy describes when a Job can be declared as succeeded based on the success of some indexes.
@@ -503,18 +320,3 @@ class SuccessPolicyRule(K8sSpec):
 
     succeededCount: Optional[int] = None
     succeededIndexes: Optional[str] = None
-
-
-@dataclass
-class UncountedTerminatedPods(K8sSpec):
-    """UncountedTerminatedPods holds UIDs of Pods that have terminated but haven't been accounted in Job
-    status counters.
-
-    Attributes:
-        failed: failed holds UIDs of failed Pods.
-        succeeded: succeeded holds UIDs of succeeded Pods.
-
-    """
-
-    failed: Optional[List[str]] = None
-    succeeded: Optional[List[str]] = None
@@ -6,6 +6,12 @@ from dataclasses import dataclass
 from typing import List, Literal, Optional
 
 import gybe.k8s.v1_31.meta.v1
+from gybe.k8s.shared.admissionregistration.v1alpha1 import MatchCondition as MatchCondition
+from gybe.k8s.shared.admissionregistration.v1alpha1 import MatchResources as MatchResources
+from gybe.k8s.shared.admissionregistration.v1alpha1 import NamedRuleWithOperations as NamedRuleWithOperations
+from gybe.k8s.shared.admissionregistration.v1alpha1 import ParamKind as ParamKind
+from gybe.k8s.shared.admissionregistration.v1alpha1 import ParamRef as ParamRef
+from gybe.k8s.shared.admissionregistration.v1alpha1 import Variable as Variable
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
@@ -55,173 +61,6 @@ class ExpressionWarning(K8sSpec):
     warning: str
 
 
-@dataclass
-class MatchCondition(K8sSpec):
-    """Schema model io.k8s.api.admissionregistration.v1alpha1.MatchCondition.
-
-    Attributes:
-        expression: Expression represents the expression which will be evaluated by CEL. Must evaluate to
-            bool. CEL expressions have access to the contents of the AdmissionRequest and Authorizer,
-            organized into CEL variables:  'object' - The object from the incoming request. The value is null
-            for DELETE requests. 'oldObject' - The existing object. The value is null for CREATE requests.
-            'request' - Attributes of the admission request(/pkg/apis/admission/types.go#AdmissionRequest).
-            'authorizer' - A CEL Authorizer. May be used to perform authorization checks for the principal
-            (user or service account) of the request.   See
-            https://pkg.go.dev/k8s.io/apiserver/pkg/cel/library#Authz 'authorizer.requestResource' - A CEL
-            ResourceCheck constructed from the 'authorizer' and configured with the   request resource.
-            Documentation on CEL: https://kubernetes.io/docs/reference/using-api/cel/  Required.
-        name: Name is an identifier for this match condition, used for strategic merging of MatchConditions,
-            as well as providing an identifier for logging purposes. A good name should be descriptive of the
-            associated expression. Name must be a qualified name consisting of alphanumeric characters, '-',
-            '_' or '.', and must start and end with an alphanumeric character (e.g. 'MyName',  or 'my.name',
-            or '123-abc', regex used for validation is '([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9]') with an
-            optional DNS subdomain prefix and '/' (e.g. 'example.com/MyName')  Required.
-
-    """
-
-    name: str
-    expression: str
-
-
-@dataclass
-class MatchResources(K8sSpec):
-    """MatchResources decides whether to run the admission control policy on an object based on whether it
-    meets the match criteria. The exclude rules take precedence over include rules (if a resource matches
-    both, it is excluded)
-
-    Attributes:
-        excludeResourceRules: ExcludeResourceRules describes what operations on what resources/subresources
-            the ValidatingAdmissionPolicy should not care about. The exclude rules take precedence over
-            include rules (if a resource matches both, it is excluded)
-        matchPolicy: matchPolicy defines how the 'MatchResources' list is used to match incoming requests.
-            Allowed values are 'Exact' or 'Equivalent'.  - Exact: match a request only if it exactly matches a
-            specified rule. For example, if deployments can be modified via apps/v1, apps/v1beta1, and
-            extensions/v1beta1, but 'rules' only included `apiGroups:['apps'], apiVersions:['v1'], resources:
-            ['deployments']`, a request to apps/v1beta1 or extensions/v1beta1 would not be sent to the
-            ValidatingAdmissionPolicy.  - Equivalent: match a request if modifies a resource listed in rules,
-            even via another API group or version. For example, if deployments can be modified via apps/v1,
-            apps/v1beta1, and extensions/v1beta1, and 'rules' only included `apiGroups:['apps'],
-            apiVersions:['v1'], resources: ['deployments']`, a request to apps/v1beta1 or extensions/v1beta1
-            would be converted to apps/v1 and sent to the ValidatingAdmissionPolicy.  Defaults to 'Equivalent'
-        namespaceSelector: NamespaceSelector decides whether to run the admission control policy on an object
-            based on whether the namespace for that object matches the selector. If the object itself is a
-            namespace, the matching is performed on object.metadata.labels. If the object is another cluster
-            scoped resource, it never skips the policy.  For example, to run the webhook on any objects whose
-            namespace is not associated with 'runlevel' of '0' or '1';  you will set the selector as follows:
-            'namespaceSelector': {   'matchExpressions': [     {       'key': 'runlevel',       'operator':
-            'NotIn',       'values': [         '0',         '1'       ]     }   ] }  If instead you want to
-            only run the policy on any objects whose namespace is associated with the 'environment' of 'prod'
-            or 'staging'; you will set the selector as follows: 'namespaceSelector': {   'matchExpressions': [
-            {       'key': 'environment',       'operator': 'In',       'values': [         'prod',
-            'staging'       ]     }   ] }  See https://kubernetes.io/docs/concepts/overview/working-with-
-            objects/labels/ for more examples of label selectors.  Default to the empty LabelSelector, which
-            matches everything.
-        objectSelector: ObjectSelector decides whether to run the validation based on if the object has
-            matching labels. objectSelector is evaluated against both the oldObject and newObject that would
-            be sent to the cel validation, and is considered to match if either object matches the selector. A
-            null object (oldObject in the case of create, or newObject in the case of delete) or an object
-            that cannot have labels (like a DeploymentRollback or a PodProxyOptions object) is not considered
-            to match. Use the object selector only if the webhook is opt-in, because end users may skip the
-            admission webhook by setting the labels. Default to the empty LabelSelector, which matches
-            everything.
-        resourceRules: ResourceRules describes what operations on what resources/subresources the
-            ValidatingAdmissionPolicy matches. The policy cares about an operation if it matches _any_ Rule.
-
-    """
-
-    excludeResourceRules: Optional[List[NamedRuleWithOperations]] = None
-    matchPolicy: Optional[str] = None
-    namespaceSelector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
-    objectSelector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
-    resourceRules: Optional[List[NamedRuleWithOperations]] = None
-
-
-@dataclass
-class NamedRuleWithOperations(K8sSpec):
-    """NamedRuleWithOperations is a tuple of Operations and Resources with ResourceNames.
-
-    Attributes:
-        apiGroups: APIGroups is the API groups the resources belong to. '*' is all groups. If '*' is present,
-            the length of the slice must be one. Required.
-        apiVersions: APIVersions is the API versions the resources belong to. '*' is all versions. If '*' is
-            present, the length of the slice must be one. Required.
-        operations: Operations is the operations the admission hook cares about - CREATE, UPDATE, DELETE,
-            CONNECT or * for all of those operations and any future admission operations that are added. If
-            '*' is present, the length of the slice must be one. Required.
-        resourceNames: ResourceNames is an optional white list of names that the rule applies to.  An empty
-            set means that everything is allowed.
-        resources: Resources is a list of resources this rule applies to.  For example: 'pods' means pods.
-            'pods/log' means the log subresource of pods. '*' means all resources, but not subresources.
-            'pods/*' means all subresources of pods. '*/scale' means all scale subresources. '*/*' means all
-            resources and their subresources.  If wildcard is present, the validation rule will ensure
-            resources do not overlap with each other.  Depending on the enclosing object, subresources might
-            not be allowed. Required.
-        scope: scope specifies the scope of this rule. Valid values are 'Cluster', 'Namespaced', and '*'
-            'Cluster' means that only cluster-scoped resources will match this rule. Namespace API objects are
-            cluster-scoped. 'Namespaced' means that only namespaced resources will match this rule. '*' means
-            that there are no scope restrictions. Subresources match the scope of their parent resource.
-            Default is '*'.
-
-    """
-
-    apiGroups: Optional[List[str]] = None
-    apiVersions: Optional[List[str]] = None
-    operations: Optional[List[str]] = None
-    resourceNames: Optional[List[str]] = None
-    resources: Optional[List[str]] = None
-    scope: Optional[str] = None
-
-
-@dataclass
-class ParamKind(K8sSpec):
-    """ParamKind is a tuple of Group Kind and Version.
-
-    Attributes:
-        apiVersion: APIVersion is the API group version the resources belong to. In format of 'group/version'.
-            Required.
-        kind: Kind is the API kind the resources belong to. Required.
-
-    """
-
-    apiVersion: Optional[str] = None
-    kind: Optional[str] = None
-
-
-@dataclass
-class ParamRef(K8sSpec):
-    """ParamRef describes how to locate the params to be used as input to expressions of rules applied by a
-    policy binding.
-
-    Attributes:
-        name: `name` is the name of the resource being referenced.  `name` and `selector` are mutually
-            exclusive properties. If one is set, the other must be unset.
-        namespace: namespace is the namespace of the referenced resource. Allows limiting the search for
-            params to a specific namespace. Applies to both `name` and `selector` fields.  A per-namespace
-            parameter may be used by specifying a namespace-scoped `paramKind` in the policy and leaving this
-            field empty.  - If `paramKind` is cluster-scoped, this field MUST be unset. Setting this field
-            results in a configuration error.  - If `paramKind` is namespace-scoped, the namespace of the
-            object being evaluated for admission will be used when this field is left unset. Take care that if
-            this is left empty the binding must not match any cluster-scoped resources, which will result in
-            an error.
-        parameterNotFoundAction: `parameterNotFoundAction` controls the behavior of the binding when the
-            resource exists, and name or selector is valid, but there are no parameters matched by the
-            binding. If the value is set to `Allow`, then no matched parameters will be treated as successful
-            validation by the binding. If set to `Deny`, then no matched parameters will be subject to the
-            `failurePolicy` of the policy.  Allowed values are `Allow` or `Deny` Default to `Deny`
-        selector: selector can be used to match multiple param objects based on their labels. Supply selector:
-            {} to match all resources of the ParamKind.  If multiple params are found, they are all evaluated
-            with the policy expressions and the results are ANDed together.  One of `name` or `selector` must
-            be set, but `name` and `selector` are mutually exclusive properties. If one is set, the other must
-            be unset.
-
-    """
-
-    name: Optional[str] = None
-    namespace: Optional[str] = None
-    parameterNotFoundAction: Optional[str] = None
-    selector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
-
-
 @dataclass
 class TypeChecking(K8sSpec):
     """TypeChecking contains results of type checking the expressions in the ValidatingAdmissionPolicy
@@ -519,20 +358,3 @@ class Validation(K8sSpec):
     message: Optional[str] = None
     messageExpression: Optional[str] = None
     reason: Optional[str] = None
-
-
-@dataclass
-class Variable(K8sSpec):
-    """Variable is the definition of a variable that is used for composition.
-
-    Attributes:
-        expression: Expression is the expression that will be evaluated as the value of the variable. The CEL
-            expression has access to the same identifiers as the CEL expressions in Validation.
-        name: Name is the name of the variable. The name must be a valid CEL identifier and unique among all
-            variables. The variable can be accessed in other expressions through `variables` For example, if
-            name is 'foo', the variable will be available as `variables.foo`
-
-    """
-
-    name: str
-    expression: str
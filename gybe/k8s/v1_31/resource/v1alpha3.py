@@ -409,7 +409,7 @@ class PodSchedulingContext(K8sResource):
     """
 
     spec: PodSchedulingContextSpec
-    apiVersion: Literal['policy/v1alpha3'] = 'policy/v1alpha3'
+    apiVersion: Literal['resource.k8s.io/v1alpha3'] = 'resource.k8s.io/v1alpha3'
     kind: Literal['PodSchedulingContext'] = 'PodSchedulingContext'
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
     status: Optional[PodSchedulingContextStatus] = None
@@ -488,7 +488,7 @@ class ResourceClaim(K8sResource):
     """
 
     spec: ResourceClaimSpec
-    apiVersion: Literal['policy/v1alpha3'] = 'policy/v1alpha3'
+    apiVersion: Literal['resource.k8s.io/v1alpha3'] = 'resource.k8s.io/v1alpha3'
     kind: Literal['ResourceClaim'] = 'ResourceClaim'
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
     status: Optional[ResourceClaimStatus] = None
@@ -1,3 +1,3 @@
 """Models generated from Kubernetes OpenAPI Spec."""
 
-Quantity = str | int | float
+from gybe.k8s.shared.api.resource import Quantity as Quantity
@@ -6,6 +6,13 @@ from dataclasses import dataclass
 from typing import List, Literal, Optional
 
 import gybe.k8s.v1_32.meta.v1
+from gybe.k8s.shared.authorization.v1 import NonResourceAttributes as NonResourceAttributes
+from gybe.k8s.shared.authorization.v1 import NonResourceRule as NonResourceRule
+from gybe.k8s.shared.authorization.v1 import ResourceRule as ResourceRule
+from gybe.k8s.shared.authorization.v1 import SelfSubjectRulesReview as SelfSubjectRulesReview
+from gybe.k8s.shared.authorization.v1 import SelfSubjectRulesReviewSpec as SelfSubjectRulesReviewSpec
+from gybe.k8s.shared.authorization.v1 import SubjectAccessReviewStatus as SubjectAccessReviewStatus
+from gybe.k8s.shared.authorization.v1 import SubjectRulesReviewStatus as SubjectRulesReviewStatus
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
@@ -85,41 +92,12 @@ class LocalSubjectAccessReview(K8sResource):
     """
 
     spec: SubjectAccessReviewSpec
-    apiVersion: Literal['rbac.authorization.k8s.io/v1'] = 'rbac.authorization.k8s.io/v1'
+    apiVersion: Literal['authorization.k8s.io/v1'] = 'authorization.k8s.io/v1'
     kind: Literal['LocalSubjectAccessReview'] = 'LocalSubjectAccessReview'
     metadata: Optional[gybe.k8s.v1_32.meta.v1.ObjectMeta] = None
     status: Optional[SubjectAccessReviewStatus] = None
 
 
-@dataclass
-class NonResourceAttributes(K8sSpec):
-    """NonResourceAttributes includes the authorization attributes available for non-resource requests to the
-    Authorizer interface
-    Attributes:
-        path: Path is the URL path of the request
-        verb: Verb is the standard HTTP verb
-
-    """
-
-    path: Optional[str] = None
-    verb: Optional[str] = None
-
-
-@dataclass
-class NonResourceRule(K8sSpec):
-    """NonResourceRule holds information that describes a rule for the non-resource
-    Attributes:
-        nonResourceURLs: NonResourceURLs is a set of partial urls that a user should have access to.  *s are
-            allowed, but only as the full, final step in the path.  '*' means all.
-        verbs: Verb is a list of kubernetes non-resource API verbs, like: get, post, put, delete, patch, head,
-            options.  '*' means all.
-
-    """
-
-    verbs: List[str]
-    nonResourceURLs: Optional[List[str]] = None
-
-
 @dataclass
 class ResourceAttributes(K8sSpec):
     """ResourceAttributes includes the authorization attributes available for resource requests to the
@@ -157,30 +135,6 @@ class ResourceAttributes(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
-class ResourceRule(K8sSpec):
-    """ResourceRule is the list of actions the subject is allowed to perform on resources. The list ordering
-    isn't significant, may contain duplicates, and possibly be incomplete.
-
-    Attributes:
-        apiGroups: APIGroups is the name of the APIGroup that contains the resources.  If multiple API groups
-            are specified, any action requested against one of the enumerated resources in any API group will
-            be allowed.  '*' means all.
-        resourceNames: ResourceNames is an optional white list of names that the rule applies to.  An empty
-            set means that everything is allowed.  '*' means all.
-        resources: Resources is a list of resources this rule applies to.  '*' means all in the specified
-            apiGroups.  '*/foo' represents the subresource 'foo' for all resources in the specified apiGroups.
-        verbs: Verb is a list of kubernetes resource API verbs, like: get, list, watch, create, update,
-            delete, proxy.  '*' means all.
-
-    """
-
-    verbs: List[str]
-    apiGroups: Optional[List[str]] = None
-    resourceNames: Optional[List[str]] = None
-    resources: Optional[List[str]] = None
-
-
 @dataclass
 class SelfSubjectAccessReview(K8sResource):
     """SelfSubjectAccessReview checks whether or the current user can perform an action.  Not filling in a
@@ -199,7 +153,7 @@ class SelfSubjectAccessReview(K8sResource):
     """
 
     spec: SelfSubjectAccessReviewSpec
-    apiVersion: Literal['rbac.authorization.k8s.io/v1'] = 'rbac.authorization.k8s.io/v1'
+    apiVersion: Literal['authorization.k8s.io/v1'] = 'authorization.k8s.io/v1'
     kind: Literal['SelfSubjectAccessReview'] = 'SelfSubjectAccessReview'
     metadata: Optional[gybe.k8s.v1_32.meta.v1.ObjectMeta] = None
     status: Optional[SubjectAccessReviewStatus] = None
@@ -220,47 +174,6 @@ class SelfSubjectAccessReviewSpec(K8sSpec):
     resourceAttributes: Optional[ResourceAttributes] = None
 
 
-@dataclass
-class SelfSubjectRulesReview(K8sResource):
-    """SelfSubjectRulesReview enumerates the set of actions the current user can perform within a namespace.
-    The returned list of actions may be incomplete depending on the server's authorization mode, and any
-    errors experienced during the evaluation. SelfSubjectRulesReview should be used by UIs to show/hide
-    actions, or to quickly let an end user reason about their permissions. It should NOT Be used by
-    external systems to drive authorization decisions as this raises confused deputy, cache
-    lifetime/revocation, and correctness concerns. SubjectAccessReview, and LocalAccessReview are the
-    correct way to defer authorization decisions to the API server.
-
-    Attributes:
-        apiVersion: APIVersion defines the versioned schema of this representation of an object. Servers
-            should convert recognized schemas to the latest internal value, and may reject unrecognized
-            values.
-        kind: Kind is a string value representing the REST resource this object represents. Servers may infer
-            this from the endpoint the client submits requests to. Cannot be updated. In CamelCase.
-        metadata: Standard list metadata.
-        spec: Spec holds information about the request being evaluated.
-        status: Status is filled in by the server and indicates the set of actions a user can perform.
-
-    """
-
-    spec: SelfSubjectRulesReviewSpec
-    apiVersion: Literal['rbac.authorization.k8s.io/v1'] = 'rbac.authorization.k8s.io/v1'
-    kind: Literal['SelfSubjectRulesReview'] = 'SelfSubjectRulesReview'
-    metadata: Optional[gybe.k8s.v1_32.meta.v1.ObjectMeta] = None
-    status: Optional[SubjectRulesReviewStatus] = None
-
-
-@dataclass
-class SelfSubjectRulesReviewSpec(K8sSpec):
-    """SelfSubjectRulesReviewSpec defines the specification for SelfSubjectRulesReview.
-
-    Attributes:
-        namespace: Namespace to evaluate rules for. Required.
-
-    """
-
-    namespace: Optional[str] = None
-
-
 @dataclass
 class SubjectAccessReview(K8sResource):
     """SubjectAccessReview checks whether or not a user or group can perform an action.
@@ -278,7 +191,7 @@ class SubjectAccessReview(K8sResource):
     """
 
     spec: SubjectAccessReviewSpec
-    apiVersion: Literal['rbac.authorization.k8s.io/v1'] = 'rbac.authorization.k8s.io/v1'
+    apiVersion: Literal['authorization.k8s.io/v1'] = 'authorization.k8s.io/v1'
     kind: Literal['SubjectAccessReview'] = 'SubjectAccessReview'
     metadata: Optional[gybe.k8s.v1_32.meta.v1.ObjectMeta] = None
     status: Optional[SubjectAccessReviewStatus] = None
@@ -307,53 +220,3 @@ class SubjectAccessReviewSpec(K8sSpec):
     resourceAttributes: Optional[ResourceAttributes] = None
     uid: Optional[str] = None
     user: Optional[str] = None
-
-
-@dataclass
-class SubjectAccessReviewStatus(K8sSpec):
-    """SubjectAccessReviewStatus
-    Attributes:
-        allowed: Allowed is required. True if the action would be allowed, false otherwise.
-        denied: Denied is optional. True if the action would be denied, otherwise false. If both allowed is
-            false and denied is false, then the authorizer has no opinion on whether to authorize the action.
-            Denied may not be true if Allowed is true.
-        evaluationError: EvaluationError is an indication that some error occurred during the authorization
-            check. It is entirely possible to get an error and be able to continue determine authorization
-            status in spite of it. For instance, RBAC can be missing a role, but enough roles are still
-            present and bound to reason about the request.
-        reason: Reason is optional.  It indicates why a request was allowed or denied.
-
-    """
-
-    allowed: bool
-    denied: Optional[bool] = None
-    evaluationError: Optional[str] = None
-    reason: Optional[str] = None
-
-
-@dataclass
-class SubjectRulesReviewStatus(K8sSpec):
-    """SubjectRulesReviewStatus contains the result of a rules check. This check can be incomplete depending
-    on the set of authorizers the server is configured with and any errors experienced during evaluation.
-    Because authorization rules are additive, if a rule appears in a list it's safe to assume the subject
-    has that permission, even if that list is incomplete.
-
-    Attributes:
-        evaluationError: EvaluationError can appear in combination with Rules. It indicates an error occurred
-            during rule evaluation, such as an authorizer that doesn't support rule evaluation, and that
-            ResourceRules and/or NonResourceRules may be incomplete.
-        incomplete: Incomplete is true when the rules returned by this call are incomplete. This is most
-            commonly encountered when an authorizer, such as an external authorizer, doesn't support rules
-            evaluation.
-        nonResourceRules: NonResourceRules is the list of actions the subject is allowed to perform on non-
-            resources. The list ordering isn't significant, may contain duplicates, and possibly be
-            incomplete.
-        resourceRules: ResourceRules is the list of actions the subject is allowed to perform on resources.
-            The list ordering isn't significant, may contain duplicates, and possibly be incomplete.
-
-    """
-
-    resourceRules: List[ResourceRule]
-    nonResourceRules: List[NonResourceRule]
-    incomplete: bool
-    evaluationError: Optional[str] = None
@@ -473,7 +473,7 @@ class ResourceClaim(K8sResource):
     """
 
     spec: ResourceClaimSpec
-    apiVersion: Literal['policy/v1beta1'] = 'policy/v1beta1'
+    apiVersion: Literal['resource.k8s.io/v1beta1'] = 'resource.k8s.io/v1beta1'
     kind: Literal['ResourceClaim'] = 'ResourceClaim'
     metadata: Optional[gybe.k8s.v1_32.meta.v1.ObjectMeta] = None
     status: Optional[ResourceClaimStatus] = None
@@ -0,0 +1,153 @@
+"""Load existing YAML or JSON manifests into `gybe.k8s` models.
+
+Documents are read one at a time, from multi-document YAML streams or from JSON streams of
+objects, so large files are never held in memory as a whole. A JSON array is parsed in one
+go, and so is flow style YAML that starts like JSON but does not decode as JSON. Arrays and
+`List` documents, like the output of `kubectl get -o yaml`, are expanded into their items.
+
+Each document is dispatched on its `apiVersion` and `kind` through the version's kind registry,
+see `gybe.k8s.registry`, and built by its model's compiled structure function, see
+`gybe.serialization`. Only the modules of kinds that are actually loaded get imported. Kinds
+the version does not serve, like custom resources, are returned as plain dicts.
+"""
+
+import io
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+import yaml
+
+from gybe.exceptions import InvalidManifestError
+from gybe.k8s.registry import KindInfo, kind_registry
+from gybe.k8s.types import K8sSpec
+from gybe.serialization import StructureFn, make_structure_fn
+from gybe.yaml import TextReader, yaml_load_all
+
+JSON_CHUNK_SIZE = 1 << 16
+_whitespace = re.compile(r'\s*')
+
+
+class _Prefixed:
+    """A text stream with the text already read from its start put back in front."""
+
+    def __init__(self, head: str, stream: TextReader):
+        self._head = head
+        self._stream = stream
+
+    def read(self, size: int = -1) -> str:
+        if not self._head:
+            return self._stream.read(size)
+        text, self._head = (
+            (self._head + self._stream.read(), '') if size < 0 else (self._head[:size], self._head[size:])
+        )
+        return text
+
+
+def load_manifests(
+    source: Union[str, TextReader],
+    version: Optional[str] = None,
+) -> Iterator[Union[K8sSpec, dict[str, Any]]]:
+    """Yield a model for every document of a YAML or JSON manifest, or a dict for unknown kinds.
+
+    `source` is the manifest's text or an open text file, JSON when it starts with `{` or `[`,
+    unless its first document only parses as YAML, like `{kind: Pod, metadata: {name: x}}`.
+    Models come from `version`, the current `gybe.k8s` version by default, see
+    `gybe.k8s.use_version`.
+    Raises `ValueError` for unknown versions, and `InvalidManifestError` for documents that do
+    not parse or do not fit their kind's model, like unknown fields or values of the wrong type,
+    once the loader reaches them. Its message names the document and the path of the field.
+    """
+    registry = kind_registry(version)
+    if isinstance(source, str):
+        read: Callable[[int], str] = io.StringIO().read
+        head = source
+    else:
+        read = source.read
+        head = ''
+        while not head.strip():
+            chunk = read(JSON_CHUNK_SIZE)
+            if not chunk:
+                break
+            head += chunk
+    if head.lstrip()[:1] in ('{', '['):
+        documents = _json_documents(head, read)
+    else:
+        documents = yaml_load_all(head if isinstance(source, str) else _Prefixed(head, source))
+    return _load(_expand(documents), registry)
+
+
+def _json_documents(head: str, read: Callable[[int], str]) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buffer = head
+    decoded = False
+    while True:
+        pos = 0
+        while True:
+            pos = _whitespace.match(buffer, pos).end()  # type: ignore[union-attr]
+            try:
+                document, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            decoded = True
+            yield document
+        buffer = buffer[pos:]
+        # reading as much as is buffered keeps re-parsing a large document linear
+        chunk = read(max(JSON_CHUNK_SIZE, len(buffer)))
+        if not chunk:
+            break
+        buffer += chunk
+    if buffer.strip():
+        if not decoded:
+            # nothing decoded, so the buffer holds the whole text: flow style YAML is not JSON
+            yield from yaml_load_all(buffer)
+            return
+        json.loads(buffer)  # raises the decoder's error for the trailing text
+
+
+def _expand(documents: Iterable[Any]) -> Iterator[Any]:
+    for document in documents:
+        if document is None:
+            continue
+        if isinstance(document, list):
+            yield from _expand(document)
+        elif (
+            isinstance(document, dict)
+            and isinstance(document.get('items'), list)
+            and str(document.get('kind', '')).endswith('List')
+        ):
+            # items of typed lists, like PodList, leave out their own apiVersion and kind
+            kind = document['kind'][: -len('List')]
+            defaults = {'apiVersion': document.get('apiVersion'), 'kind': kind} if kind else {}
+            yield from _expand({**defaults, **i} if isinstance(i, dict) else i for i in document['items'])
+        else:
+            yield document
+
+
+def _load(
+    documents: Iterator[Any], registry: dict[tuple[Any, Any], KindInfo]
+) -> Iterator[Union[K8sSpec, dict[str, Any]]]:
+    structure_fns: dict[tuple[Any, Any], Optional[StructureFn]] = {}
+    index = -1
+    try:
+        for index, document in enumerate(documents):
+            if not isinstance(document, dict):
+                raise InvalidManifestError(index, f'expected a mapping, got {type(document).__name__}')
+            key = (document.get('apiVersion'), document.get('kind'))
+            try:
+                fn = structure_fns[key]
+            except KeyError:
+                info = registry.get(key)
+                fn = structure_fns[key] = None if info is None else make_structure_fn(info.model)
+            if fn is None:
+                yield document
+                continue
+            try:
+                model = fn(document)
+            except (AttributeError, TypeError, ValueError) as exc:
+                name = (document.get('metadata') or {}).get('name')
+                raise InvalidManifestError(index, f'{key[1]}/{name}: {exc}') from exc
+            yield model
+    except (json.JSONDecodeError, yaml.YAMLError) as exc:
+        # raised while reading the document after the last one loaded
+        raise InvalidManifestError(index + 1, f'cannot parse: {exc}') from exc
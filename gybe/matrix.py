@@ -0,0 +1,112 @@
+"""Render one transpiler against several kubernetes versions and report what they lack."""
+
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+from gybe import k8s
+from gybe.exceptions import InvalidInputError
+from gybe.k8s.field_index import load_field_index
+from gybe.rendering import Transpiler, render
+
+# transpiler and values inherited by forked workers, since functions from a chart's
+# `__main__` module cannot be pickled by reference
+_worker_args: Optional[tuple[Transpiler, Mapping[str, Any]]] = None
+
+
+@dataclass
+class MatrixResult:
+    """Outcome of rendering against a single kubernetes version."""
+
+    version: str
+    seconds: float
+    problems: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def check_document(index: dict[str, Any], version: str, document: Mapping[str, Any]) -> list[str]:
+    """Describe every kind and field of a rendered document that a version's index lacks."""
+    api_version, kind = document.get('apiVersion'), document.get('kind')
+    key = index['kinds'].get(f'{api_version}/{kind}')
+    if key is None:
+        return [f'{api_version}/{kind}: kind does not exist in {version}']
+    name = (document.get('metadata') or {}).get('name')
+    problems: list[str] = []
+    _check_fields(index['models'], key, document, '', problems)
+    return [f'{kind}/{name}: field {path} does not exist in {version}' for path in problems]
+
+
+def _check_fields(
+    models: dict[str, dict[str, Optional[str]]],
+    key: str,
+    value: Mapping[str, Any],
+    path: str,
+    problems: list[str],
+) -> None:
+    fields = models[key]
+    for name, item in value.items():
+        if name not in fields:
+            problems.append(path + name)
+            continue
+        ref = fields[name]
+        if ref is None:
+            continue
+        if ref.startswith('[') and isinstance(item, list):
+            for i, element in enumerate(item):
+                if isinstance(element, Mapping):
+                    _check_fields(models, ref[1:-1], element, f'{path}{name}[{i}].', problems)
+        elif isinstance(item, Mapping):
+            _check_fields(models, ref, item, f'{path}{name}.', problems)
+
+
+def render_matrix(
+    transpiler: Transpiler,
+    input_data: Mapping[str, Any],
+    versions: list[str],
+    jobs: int = 1,
+) -> list[MatrixResult]:
+    """Render values against every version package, optionally across forked workers.
+
+    Models the chart looks up as `gybe.k8s.<Model>` come from the version being checked, see
+    `gybe.k8s.use_version`. Every rendered document is then checked against that version's
+    field index.
+    Raises `ValueError` for unknown versions before anything is rendered.
+    """
+    global _worker_args
+
+    versions = [k8s.version_package(v) for v in versions]
+    if jobs <= 1 or len(versions) <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        previous = k8s.current_version()
+        try:
+            return [_render_version(transpiler, input_data, v) for v in versions]
+        finally:
+            k8s.use_version(previous)
+
+    _worker_args = (transpiler, input_data)
+    try:
+        # each worker switches its own gybe.k8s version, leaving this process untouched
+        with multiprocessing.get_context('fork').Pool(min(jobs, len(versions))) as pool:
+            return pool.map(_render_worker_version, versions)
+    finally:
+        _worker_args = None
+
+
+def _render_worker_version(version: str) -> MatrixResult:
+    if _worker_args is None:  # pragma: no cover
+        raise RuntimeError('matrix worker started without a transpiler')
+    return _render_version(*_worker_args, version)
+
+
+def _render_version(transpiler: Transpiler, input_data: Mapping[str, Any], version: str) -> MatrixResult:
+    start = time.perf_counter()
+    k8s.use_version(version)
+    try:
+        documents = render(transpiler, input_data)
+    except InvalidInputError as exc:
+        return MatrixResult(version, time.perf_counter() - start, error='; '.join(exc.errors))
+    except Exception as exc:
+        return MatrixResult(version, time.perf_counter() - start, error=f'{type(exc).__name__}: {exc}')
+    index = load_field_index(version)
+    problems = [p for d in documents for p in check_document(index, version, d)]
+    return MatrixResult(version, time.perf_counter() - start, problems)
@@ -4,10 +4,10 @@ import inspect
 from dataclasses import make_dataclass
 from typing import Any, Callable, Union
 
-from gybe.k8s.types import Manifest
+from gybe.k8s.types import Manifest, ManifestIterator
 
 
-def create_input_model(func: Callable[..., Manifest]) -> type:
+def create_input_model(func: Callable[..., Union[Manifest, ManifestIterator]]) -> type:
     """Create dataclass input model from a decorated function."""
     argspec = inspect.getfullargspec(func)
     if argspec.defaults:
@@ -0,0 +1,144 @@
+"""Render transpiler functions into kubernetes manifests."""
+
+import inspect
+import io
+import json
+from dataclasses import fields
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Protocol, Union
+from weakref import WeakKeyDictionary
+
+from cattrs import Converter, transform_error
+
+from gybe.exceptions import InvalidInputError, InvalidOutputError
+from gybe.k8s.types import K8sResource, K8sSpec, Manifest, ManifestIterator
+from gybe.modeling import create_input_model
+from gybe.serialization import make_unstructure_fn, unstructure
+from gybe.yaml import yaml_dumps
+
+_c = Converter()
+_c.register_unstructure_hook_factory(
+    lambda t: inspect.isclass(t) and issubclass(t, K8sSpec),
+    make_unstructure_fn,
+)
+
+
+class TextWriter(Protocol):
+    """Where rendered manifests are written, like `sys.stdout` or an open text file."""
+
+    def write(self, s: str, /) -> int:
+        """Write text."""
+
+    def flush(self) -> None:
+        """Flush buffered text."""
+
+
+# input models do not refer to their function, so an entry goes away with its function
+_input_models: WeakKeyDictionary[Callable[..., Any], type] = WeakKeyDictionary()
+
+
+def _input_model(function: Callable[..., Any]) -> type:
+    try:
+        return _input_models[function]
+    except KeyError:
+        model = _input_models[function] = create_input_model(function)
+        return model
+
+
+class Transpiler:
+    """A transpiler function with its input model and structure hook built once, up front."""
+
+    def __init__(self, function: Callable[..., Union[Manifest, ManifestIterator]]):
+        """Initialize a Transpiler.
+
+        Attributes
+        ----------
+        function: The decorated function that returns or yields kubernetes resources.
+
+        """
+        self.function = function
+        self.input_model = _input_model(function)
+        self._input_fields = [field.name for field in fields(self.input_model)]
+        self._structure = _c.get_structure_hook(self.input_model)
+
+    def structure_inputs(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Validate values against the function's signature and return its keyword arguments."""
+        try:
+            input_obj = self._structure(input_data, self.input_model)
+        except Exception as exc:
+            raise InvalidInputError(transform_error(exc)) from exc
+        return {name: getattr(input_obj, name) for name in self._input_fields}
+
+    def render_to_stream(self, input_data: dict[str, Any], output: TextWriter) -> None:
+        """Run the function on parsed values and stream its manifest to `output`."""
+        manifest = self.function(**self.structure_inputs(input_data))
+        write_manifest(validate_manifest(manifest), output)
+
+
+def validate_manifest(manifest: Union[Manifest, ManifestIterator]) -> Iterable[K8sResource]:
+    """Check a transpiler's output, resource by resource when it is a generator."""
+    if isinstance(manifest, list):
+        for resource in manifest:
+            if not isinstance(resource, K8sResource):
+                raise InvalidOutputError()
+        return manifest
+    elif isinstance(manifest, Iterator):
+        return _validate_resources(manifest)
+    raise InvalidOutputError()
+
+
+def _validate_resources(resources: ManifestIterator) -> ManifestIterator:
+    for resource in resources:
+        if not isinstance(resource, K8sResource):
+            raise InvalidOutputError()
+        yield resource
+
+
+def write_manifest(manifest: Iterable[K8sResource], output: TextWriter) -> None:
+    """Unstructure and write one YAML document at a time, so only one is held in memory."""
+    for i, resource in enumerate(manifest):
+        if i:
+            output.write('---\n')
+        output.write(yaml_dumps(unstructure(resource)))
+    output.write('\n')
+    output.flush()
+
+
+def as_transpiler(transpiler: Any) -> Transpiler:
+    """Get the `Transpiler` for a `@gybe.transpiler` command, a `Transpiler` or a plain function.
+
+    Plain functions are wrapped on every call, reusing the input model built on their first one.
+    """
+    if isinstance(transpiler, Transpiler):
+        return transpiler
+    bound = getattr(transpiler, 'transpiler', None)
+    if isinstance(bound, Transpiler):
+        return bound
+    return Transpiler(transpiler)
+
+
+def render(transpiler: Any, values: Optional[Mapping[str, Any]] = None) -> list[dict[str, Any]]:
+    """Render values with a transpiler in-process and return the manifest as dicts.
+
+    Raises `InvalidInputError` when the values do not match the transpiler's inputs and
+    `InvalidOutputError` when it returns anything but kubernetes resources.
+    """
+    t = as_transpiler(transpiler)
+    manifest = t.function(**t.structure_inputs(dict(values or {})))
+    return [unstructure(r) for r in validate_manifest(manifest)]
+
+
+def render_yaml(transpiler: Any, values: Optional[Mapping[str, Any]] = None) -> str:
+    """Render values with a transpiler in-process and return the same YAML as the CLI."""
+    output = io.StringIO()
+    as_transpiler(transpiler).render_to_stream(dict(values or {}), output)
+    return output.getvalue()
+
+
+def render_json(
+    transpiler: Any,
+    values: Optional[Mapping[str, Any]] = None,
+    indent: Optional[int] = None,
+) -> str:
+    """Render values with a transpiler in-process and return the manifest as a JSON `v1` List."""
+    items = render(transpiler, values)
+    return json.dumps({'apiVersion': 'v1', 'kind': 'List', 'items': items}, indent=indent)
@@ -0,0 +1,270 @@
+"""Compiled structure and unstructure functions for kubernetes models.
+
+Each `K8sSpec` dataclass gets a specialized function, built once and cached, that reads its
+fields by name, skips `None` values and calls straight into the functions of nested models.
+Structuring goes the other way, from parsed JSON data into models. Keys a model has no field
+for, missing required fields and values of the wrong type or shape raise `StructureError` with
+the path of the field, while JSON typed fields keep the parsed values as they are. `str` fields
+also take ints, since int-or-string fields are generated as `str`.
+"""
+
+import collections.abc
+from dataclasses import MISSING, fields
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Mapping,
+    Optional,
+    TypeAlias,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from gybe.exceptions import StructureError
+from gybe.k8s.types import K8sSpec
+
+UnstructureFn: TypeAlias = Callable[[Any], dict[str, Any]]
+StructureFn: TypeAlias = Callable[[Mapping[str, Any]], Any]
+
+_primitive_types = (str, int, float, bool)
+_unstructure_fns: dict[type, UnstructureFn] = {}
+_structure_fns: dict[type, StructureFn] = {}
+
+
+def unstructure(obj: Any) -> Any:
+    """Convert a model, or JSON data containing models, into plain dicts and lists."""
+    fn = _unstructure_fns.get(obj.__class__)
+    if fn is not None:
+        return fn(obj)
+    if isinstance(obj, K8sSpec):
+        return make_unstructure_fn(obj.__class__)(obj)
+    if isinstance(obj, (list, tuple)):
+        return [unstructure(v) for v in obj]
+    if isinstance(obj, Mapping):
+        return {k: unstructure(v) for k, v in obj.items()}
+    return obj
+
+
+def make_unstructure_fn(cls: type) -> UnstructureFn:
+    """Get the cached unstructure function for a model class, compiling it on first use."""
+    fn = _unstructure_fns.get(cls)
+    if fn is None:
+        fn, nested_classes = _compile_unstructure_fn(cls)
+        # registered before compiling nested models so self-referencing models terminate
+        _unstructure_fns[cls] = fn
+        for nested_cls in nested_classes:
+            make_unstructure_fn(nested_cls)
+    return fn
+
+
+def _compile_unstructure_fn(cls: type) -> tuple[UnstructureFn, set[type]]:
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        # unresolvable annotations fall back to runtime dispatch for every field
+        hints = {}
+
+    namespace: dict[str, Any] = {'fns': _unstructure_fns, 'unstructure': unstructure}
+    nested_classes: set[type] = set()
+    lines = ['def unstructure_model(obj):', '    d = {}']
+    for f in fields(cls):
+        field_type = _strip_optional(hints.get(f.name, Any))
+        kind, nested_cls = _field_kind(field_type)
+        if nested_cls is not None:
+            nested_classes.add(nested_cls)
+            namespace[f'cls_{f.name}'] = nested_cls
+        if kind == 'value':
+            expr = 'v'
+        elif kind == 'list':
+            # only lists are copied, so a str passed to a list field is left as it is
+            expr = 'list(v) if v.__class__ is list or v.__class__ is tuple else v'
+        elif kind == 'model':
+            expr = f'fns[cls_{f.name}](v) if v.__class__ is cls_{f.name} else unstructure(v)'
+        elif kind == 'model_list':
+            expr = f'[fns[cls_{f.name}](i) if i.__class__ is cls_{f.name} else unstructure(i) for i in v]'
+        else:
+            expr = 'unstructure(v)'
+        lines += [
+            f'    v = obj.{f.name}',
+            '    if v is not None:',
+            f'        d[{f.name!r}] = {expr}',
+        ]
+    lines.append('    return d')
+
+    exec(compile('\n'.join(lines), f'<unstructure {cls.__qualname__}>', 'exec'), namespace)  # noqa: S102
+    return namespace['unstructure_model'], nested_classes
+
+
+def structure(data: Mapping[str, Any], cls: type) -> Any:
+    """Build a model, and the models nested in it, from parsed JSON data."""
+    fn = _structure_fns.get(cls)
+    if fn is None:
+        fn = make_structure_fn(cls)
+    return fn(data)
+
+
+def make_structure_fn(cls: type) -> StructureFn:
+    """Get the cached structure function for a model class, compiling it on first use."""
+    fn = _structure_fns.get(cls)
+    if fn is None:
+        fn, nested_classes = _compile_structure_fn(cls)
+        # registered before compiling nested models so self-referencing models terminate
+        _structure_fns[cls] = fn
+        for nested_cls in nested_classes:
+            make_structure_fn(nested_cls)
+    return fn
+
+
+def _compile_structure_fn(cls: type) -> tuple[StructureFn, set[type]]:
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        # unresolvable annotations keep every field's parsed value as it is
+        hints = {}
+
+    namespace: dict[str, Any] = {
+        'fns': _structure_fns,
+        'cls': cls,
+        'names': frozenset(f.name for f in fields(cls)),
+        'Mapping': collections.abc.Mapping,
+        'StructureError': StructureError,
+        'check_list': _check_list,
+        'structure_list': _structure_list,
+        'type_error': _type_error,
+    }
+    nested_classes: set[type] = set()
+    lines = [
+        'def structure_model(d):',
+        '    if d.__class__ is not dict and not isinstance(d, Mapping):',
+        "        raise type_error('a mapping', d)",
+        '    kwargs = {}',
+    ]
+    for f in fields(cls):
+        field_type = _strip_optional(hints.get(f.name, Any))
+        kind, nested_cls = _field_kind(field_type)
+        if nested_cls is not None:
+            nested_classes.add(nested_cls)
+            namespace[f'cls_{f.name}'] = nested_cls
+        lines += [f'    v = d.get({f.name!r})', '    if v is not None:']
+        if kind == 'value':
+            value_type = _value_type(field_type)
+            namespace[f'check_{f.name}'] = _value_checks[value_type]
+            lines += [
+                f'        if v.__class__ is not {value_type.__name__} and not check_{f.name}(v):',
+                f'            raise type_error({value_type.__name__!r}, v, {f.name!r})',
+                f'        kwargs[{f.name!r}] = v',
+            ]
+        elif kind == 'list':
+            namespace[f'item_type_{f.name}'] = get_args(field_type)[0]
+            lines.append(f'        kwargs[{f.name!r}] = check_list(item_type_{f.name}, v, {f.name!r})')
+        elif kind == 'model':
+            lines += [
+                '        try:',
+                f'            kwargs[{f.name!r}] = fns[cls_{f.name}](v)',
+                '        except StructureError as e:',
+                f'            raise StructureError(e.reason, ({f.name!r}, *e.path)) from None',
+            ]
+        elif kind == 'model_list':
+            lines.append(f'        kwargs[{f.name!r}] = structure_list(fns[cls_{f.name}], v, {f.name!r})')
+        elif field_type is dict or get_origin(field_type) in (dict, collections.abc.Mapping):
+            lines += [
+                '        if v.__class__ is not dict and not isinstance(v, Mapping):',
+                f"            raise type_error('a mapping', v, {f.name!r})",
+                f'        kwargs[{f.name!r}] = v',
+            ]
+        else:
+            lines.append(f'        kwargs[{f.name!r}] = v')
+        if f.default is MISSING and f.default_factory is MISSING:
+            lines += ['    else:', f"        raise StructureError('missing required field', ({f.name!r},))"]
+    lines += [
+        # keys left over are either None values or keys the model has no field for
+        '    if len(d) > len(kwargs):',
+        '        unknown = d.keys() - names',
+        '        if unknown:',
+        "            raise StructureError('unknown field', (min(map(str, unknown)),))",
+        '    return cls(**kwargs)',
+    ]
+
+    exec(compile('\n'.join(lines), f'<structure {cls.__qualname__}>', 'exec'), namespace)  # noqa: S102
+    return namespace['structure_model'], nested_classes
+
+
+def _is_str(v: Any) -> bool:
+    return isinstance(v, (str, int)) and not isinstance(v, bool)
+
+
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+_value_checks: dict[type, Callable[[Any], bool]] = {
+    str: _is_str,
+    int: _is_int,
+    float: _is_number,
+    bool: lambda v: isinstance(v, bool),
+}
+
+
+def _value_type(t: Any) -> type:
+    """Return the primitive type of a `value` field, the type of its values for `Literal` fields."""
+    # a document's apiVersion and kind already picked its model, so only their type is checked
+    return type(get_args(t)[0]) if get_origin(t) is Literal else t
+
+
+def _type_error(expected: str, v: Any, name: Optional[str] = None) -> StructureError:
+    return StructureError(f'expected {expected}, got {type(v).__name__}', () if name is None else (name,))
+
+
+def _check_list(item_type: type, v: Any, name: str) -> list[Any]:
+    """Copy a list of primitive values, after checking the type of every item."""
+    if v.__class__ is not list:
+        raise _type_error(f'a list of {item_type.__name__}', v, name)
+    check = _value_checks[item_type]
+    for index, item in enumerate(v):
+        if item.__class__ is not item_type and not check(item):
+            raise StructureError(f'expected {item_type.__name__}, got {type(item).__name__}', (name, index))
+    return list(v)
+
+
+def _structure_list(structure_item: StructureFn, v: Any, name: str) -> list[Any]:
+    """Structure every item of a list of models, locating the item that does not fit."""
+    if v.__class__ is not list:
+        raise _type_error('a list', v, name)
+    items = []
+    for index, item in enumerate(v):
+        try:
+            items.append(structure_item(item))
+        except StructureError as e:
+            raise StructureError(e.reason, (name, index, *e.path)) from None
+    return items
+
+
+def _strip_optional(t: Any) -> Any:
+    if get_origin(t) in (Union, UnionType):
+        args = [a for a in get_args(t) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return t
+
+
+def _field_kind(t: Any) -> tuple[str, Optional[type]]:
+    """Classify a resolved field type as `value`, `list`, `model`, `model_list` or `any`."""
+    if t in _primitive_types or get_origin(t) is Literal:
+        return 'value', None
+    if isinstance(t, type) and issubclass(t, K8sSpec):
+        return 'model', t
+    if get_origin(t) is list:
+        (item_type,) = get_args(t) or (Any,)
+        if item_type in _primitive_types:
+            return 'list', None
+        if isinstance(item_type, type) and issubclass(item_type, K8sSpec):
+            return 'model_list', item_type
+    return 'any', None
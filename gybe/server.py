@@ -0,0 +1,244 @@
+"""Long-running render server that keeps charts and models loaded between renders."""
+
+import errno
+import hashlib
+import http.server
+import importlib.util
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+from gybe.decorators import TranspilerGroup
+from gybe.exceptions import InvalidInputError, TranspilerError
+from gybe.rendering import Transpiler, render_json, render_yaml
+from gybe.yaml import yaml_loads
+
+
+class ChartNotFoundError(KeyError):
+    """Raised when a render request names a chart that is not loaded."""
+
+
+class _ChartModule:
+    def __init__(self, path: Path):
+        self.path = path
+        self.stamp: Optional[tuple[int, int]] = None
+        self.transpilers: dict[str, Transpiler] = {}
+
+    def current_stamp(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> None:
+        stamp = self.current_stamp()
+        module = _import_chart(self.path)
+        self.transpilers = {
+            value.name: value.transpiler
+            for value in vars(module).values()
+            if isinstance(value, TranspilerGroup) and value.name is not None
+        }
+        self.stamp = stamp
+
+
+class ChartRegistry:
+    """Charts loaded from python files, each reloaded only when its source file changes.
+
+    A chart is any `@gybe.transpiler` function defined in one of the files, looked up by its
+    function name.
+    """
+
+    def __init__(self, paths: list[Path]):
+        """Initialize a ChartRegistry and load every chart file."""
+        self._lock = threading.Lock()
+        self._modules = [_ChartModule(p.resolve()) for p in paths]
+        self._names: dict[str, _ChartModule] = {}
+        with self._lock:
+            for module in self._modules:
+                self._load(module)
+
+    def names(self) -> list[str]:
+        """Names of every loaded chart."""
+        with self._lock:
+            for module in self._modules:
+                self._reload_if_changed(module)
+            return sorted(self._names)
+
+    def get(self, name: str) -> Transpiler:
+        """Get a chart's transpiler, reloading its module first if the file changed."""
+        with self._lock:
+            try:
+                module = self._names[name]
+            except KeyError:
+                raise ChartNotFoundError(name) from None
+            self._reload_if_changed(module)
+            try:
+                return module.transpilers[name]
+            except KeyError:
+                raise ChartNotFoundError(name) from None
+
+    def _reload_if_changed(self, module: _ChartModule) -> None:
+        if module.current_stamp() != module.stamp:
+            self._load(module)
+
+    def _load(self, module: _ChartModule) -> None:
+        module.load()
+        for name, owner in list(self._names.items()):
+            if owner is module and name not in module.transpilers:
+                del self._names[name]
+        for name in module.transpilers:
+            owner = self._names.setdefault(name, module)
+            if owner is not module:
+                raise ValueError(f'chart {name!r} is defined in both {owner.path} and {module.path}')
+
+
+def _import_chart(path: Path) -> ModuleType:
+    # charts may import helper modules that live next to them
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    # keyed on the resolved path, so charts with the same file name in two directories coexist
+    digest = hashlib.sha256(str(path).encode()).hexdigest()[:16]
+    spec = importlib.util.spec_from_file_location(f'_gybe_chart_{path.stem}_{digest}', path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f'cannot load chart from {path}')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class RenderRequestHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP API of the render server.
+
+    `GET /charts` lists the loaded charts and `POST /render/<chart>` renders the YAML or JSON
+    values document in the request body, returning YAML, or a JSON `v1` List when the request
+    has `?format=json`.
+    """
+
+    server: Union['RenderHTTPServer', 'UnixRenderHTTPServer']
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802
+        """List charts or report health."""
+        path = urlparse(self.path).path
+        if path == '/charts':
+            try:
+                names = self.server.registry.names()
+            except Exception as exc:
+                # a chart that fails to reload
+                self._send_error(500, f'{type(exc).__name__}: {exc}')
+                return
+            self._send(200, 'application/json', json.dumps({'charts': names}))
+        elif path == '/healthz':
+            self._send(200, 'text/plain', 'ok\n')
+        else:
+            self._send_error(404, f'unknown path {path}')
+
+    def do_POST(self):  # noqa: N802
+        """Render a chart with the values in the request body."""
+        url = urlparse(self.path)
+        prefix = '/render/'
+        if not url.path.startswith(prefix):
+            self._send_error(404, f'unknown path {url.path}')
+            return
+        name = url.path[len(prefix) :]
+        as_json = parse_qs(url.query).get('format') == ['json']
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        try:
+            values = yaml_loads(body.decode()) or dict()
+        except (UnicodeDecodeError, yaml.YAMLError) as exc:
+            self._send_error(400, f'invalid values document: {exc}')
+            return
+        if not isinstance(values, dict):
+            self._send_error(400, f'values must be a mapping, got {type(values).__name__}')
+            return
+        try:
+            transpiler = self.server.registry.get(name)
+            if as_json:
+                self._send(200, 'application/json', render_json(transpiler, values))
+            else:
+                self._send(200, 'application/yaml', render_yaml(transpiler, values))
+        except ChartNotFoundError:
+            self._send_error(404, f'unknown chart {name}')
+        except InvalidInputError as exc:
+            self._send_error(422, 'validation errors', errors=exc.errors)
+        except TranspilerError as exc:
+            self._send_error(500, str(exc))
+        except Exception as exc:
+            self._send_error(500, f'{type(exc).__name__}: {exc}')
+
+    def address_string(self) -> str:
+        """Describe Unix socket clients, which have no address, for request logs."""
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return 'unix'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log requests unless the server is quiet."""
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_error(self, status: int, message: str, **details: Any) -> None:
+        self._send(status, 'application/json', json.dumps({'error': message, **details}))
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class RenderHTTPServer(http.server.ThreadingHTTPServer):
+    """Render server listening on a TCP address, one thread per request."""
+
+    def __init__(self, address: tuple[str, int], registry: ChartRegistry, quiet: bool = False):
+        """Initialize a RenderHTTPServer."""
+        self.registry = registry
+        self.quiet = quiet
+        super().__init__(address, RenderRequestHandler)
+
+
+class UnixRenderHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Render server listening on a Unix domain socket, one thread per request."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, registry: ChartRegistry, quiet: bool = False):
+        """Initialize a UnixRenderHTTPServer, replacing a stale socket file.
+
+        Raises `FileExistsError` when something other than a socket is at `socket_path`, and
+        `OSError` with `errno.EADDRINUSE` when a running server still accepts connections on it.
+        """
+        self.registry = registry
+        self.quiet = quiet
+        try:
+            mode = socket_path.lstat().st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f'{socket_path} exists and is not a socket')
+            if _accepts_connections(socket_path):
+                raise OSError(errno.EADDRINUSE, f'{socket_path} is already in use by a running server')
+            socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), RenderRequestHandler)
+
+
+def _accepts_connections(socket_path: Path) -> bool:
+    # only a refused connection tells the socket is stale, anything else may be a live server
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
@@ -0,0 +1,137 @@
+"""Per-phase wall time and memory allocation for a single render."""
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from gybe.rendering import TextWriter, Transpiler, validate_manifest
+from gybe.serialization import unstructure
+from gybe.yaml import yaml_dumps, yaml_loads
+
+PHASES = ('yaml_loads', 'structure', 'transpile', 'unstructure', 'yaml_dumps', 'write')
+
+
+@dataclass
+class PhaseTiming:
+    """Time and memory spent in one phase of a render, as traced by `tracemalloc`.
+
+    `net_allocated_bytes` is what the phase kept allocated, negative when it freed more than it
+    kept. `peak_allocated_bytes` is the most the phase had allocated at once over any of its
+    calls, so it includes memory allocated and freed again within the phase. Python does not
+    count individual allocations, so the peak stands in for them.
+    """
+
+    seconds: float = 0.0
+    net_allocated_bytes: int = 0
+    peak_allocated_bytes: int = 0
+    calls: int = 0
+
+
+@dataclass
+class RenderTimings:
+    """Timings of every render phase, plus unstructuring and YAML emission per resource kind.
+
+    A phase's `calls` counts the blocks timed for it, a kind's `calls` its rendered resources.
+    """
+
+    phases: dict[str, PhaseTiming] = field(default_factory=lambda: {p: PhaseTiming() for p in PHASES})
+    kinds: dict[str, PhaseTiming] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @contextmanager
+    def phase(self, name: str, kind: Optional[str] = None) -> Iterator[None]:
+        """Add the time and allocations of the block to phase `name`, and to `kind` if given.
+
+        Allocations are only measured while `tracemalloc` is tracing, and count as 0 otherwise.
+        """
+        start_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            size, peak = tracemalloc.get_traced_memory()
+            timings = [self.phases[name]]
+            if kind is not None:
+                timings.append(self.kinds.setdefault(kind, PhaseTiming()))
+            for t in timings:
+                t.seconds += seconds
+                t.net_allocated_bytes += size - start_size
+                t.peak_allocated_bytes = max(t.peak_allocated_bytes, peak - start_size)
+            self.phases[name].calls += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the timings as plain data, for JSON output."""
+        return {
+            'seconds': self.seconds,
+            'phases': {name: asdict(t) for name, t in self.phases.items()},
+            'kinds': {name: asdict(t) for name, t in sorted(self.kinds.items())},
+        }
+
+
+def timed_render(
+    transpiler: Transpiler,
+    values: str,
+    output: TextWriter,
+    profile_path: Optional[Path] = None,
+) -> RenderTimings:
+    """Render a values document like the CLI does, timing each phase.
+
+    Writes the same manifest as `Transpiler.render_to_stream`. Allocations are traced with
+    `tracemalloc`, which slows every phase down, as does cProfile when `profile_path` is given
+    and the stats are dumped there for `pstats`.
+    """
+    timings = RenderTimings()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        if profile_path is None:
+            _render(transpiler, values, output, timings)
+        else:
+            profiler = cProfile.Profile()
+            profiler.runcall(_render, transpiler, values, output, timings)
+            profiler.dump_stats(profile_path)
+    finally:
+        timings.seconds = time.perf_counter() - start
+        if not tracing:
+            tracemalloc.stop()
+    return timings
+
+
+def _render(transpiler: Transpiler, values: str, output: TextWriter, timings: RenderTimings) -> None:
+    with timings.phase('yaml_loads'):
+        input_data = yaml_loads(values) or dict()
+    with timings.phase('structure'):
+        kwargs = transpiler.structure_inputs(input_data)
+    with timings.phase('transpile'):
+        resources = iter(validate_manifest(transpiler.function(**kwargs)))
+
+    first = True
+    while True:
+        # a generator transpiler does its work as each resource is pulled
+        with timings.phase('transpile'):
+            resource = next(resources, None)
+        if resource is None:
+            break
+        kind = type(resource).__name__
+        timings.kinds.setdefault(kind, PhaseTiming()).calls += 1
+        with timings.phase('unstructure', kind):
+            document = unstructure(resource)
+        with timings.phase('yaml_dumps', kind):
+            text = yaml_dumps(document)
+        with timings.phase('write'):
+            if not first:
+                output.write('---\n')
+            output.write(text)
+        first = False
+
+    with timings.phase('write'):
+        output.write('\n')
+        output.flush()
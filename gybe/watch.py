@@ -0,0 +1,168 @@
+"""Re-render a chart whenever its values file or source files change."""
+
+import importlib
+import importlib.util
+import re
+import sys
+import time
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+from gybe.cache import chart_source_files
+from gybe.exceptions import InvalidInputError
+from gybe.rendering import Transpiler, render
+from gybe.yaml import yaml_dumps, yaml_loads
+
+
+def document_file_names(documents: list[dict[str, Any]]) -> list[str]:
+    """Stable `<kind>-<namespace>-<name>.yaml` file names, one per manifest document."""
+    names = []
+    seen: dict[str, int] = {}
+    for i, d in enumerate(documents):
+        metadata = d.get('metadata') or {}
+        parts = [d.get('kind') or 'document', metadata.get('namespace'), metadata.get('name') or str(i)]
+        stem = re.sub(r'[^a-z0-9.-]+', '-', '-'.join(str(p) for p in parts if p).lower())
+        seen[stem] = seen.get(stem, 0) + 1
+        names.append(f'{stem}.yaml' if seen[stem] == 1 else f'{stem}-{seen[stem]}.yaml')
+    return names
+
+
+class DocumentDirectory:
+    """Writes each manifest document to its own file, touching only documents that changed."""
+
+    def __init__(self, directory: Path):
+        """Initialize a DocumentDirectory, created on first write."""
+        self.directory = directory
+        self._written: dict[Path, str] = {}
+
+    def write(self, documents: list[dict[str, Any]]) -> list[Path]:
+        """Write changed documents, remove documents no longer rendered and return changed paths."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        changed = []
+        written = {}
+        for name, d in zip(document_file_names(documents), documents):
+            path = self.directory / name
+            text = yaml_dumps(d)
+            written[path] = text
+            if self._written.get(path) != text and not _has_content(path, text):
+                path.write_text(text)
+                changed.append(path)
+        for path in self._written.keys() - written.keys():
+            path.unlink(missing_ok=True)
+            changed.append(path)
+        self._written = written
+        return changed
+
+
+class ChartWatcher:
+    """Polls a values file and a chart's source files and re-renders when any of them change.
+
+    Changed local helper modules are reloaded and the chart module re-executed, so the loop
+    costs milliseconds instead of a new process. Polling file stamps is used rather than
+    inotify, which has no standard library binding.
+    """
+
+    def __init__(
+        self,
+        transpiler: Transpiler,
+        values_path: Path,
+        write: Callable[[list[dict[str, Any]]], None],
+        log: Callable[[str], None] = print,
+    ):
+        """Initialize a ChartWatcher.
+
+        Attributes
+        ----------
+        transpiler: Transpiler to render, replaced whenever the chart module is re-executed.
+        values_path: Values file to render.
+        write: Called with the rendered documents after every successful render.
+        log: Called with status and error messages.
+
+        """
+        self.transpiler = transpiler
+        self.values_path = values_path
+        self.write = write
+        self.log = log
+        self._stamps: dict[Path, Optional[int]] = {}
+
+    def watched_paths(self) -> list[Path]:
+        """List the values file, the chart module and its local helper modules."""
+        return [self.values_path.resolve(), *chart_source_files(self.transpiler.function)]
+
+    def poll(self) -> bool:
+        """Re-render if any watched file changed since the last poll and return whether it did."""
+        stamps = {p: _mtime_ns(p) for p in self.watched_paths()}
+        changed = [p for p, stamp in stamps.items() if self._stamps.get(p, -1) != stamp]
+        first_poll = not self._stamps
+        self._stamps = stamps
+        if not changed:
+            return False
+
+        sources = [p for p in changed if p != self.values_path.resolve()]
+        try:
+            if sources and not first_poll:
+                self._reload(sources)
+            input_data = yaml_loads(self.values_path.read_text()) or dict()
+            self.write(render(self.transpiler, input_data))
+        except InvalidInputError as exc:
+            self.log(str(exc))
+        except Exception:
+            self.log(traceback.format_exc())
+        # files imported by the reloaded chart are watched from the next poll on
+        self._stamps.update({p: _mtime_ns(p) for p in self.watched_paths() if p not in self._stamps})
+        return True
+
+    def run(self, interval: float = 0.5) -> None:
+        """Poll until interrupted."""
+        while True:
+            self.poll()
+            time.sleep(interval)
+
+    def _reload(self, changed: list[Path]) -> None:
+        chart_module = sys.modules[self.transpiler.function.__module__]
+        for module in list(sys.modules.values()):
+            file = getattr(module, '__file__', None)
+            if module is not chart_module and file is not None and Path(file).resolve() in changed:
+                importlib.reload(module)
+        # the chart module is re-executed even when only a helper changed, so names it
+        # imported from the helper are bound to the reloaded definitions
+        name = self.transpiler.function.__name__
+        self.transpiler = _find_transpiler(_rerun_module(chart_module), name)
+        self.log(f'reloaded {", ".join(str(p) for p in changed)}')
+
+
+def _rerun_module(module: ModuleType) -> dict[str, Any]:
+    # executed into a fresh module rather than reloaded in place, so names removed from the
+    # chart do not linger, and a chart run as a script gets a copy that later changes can replace
+    name = '__gybe_watch__' if module.__name__ == '__main__' else module.__name__
+    spec = importlib.util.spec_from_file_location(name, str(module.__file__))
+    if spec is None or spec.loader is None:  # pragma: no cover
+        raise ImportError(f'cannot reload chart from {module.__file__}')
+    fresh = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fresh)
+    sys.modules[name] = fresh
+    return vars(fresh)
+
+
+def _find_transpiler(namespace: dict[str, Any], name: str) -> Transpiler:
+    for value in namespace.values():
+        transpiler = getattr(value, 'transpiler', None)
+        if isinstance(transpiler, Transpiler) and getattr(value, 'name', None) == name:
+            return transpiler
+    raise LookupError(f'transpiler {name!r} no longer defined')
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _has_content(path: Path, text: str) -> bool:
+    try:
+        return path.read_text() == text
+    except FileNotFoundError:
+        return False
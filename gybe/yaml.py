@@ -1,15 +1,56 @@
-"""Read and write YAML."""
+"""Read and write YAML.
 
-from typing import Any
+Uses PyYAML's libyaml bindings when PyYAML was built with them and falls back to the pure
+Python implementation otherwise. Both backends emit byte-identical output for the options
+used here; `YAML_BACKEND` names the active one for diagnostics.
+"""
+
+from typing import Any, Iterator, Literal, Protocol, Union
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+
+    YAML_BACKEND: Literal['libyaml', 'python'] = 'libyaml'
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+    YAML_BACKEND = 'python'
+
+
+class TextReader(Protocol):
+    """Where YAML is read from, like `sys.stdin` or an open text file."""
+
+    def read(self, size: int = -1, /) -> str:
+        """Read at most `size` characters, or everything that is left."""
+
+
+# `allow_unicode` must stay off: libyaml escapes astral-plane characters when it is enabled
+_dump_options: dict[str, Any] = dict(default_flow_style=False)
+
 
 def yaml_dumps(d: dict[str, Any]) -> str:
     """Write dict to YAML str"""
-    return yaml.dump(d, default_flow_style=False)
+    return yaml.dump(d, Dumper=_Dumper, **_dump_options)
 
 
 def yaml_loads(s: str) -> dict[str, Any]:
     """Read dict from YAML str"""
-    return yaml.safe_load(s)
+    return yaml.load(s, Loader=_Loader)
+
+
+class _ManifestLoader(_Loader):
+    """Read timestamps as the strings they are in kubernetes, so they are written back unchanged."""
+
+    yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag != 'tag:yaml.org,2002:timestamp']
+        for first, resolvers in _Loader.yaml_implicit_resolvers.items()
+    }
+
+
+def yaml_load_all(stream: Union[str, TextReader]) -> Iterator[Any]:
+    """Read every document of a YAML manifest stream, parsing each one only when it is reached"""
+    return yaml.load_all(stream, Loader=_ManifestLoader)
@@ -0,0 +1,57 @@
+import pytest
+from click.testing import CliRunner
+
+from tests.test_example import (
+    EXPECTED_TWO_POD_MANIFEST,
+    INVALID_TWO_POD_YAML,
+    VALID_TWO_POD_YAML,
+    two_pods,
+)
+
+
+@pytest.fixture
+def values_dir(tmp_path):
+    values = tmp_path / 'values'
+    values.mkdir()
+    (values / 'a.yaml').write_text(VALID_TWO_POD_YAML)
+    (values / 'b.yaml').write_text(VALID_TWO_POD_YAML)
+    (values / 'invalid.yaml').write_text(INVALID_TWO_POD_YAML)
+    return values
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_render_many_writes_one_manifest_per_values_file(tmp_path, values_dir, jobs):
+    out_dir = tmp_path / 'build'
+    files = sorted(str(p) for p in values_dir.iterdir())
+    result = CliRunner().invoke(two_pods, ['render-many', *files, '--out-dir', str(out_dir), '--jobs', jobs])
+    assert result.exit_code == 1
+    assert sorted(p.name for p in out_dir.iterdir()) == ['a.yaml', 'b.yaml']
+    for name in ('a.yaml', 'b.yaml'):
+        assert (out_dir / name).read_text() == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+    assert 'FAIL' in result.stderr
+    assert 'invalid value for type, expected list @ $.command' in result.stderr
+    assert '2 rendered, 1 failed' in result.stderr
+
+
+def test_render_many_rejects_colliding_output_names(tmp_path, values_dir):
+    other = tmp_path / 'other'
+    other.mkdir()
+    (other / 'a.yaml').write_text(VALID_TWO_POD_YAML)
+    files = [str(values_dir / 'a.yaml'), str(other / 'a.yaml')]
+    result = CliRunner().invoke(two_pods, ['render-many', *files, '--out-dir', str(tmp_path / 'build')])
+    assert result.exit_code == 2
+    assert 'would both be written to' in result.stderr
+
+
+def test_transpiler_help_lists_subcommands():
+    result = CliRunner().invoke(two_pods, ['--help'])
+    assert result.exit_code == 0
+    assert 'render-many' in result.stdout
+
+
+def test_transpiler_render_subcommand(tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(VALID_TWO_POD_YAML)
+    result = CliRunner().invoke(two_pods, ['render', str(values_path)])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == EXPECTED_TWO_POD_MANIFEST.strip()
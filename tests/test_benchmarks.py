@@ -0,0 +1,55 @@
+import json
+
+from benchmarks import charts, imports, slots
+from benchmarks.run import METRICS, child_env, compare, main, measure
+from gybe import k8s
+from gybe.serialization import unstructure
+
+
+def test_chart_emits_three_kinds_per_app():
+    resources = charts.apps(**{'apps': [charts.App(**a) for a in charts.values(4)['apps']]})
+    assert [type(r).__name__ for r in resources] == ['Deployment', 'Service', 'ConfigMap'] * 2
+
+
+def test_measure_reports_every_metric():
+    assert set(measure(3, repeat=1)) == set(METRICS)
+
+
+def test_compare_flags_regressions_past_threshold():
+    baselines = {'100': {'build_seconds': 0.1, 'import_seconds': 0.0001, 'peak_rss_bytes': 1000}}
+    results = {'100': {'build_seconds': 0.2, 'import_seconds': 0.0005, 'peak_rss_bytes': 1100}}
+    assert compare(results, baselines, threshold=0.25) == ['100 resources: build_seconds 0.2 > baseline 0.1']
+    assert compare(results, baselines, threshold=1.5) == []
+
+
+def test_main_stores_and_checks_baselines(tmp_path, capsys):
+    baselines = tmp_path / 'baselines.json'
+    assert main(['--sizes', '1', '--repeat', '1', '--baselines', str(baselines), '--update']) == 0
+    assert set(json.loads(baselines.read_text())['1']) == set(METRICS)
+    assert main(['--sizes', '1', '--repeat', '1', '--baselines', str(baselines), '--threshold', '1000']) == 0
+    assert 'resources' in capsys.readouterr().out
+
+
+def test_import_targets_cover_every_version():
+    assert imports.targets()[:2] == ['gybe', 'gybe.k8s']
+    assert 'gybe.k8s.v1_31.core.v1' in imports.targets()
+
+
+def test_measure_import_reports_every_metric(tmp_path):
+    metrics = imports.measure_import('gybe.k8s.v1_31.meta.v1', child_env(str(tmp_path)), repeat=1)
+    assert set(metrics) == set(imports.METRICS)
+    assert 0 < metrics['cumulative_import_seconds'] <= metrics['import_seconds']
+    assert metrics['bytecode_bytes'] > 0
+
+
+def test_slotted_models_unstructure_the_same():
+    kwargs = slots.MODELS['Container']
+    container = slots.slotted(k8s.Container)(**kwargs)
+    assert not hasattr(container, '__dict__')
+    assert unstructure(container) == unstructure(k8s.Container(**kwargs))
+    assert set(slots.measure(type(container), kwargs, count=10, repeat=1)) == {
+        'bytes',
+        'construct_ns',
+        'getattr_ns',
+        'unstructure_ns',
+    }
@@ -0,0 +1,84 @@
+import os
+
+from click.testing import CliRunner
+
+import gybe
+from gybe import k8s
+from gybe.cache import RenderCache
+from tests.test_example import EXPECTED_TWO_POD_MANIFEST, INVALID_TWO_POD_YAML, VALID_TWO_POD_YAML, two_pods
+
+calls: list[str] = []
+
+
+@gybe.transpiler
+def counted_pod(name: str) -> gybe.Manifest:
+    calls.append(name)
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=name))]
+
+
+def _render(tmp_path, command, values: str, *args: str):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(values)
+    return CliRunner().invoke(command, [str(values_path), '--cache-dir', str(tmp_path / 'cache'), *args])
+
+
+def test_cache_serves_identical_renders(tmp_path):
+    calls.clear()
+    first = _render(tmp_path, counted_pod, 'name: a')
+    second = _render(tmp_path, counted_pod, 'name: a')
+    assert first.exit_code == second.exit_code == 0
+    assert first.stdout == second.stdout
+    assert calls == ['a']
+
+    _render(tmp_path, counted_pod, 'name: b')
+    assert calls == ['a', 'b']
+    assert len(list((tmp_path / 'cache').glob('*.yaml'))) == 2
+
+
+def test_no_cache_always_renders(tmp_path):
+    calls.clear()
+    _render(tmp_path, counted_pod, 'name: a')
+    result = _render(tmp_path, counted_pod, 'name: a', '--no-cache')
+    assert result.exit_code == 0
+    assert calls == ['a', 'a']
+
+
+def test_cached_manifest_matches_render(tmp_path):
+    _render(tmp_path, two_pods, VALID_TWO_POD_YAML)
+    result = _render(tmp_path, two_pods, VALID_TWO_POD_YAML)
+    assert result.exit_code == 0
+    assert result.stdout == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+
+
+def test_invalid_values_are_not_cached(tmp_path):
+    result = _render(tmp_path, two_pods, INVALID_TWO_POD_YAML)
+    assert result.exit_code == -1
+    assert not list((tmp_path / 'cache').glob('*'))
+
+
+def test_cache_key_depends_on_values_chart_and_k8s_version(tmp_path):
+    cache = RenderCache(tmp_path)
+    transpiler = counted_pod.transpiler
+    key = cache.key(transpiler, {'name': 'a'})
+    assert key == cache.key(transpiler, {'name': 'a'})
+    assert key != cache.key(transpiler, {'name': 'b'})
+    assert key != cache.key(two_pods.transpiler, {'name': 'a'})
+    k8s.use_version('v1_30')
+    try:
+        assert key != cache.key(transpiler, {'name': 'a'})
+    finally:
+        k8s.use_version(k8s.DEFAULT_VERSION)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    for name in ('a', 'b', 'c'):
+        _render(tmp_path, counted_pod, f'name: {name}')
+    entries = sorted(cache_dir.glob('*.yaml'))
+    for mtime, entry in enumerate(entries):
+        os.utime(entry, (mtime, mtime))
+    size = entries[0].stat().st_size
+
+    cache = RenderCache(cache_dir, max_bytes=size * 2)
+    cache.evict()
+    assert sorted(cache_dir.glob('*.yaml')) == sorted(entries[1:])
@@ -0,0 +1,461 @@
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import gybe.k8s
+from gybe.codegen import cli, field_index, kind_registry, schema_index, shared
+from gybe.codegen.k8s_modules import write_modules
+from gybe.codegen.schema_index import k8s_openapi_dir, k8s_repo_dir
+from gybe.k8s.field_index import load_field_index
+from gybe.k8s.types import K8sResource
+from gybe.rendering import _c
+from gybe.serialization import unstructure
+
+REF = '#/components/schemas/'
+
+OBJECT_META = {
+    'description': 'Standard object metadata.',
+    'properties': {
+        'name': {'type': 'string', 'description': 'Name of the object.'},
+        'labels': {'type': 'object', 'additionalProperties': {'type': 'string'}},
+    },
+}
+CONTAINER = {
+    'description': 'A single application container.',
+    'properties': {
+        'name': {'type': 'string'},
+        'args': {'type': 'array', 'items': {'type': 'string'}},
+        'resources': {'type': 'object'},
+    },
+    'required': ['name'],
+}
+POD_SPEC = {
+    'properties': {
+        'containers': {
+            'type': 'array',
+            'items': {'allOf': [{'$ref': REF + 'io.k8s.api.core.v1.Container'}]},
+        },
+    },
+    'required': ['containers'],
+}
+POD = {
+    'description': 'Pod is a collection of containers.',
+    'properties': {
+        'apiVersion': {'type': 'string'},
+        'kind': {'type': 'string'},
+        'metadata': {'allOf': [{'$ref': REF + 'io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta'}]},
+        'spec': {'allOf': [{'$ref': REF + 'io.k8s.api.core.v1.PodSpec'}]},
+        'status': {'type': 'object'},
+    },
+}
+POD_SPEC_NAME = 'io.k8s.api.core.v1.PodSpec'
+SPEC = {
+    'components': {
+        'schemas': {
+            'io.k8s.api.core.v1.Container': CONTAINER,
+            'io.k8s.api.core.v1.Pod': POD,
+            POD_SPEC_NAME: POD_SPEC,
+            'io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta': OBJECT_META,
+        }
+    }
+}
+
+POD_GVK = {'group': '', 'version': 'v1', 'kind': 'Pod'}
+POD_OPERATION = {'x-kubernetes-group-version-kind': POD_GVK}
+# SPEC with the API paths that serve its Pod
+SERVED_SPEC = {
+    'paths': {
+        '/api/v1/namespaces/{namespace}/pods': {'get': POD_OPERATION, 'parameters': []},
+        '/api/v1/namespaces/{namespace}/pods/{name}/status': {'get': POD_OPERATION},
+        '/api/v1/pods': {'get': POD_OPERATION},
+        '/api/v1/watch/pods': {'get': POD_OPERATION},
+    },
+    'components': {
+        'schemas': {
+            **SPEC['components']['schemas'],
+            'io.k8s.api.core.v1.Pod': {**POD, 'x-kubernetes-group-version-kind': [POD_GVK]},
+        }
+    },
+}
+
+
+@pytest.fixture
+def codegen(tmp_path, monkeypatch):
+    """Run codegen against a tiny OpenAPI spec and make the output importable."""
+    (tmp_path / k8s_openapi_dir).mkdir(parents=True)
+    (tmp_path / 'gybe/k8s').mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(gybe.k8s, '__path__', [*gybe.k8s.__path__, str(tmp_path / 'gybe/k8s')])
+
+    def run(*args: str, version: str = 'v0_0', spec: dict = SPEC):
+        (tmp_path / k8s_openapi_dir / 'api__v1_openapi.json').write_text(json.dumps(spec))
+        monkeypatch.setattr(sys, 'argv', ['gybe.codegen', version, *args])
+        cli.main()
+        return tmp_path / 'gybe/k8s' / version
+
+    yield run
+    for name in [m for m in sys.modules if m.startswith(('gybe.k8s.v0_', 'gybe.k8s.shared_v0'))]:
+        del sys.modules[name]
+
+
+def test_codegen_writes_dataclass_modules(codegen):
+    out = codegen()
+    assert (out / '__init__.py').exists()
+    source = (out / 'core/v1.py').read_text()
+    assert 'class Pod(K8sResource):' in source
+    assert 'def to_dict' not in source
+
+    from gybe.k8s.v0_0.core.v1 import Container, Pod  # type: ignore[import-not-found]
+
+    pod = Pod(spec=Container(name='c'))  # type: ignore[arg-type]
+    assert pod.apiVersion == 'v1'
+    assert pod.kind == 'Pod'
+
+
+def test_codegen_emits_static_serializers(codegen):
+    codegen('--serializers')
+
+    from gybe.k8s.v0_0.core.v1 import Container, Pod, PodSpec  # type: ignore[import-not-found]
+    from gybe.k8s.v0_0.meta.v1 import ObjectMeta  # type: ignore[import-not-found]
+
+    pod = Pod(
+        metadata=ObjectMeta(name='pod', labels={'app': 'web'}),
+        spec=PodSpec(containers=[Container(name='c', args=['-v'], resources={'limits': {}})]),
+    )
+    d = pod.to_dict()
+    assert d == unstructure(pod)
+    assert d == {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {'name': 'pod', 'labels': {'app': 'web'}},
+        'spec': {'containers': [{'name': 'c', 'args': ['-v'], 'resources': {'limits': {}}}]},
+    }
+    assert Pod.from_dict(d) == pod
+    with pytest.raises(KeyError):
+        PodSpec.from_dict({})
+
+
+@pytest.mark.parametrize('args', [('--slots',), ('--slots', '--serializers')])
+def test_codegen_emits_slotted_models(codegen, args):
+    out = codegen(*args)
+    assert '@dataclass(slots=True)\nclass Pod(K8sResource):' in (out / 'core/v1.py').read_text()
+
+    from gybe.k8s.v0_0.core.v1 import Container, Pod, PodSpec  # type: ignore[import-not-found]
+
+    pod = Pod(spec=PodSpec(containers=[Container(name='c')]))
+    assert isinstance(pod, K8sResource)
+    assert not hasattr(pod, '__dict__')
+    with pytest.raises(AttributeError):
+        pod.extra = 1
+    d = {'apiVersion': 'v1', 'kind': 'Pod', 'spec': {'containers': [{'name': 'c'}]}}
+    assert unstructure(pod) == d
+    assert _c.structure(d, Pod) == pod
+
+
+def test_codegen_moves_docstrings_to_stubs(codegen):
+    out = codegen('--stubs', '--serializers')
+    runtime = (out / 'core/v1.py').read_text()
+    stub = (out / 'core/v1.pyi').read_text()
+    assert 'Attributes:' not in runtime
+    assert 'Attributes:' in stub
+    assert 'name: Name of the object.' in (out / 'meta/v1.pyi').read_text()
+    stub_to_dict = next(
+        f for f in ast.walk(ast.parse(stub)) if isinstance(f, ast.FunctionDef) and f.name == 'to_dict'
+    )
+    assert ast.unparse(stub_to_dict.body) == '...'
+
+    from gybe.k8s.v0_0.core.v1 import Container, Pod  # type: ignore[import-not-found]
+
+    assert Pod.__doc__ == 'Pod is a collection of containers.'
+    assert Container(name='c').to_dict() == {'name': 'c'}
+
+
+def test_codegen_removes_stubs_left_by_a_run_with_stubs(codegen, tmp_path):
+    manifest_path = tmp_path / 'codegen/manifests/v0_0.json'
+    out = codegen('--stubs')
+    stubs = [out / 'core/v1.pyi', out / 'meta/v1.pyi']
+    assert all(p.exists() for p in stubs)
+    written = write_modules({'v0_0': None}, stubs=False)
+    assert not any(p.exists() for p in stubs)
+    assert sorted(p.name for p in written if p.parent.name == 'core') == ['v1.py']
+    files = [f for m in json.loads(manifest_path.read_text())['modules'].values() for f in m['files']]
+    assert not [f for f in files if f.endswith('.pyi')]
+
+
+def test_codegen_deletes_files_of_the_previous_run_it_did_not_write(codegen, tmp_path):
+    manifest_path = tmp_path / 'codegen/manifests/v0_0.json'
+    out = codegen()
+    stale = out / 'core/v1_old.py'
+    stale.write_text('')
+    manifest = json.loads(manifest_path.read_text())
+    manifest['modules']['gybe.k8s.v0_0.core.v1']['files'].append(str(stale))
+    manifest_path.write_text(json.dumps(manifest))
+
+    # different options, or forcing, rebuild every module without reusing the previous entries
+    write_modules({'v0_0': None}, serializers=True, force=True)
+    assert not stale.exists()
+    assert (out / 'core/v1.py').exists()
+
+
+def test_codegen_generates_versions_from_git_refs_in_parallel(codegen, tmp_path, monkeypatch):
+    def git(*args: str) -> None:
+        repo = str(tmp_path / k8s_repo_dir)
+        subprocess.run(['git', '-C', repo, *args], check=True, capture_output=True)  # noqa: S603, S607
+
+    spec_path = tmp_path / k8s_openapi_dir / 'api__v1_openapi.json'
+    git('init', '-q')
+    for tag, spec in (('old', {'components': {'schemas': {}}}), ('new', SPEC)):
+        spec_path.write_text(json.dumps(spec))
+        git('add', '.')
+        git('-c', 'user.name=gybe', '-c', 'user.email=gybe@localhost', 'commit', '-q', '-m', tag)
+        git('tag', tag)
+    spec_path.write_text('not json, refs are read from git')
+    untouched = tmp_path / 'gybe/k8s/untouched.py'
+    untouched.write_text('x  =  "not formatted"\n')
+
+    monkeypatch.setattr(sys, 'argv', ['gybe.codegen', 'v0_0=old', 'v0_1=new', '--jobs', '2', '--format'])
+    cli.main()
+    assert (tmp_path / 'gybe/k8s/v0_0/__init__.py').exists()
+    assert not (tmp_path / 'gybe/k8s/v0_0/core').exists()
+    assert 'class Pod(K8sResource):' in (tmp_path / 'gybe/k8s/v0_1/core/v1.py').read_text()
+    written = [str(p) for p in (tmp_path / 'gybe/k8s/v0_1').rglob('*.py')]
+    subprocess.run([sys.executable, '-m', 'ruff', 'format', '--check', *written], check=True)  # noqa: S603
+    assert untouched.read_text() == 'x  =  "not formatted"\n'
+
+
+def test_codegen_only_rebuilds_modules_whose_schemas_changed(codegen, tmp_path):
+    codegen()
+    # written files are relative to the repository root, which codegen runs from
+    files = [Path('gybe/k8s/v0_0/core/v1.py'), Path('gybe/k8s/v0_0/meta/v1.py')]
+    for f in files:
+        os.utime(f, ns=(0, 0))
+    assert write_modules({'v0_0': None}) == []
+    assert [f.stat().st_mtime_ns for f in files] == [0, 0]
+
+    container = {**CONTAINER, 'properties': {**CONTAINER['properties'], 'image': {'type': 'string'}}}
+    schemas = {**SPEC['components']['schemas'], 'io.k8s.api.core.v1.Container': container}
+    spec_path = tmp_path / k8s_openapi_dir / 'api__v1_openapi.json'
+    spec_path.write_text(json.dumps({'components': {'schemas': schemas}}))
+    assert write_modules({'v0_0': None}) == files[:1]
+    assert 'image: Optional[str] = None' in files[0].read_text()
+    assert files[1].stat().st_mtime_ns == 0
+
+    # the codegen options are part of every module's inputs
+    assert sorted(write_modules({'v0_0': None}, slots=True)) == files
+    assert sorted(write_modules({'v0_0': None}, slots=True, force=True)) == files
+
+    del schemas['io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta']
+    spec_path.write_text(json.dumps({'components': {'schemas': schemas}}))
+    assert write_modules({'v0_0': None}, slots=True) == []
+    assert not files[1].exists()
+    manifest = json.loads((tmp_path / 'codegen/manifests/v0_0.json').read_text())
+    assert list(manifest['modules']) == ['gybe.k8s.v0_0.core.v1']
+    assert list(manifest['specs']) == ['api__v1_openapi.json']
+
+
+def test_schema_index_resolves_refs_once_and_is_cached(codegen, tmp_path):
+    pod_spec = {
+        **POD_SPEC,
+        'properties': {
+            **POD_SPEC['properties'],
+            'overhead': {'$ref': REF + 'io.k8s.apimachinery.pkg.util.intstr.IntOrString'},
+            'raw': {'allOf': [{'$ref': REF + 'io.k8s.apimachinery.pkg.runtime.RawExtension'}]},
+            'matrix': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'integer'}}},
+            'untyped': {},
+        },
+    }
+    codegen(spec={'components': {'schemas': {**SPEC['components']['schemas'], POD_SPEC_NAME: pod_spec}}})
+    index = schema_index.load_schema_index('v0_0')
+    assert index is not None
+    assert list(index['models']) == [
+        'core.v1.Container',
+        'core.v1.Pod',
+        'core.v1.PodSpec',
+        'meta.v1.ObjectMeta',
+    ]
+    pod = index['models']['core.v1.Pod']
+    assert pod['schema'] == 'io.k8s.api.core.v1.Pod'
+    assert pod['gvk'] == ['', 'v1', 'Pod']
+    assert pod['fields']['spec'] == {'type': 'core.v1.PodSpec', 'description': None}
+    assert index['models']['core.v1.PodSpec']['fields'] == {
+        'containers': {'type': '[core.v1.Container]', 'description': None},
+        'overhead': {'type': 'str', 'description': None},
+        'raw': {'type': 'JSONObj', 'description': None},
+        'matrix': {'type': '[[int]]', 'description': None},
+        'untyped': {'type': 'str', 'description': None},
+    }
+    assert index['models']['core.v1.PodSpec']['gvk'] is None
+
+    # unchanged schema files are not parsed again
+    cached = tmp_path / 'codegen/schema_index/v0_0.json.gz'
+    os.utime(cached, ns=(0, 0))
+    assert schema_index.schema_index('v0_0') == index
+    assert cached.stat().st_mtime_ns == 0
+
+    with pytest.raises(NotImplementedError):
+        schema_index.build_schema_index(
+            {
+                'api.json': json.dumps(
+                    {'components': {'schemas': {POD_SPEC_NAME: {'properties': {'x': {'type': 'x'}}}}}}
+                )
+            }
+        )
+
+    # resources take the group they are served under, or the one of their package
+    review = {**POD, 'x-kubernetes-group-version-kind': [{'group': 'g.k8s.io', 'version': 'v2', 'kind': 'R'}]}
+    schemas = {'io.k8s.api.authorization.v1.SubjectAccessReview': POD, 'io.k8s.api.x.v1.Review': review}
+    models = schema_index.build_schema_index({'api.json': json.dumps({'components': {'schemas': schemas}})})
+    assert models['authorization.v1.SubjectAccessReview']['gvk'] == [
+        'authorization.k8s.io',
+        'v1',
+        'SubjectAccessReview',
+    ]
+    assert models['x.v1.Review']['gvk'] == ['g.k8s.io', 'v2', 'R']
+
+
+def test_share_models_between_versions(codegen, monkeypatch, capsys):
+    monkeypatch.setattr(shared, 'SHARED_MODULE', 'shared_v0')
+    container = {**CONTAINER, 'properties': {**CONTAINER['properties'], 'image': {'type': 'string'}}}
+    codegen()
+    out = codegen(
+        version='v0_1',
+        spec={
+            'components': {
+                'schemas': {**SPEC['components']['schemas'], 'io.k8s.api.core.v1.Container': container}
+            }
+        },
+    )
+
+    # ObjectMeta is identical, Pod and PodSpec refer to the Container that changed
+    expected = {'meta.v1': ['ObjectMeta']}
+    assert shared.share_models(['v0_0', 'v0_1'], k8s_dir=out.parent) == expected
+    unchanged = [out / 'meta/v1.py', out.parent / 'shared_v0/meta/v1.py']
+    for f in unchanged:
+        # reformatting does not count as a change
+        f.write_text(f.read_text().replace('    ', '  '))
+        os.utime(f, ns=(0, 0))
+    stale = out.parent / 'shared_v0/apps/v1.py'
+    stale.parent.mkdir()
+    stale.write_text('')
+    (out.parent / 'shared_v0/__init__.py').unlink()
+    ruff_runs = []
+    monkeypatch.setattr(cli.subprocess, 'run', lambda args, **kwargs: ruff_runs.append(args[3:]))
+
+    # re-running inlines the shared models again first, so it gives the same result
+    monkeypatch.setattr(sys, 'argv', ['gybe.codegen.shared', 'v0_0', 'v0_1', '--format'])
+    shared.main()
+    assert 'shared 1 models in 1 modules' in capsys.readouterr().out
+    assert [f.stat().st_mtime_ns for f in unchanged] == [0, 0]
+    # only the module rewritten is formatted
+    init = 'gybe/k8s/shared_v0/__init__.py'
+    assert ruff_runs == [['check', '--quiet', '--fix', init], ['format', '--quiet', init]]
+    cli.format_files([])
+    assert len(ruff_runs) == 2
+    assert not stale.exists()
+    assert 'class ObjectMeta' not in (out / 'meta/v1.py').read_text()
+
+    from gybe.k8s.shared_v0.meta.v1 import ObjectMeta  # type: ignore[import-not-found]
+    from gybe.k8s.v0_0.core import v1 as v0  # type: ignore[import-not-found]
+    from gybe.k8s.v0_1.core import v1 as v1  # type: ignore[import-not-found]
+    from gybe.k8s.v0_1.meta.v1 import ObjectMeta as V1ObjectMeta  # type: ignore[import-not-found]
+
+    assert V1ObjectMeta is ObjectMeta
+    assert v0.Pod is not v1.Pod
+    pod = v1.Pod(
+        metadata=ObjectMeta(name='p'), spec=v1.PodSpec(containers=[v1.Container(name='c', image='i')])
+    )
+    d = unstructure(pod)
+    assert d['metadata'] == {'name': 'p'}
+    assert _c.structure(d, v1.Pod) == pod
+
+    with pytest.raises(ValueError):
+        shared.share_models(['v0_0'], k8s_dir=out.parent)
+
+
+def test_shared_modules_import_only_the_modules_they_refer_to():
+    model = ast.parse(
+        'class M:\n'
+        '    metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None\n'
+        '    containers: List[gybe.k8s.v1_31.core.v1.Container] = None\n'
+    ).body
+    imports = ['import gybe.k8s.v1_31.core.v1', 'import gybe.k8s.v1_31.meta.v1']
+    assert shared._imports(model, 'v1_31') == imports
+
+    k8s_dir = Path(gybe.k8s.__file__).parent
+    for path in (k8s_dir / 'shared').rglob('*.py'):
+        for stmt in ast.parse(path.read_text()).body:
+            if isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    module = Path(*alias.name.split('.')[2:])
+                    assert (k8s_dir / module).with_suffix('.py').exists(), f'{path}: {alias.name}'
+
+
+def test_field_index_maps_kinds_and_model_fields(codegen, monkeypatch, capsys):
+    out = codegen(spec=SERVED_SPEC)
+    index = field_index.build_field_index('v0_0', k8s_dir=out.parent)
+    assert index['kinds'] == {'v1/Pod': 'core.v1.Pod'}
+    assert index['models']['core.v1.Pod'] == {
+        'apiVersion': None,
+        'kind': None,
+        'metadata': 'meta.v1.ObjectMeta',
+        'spec': 'core.v1.PodSpec',
+        'status': None,
+    }
+    assert index['models']['core.v1.PodSpec'] == {'containers': '[core.v1.Container]'}
+    # the field index read from codegen's schema index is the same, without importing models
+    schemas = schema_index.load_schema_index('v0_0')
+    assert schemas is not None
+    assert field_index.field_index_from_schemas(schemas) == index
+
+    monkeypatch.setattr(sys, 'argv', ['gybe.codegen.field_index', 'v0_0'])
+    field_index.main()
+    assert 'field_index.json' in capsys.readouterr().out
+    assert load_field_index('v0_0', k8s_dir=out.parent) == index
+
+
+def test_codegen_writes_kind_registry_from_api_paths(codegen, monkeypatch, capsys):
+    out = codegen(spec=SERVED_SPEC)
+    index = schema_index.load_schema_index('v0_0')
+    assert index is not None
+    assert index['resources'] == {'v1/Pod': {'model': 'core.v1.Pod', 'plural': 'pods', 'namespaced': True}}
+    registry = out / 'kinds.json'
+    assert json.loads(registry.read_text()) == {'v1/Pod': ['core.v1', 'Pod', 'pods', True]}
+
+    # rebuilt from the field index when there is no schema index
+    (out.parent.parent.parent / 'codegen/schema_index/v0_0.json.gz').unlink()
+    field_index.write_field_index('v0_0', k8s_dir=out.parent)
+    registry.unlink()
+    monkeypatch.setattr(sys, 'argv', ['gybe.codegen.kind_registry', 'v0_0', 'v0_0'])
+    kind_registry.main()
+    assert capsys.readouterr().out.splitlines()[1] == 'v0_0 registry unchanged'
+    assert json.loads(registry.read_text()) == {'v1/Pod': ['core.v1', 'Pod', 'pods', True]}
+
+
+def test_guess_kind_registry_from_field_index():
+    kinds = {
+        'v1/Namespace': 'core.v1.Namespace',
+        'v1/PodList': 'core.v1.PodList',
+        'v1/Status': 'meta.v1.Status',
+        'resource.k8s.io/v1alpha3/ResourceClaim': 'resource.v1alpha3.ResourceClaim',
+        'networking.k8s.io/v1/Ingress': 'networking.v1.Ingress',
+    }
+    assert kind_registry.guess_kind_registry({'kinds': kinds}) == {
+        'networking.k8s.io/v1/Ingress': ['networking.v1', 'Ingress', 'ingresses', True],
+        'resource.k8s.io/v1alpha3/ResourceClaim': [
+            'resource.v1alpha3',
+            'ResourceClaim',
+            'resourceclaims',
+            True,
+        ],
+        'v1/Namespace': ['core.v1', 'Namespace', 'namespaces', False],
+    }
+    assert [kind_registry.guess_plural(k) for k in ('Endpoints', 'NetworkPolicy', 'Pod')] == [
+        'endpoints',
+        'networkpolicies',
+        'pods',
+    ]
@@ -10,3 +10,26 @@ def invalid_output_not_list():
 def test_invalid_output_not_list_raises_error(run_cli):
     result = run_cli(invalid_output_not_list, '')
     assert isinstance(result.exception, InvalidOutputError)
+
+
+@gybe.transpiler
+def invalid_output_list_item():
+    return [gybe.k8s.Pod(), 'foo']
+
+
+def test_invalid_output_list_item_raises_error_before_output(run_cli):
+    result = run_cli(invalid_output_list_item, '')
+    assert isinstance(result.exception, InvalidOutputError)
+    assert result.stdout == ''
+
+
+@gybe.transpiler
+def invalid_output_yielded_item():
+    yield gybe.k8s.Pod()
+    yield 'foo'
+
+
+def test_invalid_output_yielded_item_raises_error(run_cli):
+    result = run_cli(invalid_output_yielded_item, '')
+    assert isinstance(result.exception, InvalidOutputError)
+    assert result.stdout.startswith('apiVersion: v1\nkind: Pod\n')
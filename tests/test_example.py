@@ -1,3 +1,5 @@
+from click.testing import CliRunner
+
 import gybe
 
 
@@ -97,3 +99,38 @@ def test_two_pods_chart_fails_with_invalid_yaml(run_cli):
     result = run_cli(two_pods, INVALID_TWO_POD_YAML)
     assert result.exit_code == -1
     assert result.stdout.strip() == EXPECTED_INVALID_TWO_POD_YAML.strip()
+
+
+def test_two_pods_chart_writes_output_file(tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(VALID_TWO_POD_YAML)
+    output_path = tmp_path / 'manifest.yaml'
+    result = CliRunner().invoke(two_pods, [str(values_path), '--output', str(output_path)])
+    assert result.exit_code == 0
+    assert result.stdout == ''
+    assert output_path.read_text() == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+
+
+@gybe.transpiler
+def many_pods(image: str, command: list[str]) -> gybe.ManifestIterator:
+    for name in ('pod-1', 'pod-2'):
+        yield gybe.k8s.Pod(
+            metadata=gybe.k8s.ObjectMeta(name=name),
+            spec=gybe.k8s.PodSpec(containers=[create_standard_container(image=image, command=command)]),
+        )
+
+
+def test_generator_chart_transpiles_with_valid_yaml(run_cli):
+    result = run_cli(many_pods, VALID_TWO_POD_YAML)
+    assert result.exit_code == 0
+    assert result.stdout.strip() == EXPECTED_TWO_POD_MANIFEST.strip()
+
+
+def test_input_model_is_built_at_decoration_time(run_cli, monkeypatch):
+    def fail(*args):
+        raise AssertionError('input model rebuilt on render')
+
+    monkeypatch.setattr('gybe.rendering.create_input_model', fail)
+    result = run_cli(two_pods, VALID_TWO_POD_YAML)
+    assert result.exit_code == 0
+    assert result.stdout.strip() == EXPECTED_TWO_POD_MANIFEST.strip()
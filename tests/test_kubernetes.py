@@ -4,6 +4,15 @@ List of actively maintained k8s versions here:
 https://k8s.io/releases/
 """
 
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+import gybe
+
 
 def test_import_default_kuberentes():
     """Tests default k8s module imports"""
@@ -62,3 +71,123 @@ def test_import_k8s_1_32():
     from gybe.k8s.v1_32.core import v1
 
     assert v1
+
+
+def test_default_kubernetes_models_load_lazily():
+    """Tests `import gybe` does not import generated modules until a model is used"""
+    code = (
+        'import sys, gybe\n'
+        "assert 'gybe.k8s.v1_31.core.v1' not in sys.modules\n"
+        'gybe.k8s.Deployment\n'
+        "assert 'gybe.k8s.v1_31.apps.v1' in sys.modules\n"
+        "assert 'gybe.k8s.v1_31.networking.v1' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)  # noqa: S603
+
+
+def test_default_kubernetes_exports():
+    """Tests every default k8s export resolves and is listed by dir()"""
+    from gybe import k8s
+    from gybe.k8s import Pod
+    from gybe.k8s.v1_31.core.v1 import Pod as Pod_1_31
+
+    assert Pod is Pod_1_31
+    for name in k8s.__all__:
+        assert getattr(k8s, name)
+        assert name in dir(k8s)
+
+
+def test_unknown_kubernetes_model_raises_attribute_error():
+    """Tests unknown default k8s exports fail like regular module attributes"""
+    from gybe import k8s
+
+    with pytest.raises(AttributeError):
+        k8s.NotAModel
+
+
+@pytest.fixture
+def k8s_version():
+    """Restore the default k8s version after a test switches it"""
+    from gybe import k8s
+
+    version = k8s.current_version()
+    yield k8s
+    k8s.use_version(version)
+
+
+def test_available_kubernetes_versions():
+    from gybe import k8s
+
+    assert k8s.available_versions() == ['v1_29', 'v1_30', 'v1_31', 'v1_32']
+
+
+def test_use_version_rebinds_default_exports(k8s_version):
+    from gybe.k8s.v1_29.core.v1 import Pod as Pod_1_29
+    from gybe.k8s.v1_31.core.v1 import Pod as Pod_1_31
+
+    assert k8s_version.Pod is Pod_1_31
+    k8s_version.use_version('1.29')
+    assert k8s_version.Pod is Pod_1_29
+    k8s_version.use_version('v1_31')
+    assert k8s_version.Pod is Pod_1_31
+    with pytest.raises(ValueError, match='unknown kubernetes version'):
+        k8s_version.use_version('1.12')
+
+
+def test_kubernetes_version_from_environment():
+    """Tests GYBE_K8S_VERSION picks the version package and only that one is imported"""
+    code = (
+        'import sys, gybe\n'
+        "assert gybe.k8s.Pod.__module__ == 'gybe.k8s.v1_30.core.v1'\n"
+        "assert not [m for m in sys.modules if m.startswith('gybe.k8s.v1_31')]\n"
+    )
+    env = {**os.environ, 'GYBE_K8S_VERSION': '1.30'}
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)  # noqa: S603
+
+
+def test_unknown_kubernetes_version_in_environment_fails_on_first_use():
+    code = (
+        'import gybe\n'
+        'try:\n'
+        '    gybe.k8s.Pod\n'
+        'except ValueError as exc:\n'
+        '    print(exc)\n'
+        "gybe.k8s.use_version('1.32')\n"
+        'print(gybe.k8s.Pod.__module__)\n'
+    )
+    env = {**os.environ, 'GYBE_K8S_VERSION': '1.3O'}
+    out = subprocess.run([sys.executable, '-c', code], check=True, env=env, capture_output=True, text=True)  # noqa: S603
+    assert out.stdout.startswith("GYBE_K8S_VERSION environment variable: unknown kubernetes version '1.3O'")
+    assert out.stdout.endswith('gybe.k8s.v1_32.core.v1\n')
+
+
+@gybe.transpiler
+def versioned_pod(name: str) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=name, labels={'module': gybe.k8s.Pod.__module__}))]
+
+
+def test_render_with_kubernetes_version(k8s_version, tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text('name: web')
+    result = CliRunner().invoke(versioned_pod, [str(values_path), '--k8s-version', 'v1_32'])
+    assert result.exit_code == 0
+    assert 'module: gybe.k8s.v1_32.core.v1' in result.stdout
+
+    result = CliRunner().invoke(versioned_pod, [str(values_path), '--k8s-version', '2.0'])
+    assert result.exit_code == 2
+    assert 'unknown kubernetes version' in result.stderr
+
+
+def test_render_reports_unknown_kubernetes_version_in_environment(k8s_version, monkeypatch, tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text('name: web')
+    monkeypatch.setenv('GYBE_K8S_VERSION', '1.3O')
+    monkeypatch.setattr(k8s_version, '_version_module', None)
+    assert CliRunner().invoke(versioned_pod, ['--help']).exit_code == 0
+    result = CliRunner().invoke(versioned_pod, [str(values_path)])
+    assert result.exit_code == 2
+    assert "GYBE_K8S_VERSION environment variable: unknown kubernetes version '1.3O'" in result.stderr
+
+    # the option overrides the variable
+    result = CliRunner().invoke(versioned_pod, [str(values_path), '--k8s-version', 'v1_32'])
+    assert 'module: gybe.k8s.v1_32.core.v1' in result.stdout
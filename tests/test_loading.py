@@ -0,0 +1,175 @@
+import io
+import json
+import re
+from datetime import datetime
+
+import pytest
+
+import gybe
+from gybe import k8s
+from gybe.exceptions import InvalidManifestError, StructureError
+from gybe.k8s.v1_29.apps.v1 import Deployment as V129Deployment
+from gybe.k8s.v1_31.apps.v1 import Deployment
+from gybe.k8s.v1_31.core.v1 import ConfigMap, Pod
+from gybe.loading import load_manifests
+from gybe.serialization import structure, unstructure
+from gybe.yaml import yaml_dumps
+
+DEPLOYMENT = {
+    'apiVersion': 'apps/v1',
+    'kind': 'Deployment',
+    'metadata': {'name': 'web', 'labels': {'app': 'web'}},
+    'spec': {
+        'selector': {'matchLabels': {'app': 'web'}},
+        'template': {
+            'metadata': {'labels': {'app': 'web'}},
+            'spec': {'containers': [{'name': 'web', 'resources': {'limits': {'cpu': '1'}}}]},
+        },
+    },
+}
+WIDGET = {'apiVersion': 'example.com/v1', 'kind': 'Widget', 'metadata': {'name': 'w'}}
+MANIFEST = """\
+# rendered by hand
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+  labels: {app: web}
+spec:
+  selector: {matchLabels: {app: web}}
+  template:
+    metadata: {labels: {app: web}}
+    spec:
+      containers:
+      - name: web
+        resources: {limits: {cpu: '1'}}
+---
+---
+apiVersion: example.com/v1
+kind: Widget
+metadata: {name: w}
+"""
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_load_yaml_documents_into_models(stream):
+    documents = list(load_manifests(io.StringIO(MANIFEST) if stream else MANIFEST))
+    assert [type(d) for d in documents] == [Deployment, dict]
+    assert unstructure(documents[0]) == DEPLOYMENT
+    assert documents[1] == WIDGET
+    assert gybe.load_manifests is load_manifests
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        json.dumps(DEPLOYMENT, indent=2) + '\n' + json.dumps(WIDGET),
+        json.dumps([DEPLOYMENT, WIDGET]),
+        json.dumps({'apiVersion': 'v1', 'kind': 'List', 'items': [DEPLOYMENT, WIDGET]}),
+    ],
+)
+def test_load_json_streams(monkeypatch, text):
+    # tiny reads split documents across chunks
+    monkeypatch.setattr('gybe.loading.JSON_CHUNK_SIZE', 7)
+    documents = list(load_manifests(io.StringIO('\n' * 10 + text)))
+    assert [unstructure(d) for d in documents] == [DEPLOYMENT, WIDGET]
+    assert isinstance(documents[0], Deployment)
+
+    with pytest.raises(InvalidManifestError, match='document 2: cannot parse: Expecting value'):
+        list(load_manifests(io.StringIO(text + '{"kind":')))
+
+
+@pytest.mark.parametrize('chunk_size', [7, 1 << 16])
+def test_load_flow_style_yaml_that_looks_like_json(monkeypatch, chunk_size):
+    monkeypatch.setattr('gybe.loading.JSON_CHUNK_SIZE', chunk_size)
+    text = '{apiVersion: v1, kind: Pod, metadata: {name: x}, spec: {containers: [{name: c}]}}\n'
+    for source in (text, io.StringIO(text)):
+        (pod,) = load_manifests(source)
+        assert isinstance(pod, Pod)
+        assert pod.metadata is not None and pod.metadata.name == 'x'
+    (widget, pod) = load_manifests(io.StringIO('[{apiVersion: example.com/v1, kind: Widget}, ' + text + ']'))
+    assert widget == {'apiVersion': 'example.com/v1', 'kind': 'Widget'}
+    assert isinstance(pod, Pod)
+
+    with pytest.raises(InvalidManifestError, match='document 0: cannot parse: .*flow mapping'):
+        list(load_manifests(io.StringIO('{kind: Pod')))
+
+
+def test_load_typed_lists_and_selected_version():
+    pod_list = {
+        'apiVersion': 'v1',
+        'kind': 'PodList',
+        'items': [{'metadata': {'name': 'p'}, 'spec': {'containers': [{'name': 'c'}]}}],
+    }
+    config_map = {'apiVersion': 'v1', 'kind': 'ConfigMap', 'data': {'a': 'b'}}
+    pod, cm = load_manifests(json.dumps([pod_list, config_map]))
+    assert isinstance(pod, Pod)
+    assert pod.metadata is not None and pod.metadata.name == 'p'
+    assert cm == ConfigMap(apiVersion='v1', kind='ConfigMap', data={'a': 'b'})
+
+    assert type(next(load_manifests(MANIFEST, version='1.29'))) is V129Deployment
+    k8s.use_version('v1_29')
+    try:
+        assert type(next(load_manifests(MANIFEST))) is V129Deployment
+    finally:
+        k8s.use_version(k8s.DEFAULT_VERSION)
+    with pytest.raises(ValueError, match='unknown kubernetes version'):
+        load_manifests(MANIFEST, version='2.0')
+
+
+def test_load_reports_documents_that_do_not_fit_their_model():
+    pod = {'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'p'}, 'spec': {'containers': [{}]}}
+    with pytest.raises(
+        InvalidManifestError, match=r'document 1: Pod/p: spec.containers\[0\].name: missing required field'
+    ):
+        list(load_manifests(json.dumps([WIDGET, pod])))
+    with pytest.raises(InvalidManifestError, match='document 0: expected a mapping, got str'):
+        list(load_manifests('just text'))
+    assert list(load_manifests(io.StringIO(''))) == []
+
+
+@pytest.mark.parametrize(
+    ('path', 'value', 'reason'),
+    [
+        (['spec', 'replicas'], 'three', 'expected int, got str'),
+        (['spec', 'replics'], 3, 'unknown field'),
+        (['spec', 'template', 'spec', 'containers'], {'name': 'web'}, 'expected a list, got dict'),
+        (['spec', 'selector', 'matchLabels'], ['app'], 'expected a mapping, got list'),
+        (['spec', 'template', 'spec', 'containers', 0, 'args'], '-v', 'expected a list of str, got str'),
+        (['spec', 'template', 'spec', 'containers', 0, 'args', 1], True, 'expected str, got bool'),
+        (['spec', 'template', 'metadata'], 'web', 'expected a mapping, got str'),
+    ],
+)
+def test_load_reports_the_field_that_does_not_fit(path, value, reason):
+    deployment = json.loads(json.dumps(DEPLOYMENT))
+    deployment['spec']['template']['spec']['containers'][0]['args'] = ['-q', '-v']
+    parent = deployment
+    for key in path[:-1]:
+        parent = parent[key]
+    parent[path[-1]] = value
+    location = ''.join(f'[{p}]' if isinstance(p, int) else f'.{p}' for p in path).lstrip('.')
+    with pytest.raises(
+        InvalidManifestError, match=re.escape(f'document 1: Deployment/web: {location}: {reason}')
+    ):
+        list(load_manifests(json.dumps([WIDGET, deployment])))
+
+
+def test_load_accepts_int_or_string_and_timestamp_fields():
+    manifest = MANIFEST.replace(
+        '  name: web\n', '  name: web\n  creationTimestamp: 2024-01-01T00:00:00Z\n', 1
+    )
+    service = (
+        'apiVersion: v1\nkind: Service\nmetadata: {name: web}\n'
+        'spec: {ports: [{port: 80, targetPort: 8080}, {port: 81, targetPort: http}]}\n'
+    )
+    deployment, _, svc = load_manifests(manifest + '---\n' + service)
+    assert isinstance(deployment, Deployment) and deployment.metadata is not None
+    assert deployment.metadata.creationTimestamp == '2024-01-01T00:00:00Z'
+    assert [p.targetPort for p in svc.spec.ports] == [8080, 'http']
+
+    # timestamps are written back as they were read
+    dumped = yaml_dumps(unstructure(deployment))
+    assert "creationTimestamp: '2024-01-01T00:00:00Z'" in dumped
+    assert list(load_manifests(dumped)) == [deployment]
+    with pytest.raises(StructureError, match='creationTimestamp: expected str, got datetime'):
+        structure({**DEPLOYMENT, 'metadata': {'creationTimestamp': datetime.now()}}, Deployment)
@@ -0,0 +1,159 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+import gybe
+from gybe import k8s
+from gybe.k8s.field_index import load_field_index
+from gybe.k8s.registry import kind_registry
+from gybe.k8s.v1_31.authorization import v1 as authorization
+from gybe.k8s.v1_31.resource import v1alpha3 as resource
+from gybe.k8s.v1_31.storagemigration import v1alpha1 as storagemigration
+from gybe.k8s.v1_32.core.v1 import Container, Pod, PodSpec, ResourceRequirements
+from gybe.matrix import check_document, render_matrix
+
+
+@gybe.transpiler
+def web(name: str) -> gybe.Manifest:
+    metadata = gybe.k8s.ObjectMeta(name=name)
+    return [
+        gybe.k8s.Pod(metadata=metadata, spec=gybe.k8s.PodSpec(containers=[gybe.k8s.Container(name=name)])),
+        gybe.k8s.Service(metadata=metadata, spec=gybe.k8s.ServiceSpec(selector={'app': name})),
+    ]
+
+
+@gybe.transpiler
+def pod_resources(name: str) -> gybe.Manifest:
+    # bound to v1_32 at import, so every version renders the `spec.resources` added in 1.32
+    spec = PodSpec(containers=[Container(name=name)], resources=ResourceRequirements(limits={'cpu': 1}))
+    return [Pod(metadata=gybe.k8s.ObjectMeta(name=name), spec=spec)]
+
+
+@gybe.transpiler
+def looked_up_pod_resources(name: str) -> gybe.Manifest:
+    resources = gybe.k8s.ResourceRequirements(limits={'cpu': 1})
+    # type checked against the default v1_31, which has no `spec.resources` yet
+    spec = gybe.k8s.PodSpec(containers=[gybe.k8s.Container(name=name)], resources=resources)  # type: ignore[call-arg]
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=name), spec=spec)]
+
+
+@gybe.transpiler
+def grouped_kinds(name: str) -> gybe.Manifest:
+    metadata = gybe.k8s.ObjectMeta(name=name)
+    return [
+        resource.ResourceClaim(metadata=metadata, spec=resource.ResourceClaimSpec()),
+        authorization.SubjectAccessReview(spec=authorization.SubjectAccessReviewSpec(user=name)),
+        storagemigration.StorageVersionMigration(metadata=metadata),
+    ]
+
+
+@pytest.fixture
+def values_path(tmp_path):
+    path = tmp_path / 'values.yaml'
+    path.write_text('name: web')
+    return path
+
+
+def test_check_document_reports_missing_kinds_and_nested_fields():
+    index = load_field_index('v1_29')
+    pod = {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {'name': 'web', 'labels': {'app': 'web'}},
+        'spec': {'containers': [{'name': 'web'}, {'name': 'sidecar', 'shiny': True}], 'resources': {}},
+    }
+    assert check_document(index, 'v1_29', pod) == [
+        'Pod/web: field spec.containers[1].shiny does not exist in v1_29',
+        'Pod/web: field spec.resources does not exist in v1_29',
+    ]
+    assert check_document(load_field_index('v1_32'), 'v1_32', {**pod, 'spec': {'resources': {}}}) == []
+    assert check_document(index, 'v1_29', {'apiVersion': 'v1', 'kind': 'ConfigMap', 'data': {}}) == []
+    assert check_document(index, 'v1_29', {'apiVersion': 'example.com/v1', 'kind': 'Widget'}) == [
+        'example.com/v1/Widget: kind does not exist in v1_29'
+    ]
+
+
+def test_field_index_and_kind_registry_agree_on_kinds():
+    for version in k8s.available_versions():
+        kinds = load_field_index(version)['kinds']
+        for (api_version, kind), info in kind_registry(version).items():
+            assert kinds[f'{api_version}/{kind}'] == f'{info.module}.{info.name}'
+
+
+def test_render_matrix_finds_kinds_outside_their_package_name_group():
+    (result,) = render_matrix(grouped_kinds.transpiler, {'name': 'web'}, ['v1_31'])
+    assert (result.error, result.problems) == (None, [])
+    assert [d['apiVersion'] for d in gybe.render(grouped_kinds, {'name': 'web'})] == [
+        'resource.k8s.io/v1alpha3',
+        'authorization.k8s.io/v1',
+        'storagemigration.k8s.io/v1alpha1',
+    ]
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_render_matrix_checks_every_version(jobs):
+    results = render_matrix(pod_resources.transpiler, {'name': 'web'}, ['1.29', 'v1_32'], jobs=jobs)
+    assert [r.version for r in results] == ['v1_29', 'v1_32']
+    assert results[0].problems == ['Pod/web: field spec.resources does not exist in v1_29']
+    assert results[1].problems == []
+    assert all(r.error is None for r in results)
+    assert k8s.current_version() == k8s.DEFAULT_VERSION
+
+
+def test_render_matrix_resolves_looked_up_models_per_version():
+    results = render_matrix(looked_up_pod_resources.transpiler, {'name': 'web'}, ['v1_31', 'v1_32'])
+    assert "TypeError: PodSpec.__init__() got an unexpected keyword argument 'resources'" in str(
+        results[0].error
+    )
+    assert results[1].error is None
+    assert results[1].problems == []
+    assert k8s.current_version() == k8s.DEFAULT_VERSION
+
+    with pytest.raises(ValueError, match='unknown kubernetes version'):
+        render_matrix(web.transpiler, {'name': 'web'}, ['v1_31', '2.0'])
+
+
+def test_matrix_command_reports_every_version(values_path):
+    result = CliRunner().invoke(web, ['matrix', str(values_path)])
+    assert result.exit_code == 0
+    assert [line.split()[:2] for line in result.stdout.splitlines()] == [
+        ['ok', v] for v in k8s.available_versions()
+    ]
+
+
+def test_matrix_command_fails_on_missing_fields(values_path):
+    args = ['matrix', str(values_path), '--versions', '1.30', '--versions', '1.32', '--jobs', '1']
+    result = CliRunner().invoke(pod_resources, args)
+    assert result.exit_code == 1
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith('WARN  v1_30 (')
+    assert lines[1] == '      - Pod/web: field spec.resources does not exist in v1_30'
+    assert lines[2].startswith('ok    v1_32 (')
+
+    result = CliRunner().invoke(looked_up_pod_resources, args)
+    assert result.exit_code == 1
+    assert result.stdout.startswith('FAIL  v1_30: TypeError')
+
+    result = CliRunner().invoke(looked_up_pod_resources, [*args, '--json'])
+    assert result.exit_code == 1
+    report = json.loads(result.stdout)
+    assert [r['version'] for r in report] == ['v1_30', 'v1_32']
+    assert 'unexpected keyword argument' in report[0]['error']
+    assert report[1] == {**report[1], 'problems': [], 'error': None}
+
+    result = CliRunner().invoke(looked_up_pod_resources, [*args[:2], '--versions', '2.0'])
+    assert result.exit_code == 2
+    assert 'unknown kubernetes version' in result.stderr
+
+
+def test_importing_gybe_leaves_codegen_and_subcommands_unloaded():
+    code = (
+        'import sys, gybe\n'
+        "lazy = ('gybe.codegen', 'gybe.matrix', 'gybe.batch', 'gybe.watch', 'gybe.server', 'gybe.timings')\n"
+        'print([m for m in sys.modules if m.startswith(lazy)])\n'
+    )
+    out = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout  # noqa: S603
+    assert out.strip() == '[]'
@@ -0,0 +1,81 @@
+import gc
+import json
+
+import pytest
+
+import gybe
+from gybe.exceptions import InvalidInputError, InvalidOutputError, TranspilerError
+from gybe.rendering import _input_models, as_transpiler
+from tests.test_errors import invalid_output_not_list
+from tests.test_example import EXPECTED_TWO_POD_MANIFEST, two_pods
+
+VALUES = {'image': 'python:3', 'command': ['python', '-m', 'http.server']}
+
+
+def _pod(name: str) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=name))]
+
+
+def test_render_returns_manifest_dicts():
+    manifest = gybe.render(two_pods, VALUES)
+    assert [r['metadata']['name'] for r in manifest] == ['pod-1', 'pod-2']
+    assert manifest[0]['spec']['containers'][0]['command'] == VALUES['command']
+
+
+def test_render_yaml_matches_cli_output():
+    assert gybe.render_yaml(two_pods, VALUES) == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+
+
+def test_render_json_returns_list():
+    d = json.loads(gybe.render_json(two_pods, VALUES))
+    assert d['kind'] == 'List'
+    assert d['items'] == gybe.render(two_pods, VALUES)
+
+
+def test_render_plain_function_reuses_transpiler():
+    assert gybe.render(_pod, {'name': 'a'}) == [
+        {'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'a'}}
+    ]
+    assert as_transpiler(_pod).input_model is as_transpiler(_pod).input_model
+    t = as_transpiler(_pod)
+    assert as_transpiler(t) is t
+
+
+def test_render_does_not_keep_plain_functions_alive():
+    def make(n):
+        def pod(name: str) -> gybe.Manifest:
+            return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'{name}-{n}'))]
+
+        return pod
+
+    before = len(_input_models)
+    functions = [make(n) for n in range(10)]
+    for f in functions:
+        gybe.render(f, {'name': 'a'})
+    assert len(_input_models) == before + 10
+    del f, functions
+    gc.collect()
+    assert len(_input_models) == before
+
+    # bound methods are new objects on every access
+    class Chart:
+        def pod(self, name: str) -> gybe.Manifest:
+            return _pod(name)
+
+    chart = Chart()
+    for _ in range(10):
+        assert gybe.render(chart.pod, {'name': 'a'})[0]['metadata'] == {'name': 'a'}
+    gc.collect()
+    assert len(_input_models) == before
+
+
+def test_render_raises_structured_errors():
+    with pytest.raises(InvalidInputError) as exc_info:
+        gybe.render(two_pods, {})
+    assert exc_info.value.errors == [
+        'required field missing @ $.image',
+        'required field missing @ $.command',
+    ]
+    with pytest.raises(InvalidOutputError):
+        gybe.render(invalid_output_not_list)
+    assert issubclass(InvalidInputError, TranspilerError)
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+import gybe
+from gybe.exceptions import StructureError
+from gybe.k8s.types import K8sSpec
+from gybe.rendering import _c
+from gybe.serialization import make_structure_fn, make_unstructure_fn, structure, unstructure
+
+
+def _deployment(labels: dict[str, str]):
+    return gybe.k8s.Deployment(
+        metadata=gybe.k8s.ObjectMeta(name='web', labels=labels),
+        spec=gybe.k8s.DeploymentSpec(
+            selector=gybe.k8s.LabelSelector(matchLabels=labels),
+            template=gybe.k8s.PodTemplateSpec(
+                metadata=gybe.k8s.ObjectMeta(labels=labels),
+                spec=gybe.k8s.PodSpec(
+                    containers=[
+                        gybe.k8s.Container(
+                            name='web',
+                            image='nginx',
+                            args=['-g', 'daemon off;'],
+                            ports=[gybe.k8s.ContainerPort(containerPort=80)],
+                        )
+                    ],
+                ),
+            ),
+        ),
+    )
+
+
+def test_unstructure_deployment_omits_none_values():
+    labels = {'app': 'web'}
+    assert unstructure(_deployment(labels)) == {
+        'apiVersion': 'apps/v1',
+        'kind': 'Deployment',
+        'metadata': {'name': 'web', 'labels': labels},
+        'spec': {
+            'selector': {'matchLabels': labels},
+            'template': {
+                'metadata': {'labels': labels},
+                'spec': {
+                    'containers': [
+                        {
+                            'name': 'web',
+                            'image': 'nginx',
+                            'args': ['-g', 'daemon off;'],
+                            'ports': [{'containerPort': 80}],
+                        }
+                    ],
+                },
+            },
+        },
+    }
+
+
+def test_unstructure_copies_shared_values():
+    labels = {'app': 'web'}
+    d = unstructure(_deployment(labels))
+    assert d['metadata']['labels'] is not labels
+    assert d['metadata']['labels'] is not d['spec']['selector']['matchLabels']
+
+
+def test_unstructure_leaves_str_in_list_fields_unsplit():
+    container = gybe.k8s.Container(name='web', command='python', args=('-m', 'http.server'))  # type: ignore[arg-type]
+    assert unstructure(container) == {'name': 'web', 'command': 'python', 'args': ['-m', 'http.server']}
+    assert _c.unstructure(container) == unstructure(container)
+
+
+def test_unstructure_fn_is_cached_per_class():
+    assert make_unstructure_fn(gybe.k8s.Pod) is make_unstructure_fn(gybe.k8s.Pod)
+
+
+def test_structure_round_trips_unstructured_models():
+    deployment = _deployment({'app': 'web'})
+    d = unstructure(deployment)
+    assert structure(d, gybe.k8s.Deployment) == deployment
+    assert make_structure_fn(gybe.k8s.Pod) is make_structure_fn(gybe.k8s.Pod)
+
+    d['spec']['template']['spec']['containers'][0]['future'] = True
+    with pytest.raises(StructureError, match=r'^spec.template.spec.containers\[0\].future: unknown field$'):
+        structure(d, gybe.k8s.Deployment)
+    with pytest.raises(StructureError, match='^expected a mapping, got list$'):
+        structure([], gybe.k8s.Pod)  # type: ignore[arg-type]
+    with pytest.raises(StructureError, match=r'^spec.containers\[0\]: expected a mapping, got str$'):
+        structure({'spec': {'containers': ['web']}}, gybe.k8s.Pod)
+
+
+def test_converter_uses_compiled_unstructure_fns():
+    pod = gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name='pod'))
+    assert _c.unstructure(pod) == unstructure(pod)
+
+
+@dataclass
+class _Tree(K8sSpec):
+    name: str
+    children: Optional[list['_Tree']] = None
+    parent: Optional['_Tree'] = None
+    data: Optional[dict] = None
+    weight: Optional[float] = None
+
+
+def test_unstructure_self_referencing_model():
+    tree = _Tree(name='root', children=[_Tree(name='leaf', data={'nested': [_Tree(name='x')]})])
+    assert unstructure(tree) == {
+        'name': 'root',
+        'children': [{'name': 'leaf', 'data': {'nested': [{'name': 'x'}]}}],
+    }
+    d = {'name': 'root', 'children': [{'name': 'leaf', 'parent': {'name': 'root'}, 'data': {'a': [1]}}]}
+    assert structure(d, _Tree) == _Tree(
+        name='root', children=[_Tree(name='leaf', parent=_Tree(name='root'), data={'a': [1]})]
+    )
+    assert structure({'name': 'x', 'weight': 1}, _Tree) == _Tree(name='x', weight=1)
+    with pytest.raises(StructureError, match=r'^children\[0\].weight: expected float, got str$'):
+        structure({'name': 'x', 'children': [{'name': 'y', 'weight': '1'}]}, _Tree)
+
+
+@dataclass
+class _Unresolvable(K8sSpec):
+    value: Optional['NotDefined'] = None  # type: ignore[name-defined]  # noqa: F821
+
+
+def test_unstructure_unresolvable_annotations_fall_back_to_runtime_dispatch():
+    value = _Unresolvable(value=_Tree(name='x'))  # type: ignore[arg-type]
+    assert unstructure(value) == {'value': {'name': 'x'}}
+    assert structure({'value': {'name': 'x'}}, _Unresolvable) == _Unresolvable(value={'name': 'x'})
@@ -0,0 +1,201 @@
+import errno
+import http.client
+import json
+import os
+import socket
+import sys
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from gybe.cli import main
+from gybe.server import ChartRegistry, RenderHTTPServer, UnixRenderHTTPServer
+
+CHART = """
+import gybe
+
+
+@gybe.transpiler
+def {name}(name: str) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name={prefix!r} + name))]
+"""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__('localhost')
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def _write_chart(path, name='pod', prefix=''):
+    path.write_text(CHART.format(name=name, prefix=prefix))
+
+
+def _request(conn, method, url, body=None):
+    conn.request(method, url, body=body)
+    response = conn.getresponse()
+    return response.status, response.read().decode()
+
+
+@pytest.fixture
+def chart_path(tmp_path):
+    path = tmp_path / 'chart.py'
+    _write_chart(path)
+    return path
+
+
+@pytest.fixture
+def tcp_server(chart_path):
+    server = RenderHTTPServer(('127.0.0.1', 0), ChartRegistry([chart_path]), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield http.client.HTTPConnection('127.0.0.1', server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_renders_charts(tcp_server):
+    assert _request(tcp_server, 'GET', '/charts') == (200, json.dumps({'charts': ['pod']}))
+    assert _request(tcp_server, 'GET', '/healthz') == (200, 'ok\n')
+    status, body = _request(tcp_server, 'POST', '/render/pod', 'name: a')
+    assert status == 200
+    assert body == 'apiVersion: v1\nkind: Pod\nmetadata:\n  name: a\n\n'
+    status, body = _request(tcp_server, 'POST', '/render/pod?format=json', '{"name": "a"}')
+    assert status == 200
+    assert json.loads(body)['items'] == [{'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'a'}}]
+
+
+def test_server_reports_errors(tcp_server):
+    assert _request(tcp_server, 'GET', '/nope')[0] == 404
+    assert _request(tcp_server, 'POST', '/nope', '')[0] == 404
+    assert _request(tcp_server, 'POST', '/render/missing', '')[0] == 404
+    status, body = _request(tcp_server, 'POST', '/render/pod', '')
+    assert status == 422
+    assert json.loads(body)['errors'] == ['required field missing @ $.name']
+    status, body = _request(tcp_server, 'POST', '/render/pod', '- 1')
+    assert status == 400
+    assert json.loads(body)['error'] == 'values must be a mapping, got list'
+    assert _request(tcp_server, 'POST', '/render/pod', 'name: [')[0] == 400
+
+
+def test_server_reports_charts_that_fail_to_reload(tcp_server, chart_path):
+    chart_path.write_text('raise RuntimeError("broken chart")\n')
+    os.utime(chart_path, ns=(0, 10**9))
+    status, body = _request(tcp_server, 'GET', '/charts')
+    assert status == 500
+    assert json.loads(body) == {'error': 'RuntimeError: broken chart'}
+    # the connection stays usable
+    assert _request(tcp_server, 'GET', '/healthz') == (200, 'ok\n')
+
+
+def test_registry_keeps_charts_with_the_same_file_name_apart(tmp_path):
+    paths = [tmp_path / 'a/chart.py', tmp_path / 'b/chart.py']
+    for path, name in zip(paths, ['first', 'second']):
+        path.parent.mkdir()
+        _write_chart(path, name=name, prefix=f'{name}-')
+    registry = ChartRegistry(paths)
+    assert registry.names() == ['first', 'second']
+    assert [registry.get(n).function.__name__ for n in registry.names()] == ['first', 'second']
+    for name in registry.names():
+        function = registry.get(name).function
+        # each chart module stays registered under its own name
+        assert getattr(sys.modules[function.__module__], name).transpiler.function is function
+
+
+def test_server_reloads_changed_charts(tcp_server, chart_path):
+    _write_chart(chart_path, prefix='new-')
+    os.utime(chart_path, ns=(0, 10**9))
+    status, body = _request(tcp_server, 'POST', '/render/pod', 'name: a')
+    assert status == 200
+    assert 'name: new-a' in body
+
+    _write_chart(chart_path, name='renamed')
+    os.utime(chart_path, ns=(0, 2 * 10**9))
+    assert _request(tcp_server, 'GET', '/charts') == (200, json.dumps({'charts': ['renamed']}))
+    assert _request(tcp_server, 'POST', '/render/pod', 'name: a')[0] == 404
+
+
+def test_server_listens_on_unix_socket(tmp_path, chart_path):
+    socket_path = tmp_path / 'gybe.sock'
+    server = UnixRenderHTTPServer(socket_path, ChartRegistry([chart_path]), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        status, body = _request(UnixHTTPConnection(str(socket_path)), 'POST', '/render/pod', 'name: a')
+        assert status == 200
+        assert 'name: a' in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unix_server_only_replaces_socket_files(tmp_path, chart_path):
+    values = tmp_path / 'values.yaml'
+    values.write_text('name: a')
+    with pytest.raises(FileExistsError, match='is not a socket'):
+        UnixRenderHTTPServer(values, ChartRegistry([chart_path]), quiet=True)
+    assert values.read_text() == 'name: a'
+
+    result = CliRunner().invoke(main, ['serve', str(chart_path), '--socket', str(values)])
+    assert result.exit_code == 2
+    assert 'is not a socket' in result.stderr
+    assert values.read_text() == 'name: a'
+
+    # a socket left behind by a previous server is replaced
+    stale = tmp_path / 'stale.sock'
+    UnixRenderHTTPServer(stale, ChartRegistry([chart_path]), quiet=True).server_close()
+    assert stale.exists()
+    UnixRenderHTTPServer(stale, ChartRegistry([chart_path]), quiet=True).server_close()
+
+
+def test_unix_server_does_not_take_the_socket_of_a_running_server(tmp_path, chart_path):
+    socket_path = tmp_path / 'gybe.sock'
+    server = UnixRenderHTTPServer(socket_path, ChartRegistry([chart_path]), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(OSError, match='already in use') as exc_info:
+            UnixRenderHTTPServer(socket_path, ChartRegistry([chart_path]), quiet=True)
+        assert exc_info.value.errno == errno.EADDRINUSE
+
+        result = CliRunner().invoke(main, ['serve', str(chart_path), '--socket', str(socket_path)])
+        assert result.exit_code == 2
+        assert 'already in use by a running server' in result.stderr
+
+        # the running server still answers on its socket
+        status, _ = _request(UnixHTTPConnection(str(socket_path)), 'POST', '/render/pod', 'name: a')
+        assert status == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_registry_rejects_duplicate_chart_names(tmp_path, chart_path):
+    other = tmp_path / 'other.py'
+    _write_chart(other)
+    with pytest.raises(ValueError, match='defined in both'):
+        ChartRegistry([chart_path, other])
+
+
+def test_serve_command_requires_existing_charts(tmp_path):
+    result = CliRunner().invoke(main, ['serve', str(tmp_path / 'missing.py')])
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize('listen', [['--port', '0'], ['--socket', 'gybe.sock']])
+def test_serve_command_serves_until_interrupted(monkeypatch, tmp_path, chart_path, listen):
+    def interrupt(self):
+        raise KeyboardInterrupt
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(RenderHTTPServer, 'serve_forever', interrupt)
+    monkeypatch.setattr(UnixRenderHTTPServer, 'serve_forever', interrupt)
+    result = CliRunner().invoke(main, ['serve', str(chart_path), '--quiet', *listen])
+    assert result.exit_code == 0
+    assert result.stderr.startswith('serving pod on ')
+    assert not (tmp_path / 'gybe.sock').exists()
@@ -0,0 +1,74 @@
+import io
+import json
+import pstats
+import tracemalloc
+
+import pytest
+from click.testing import CliRunner
+
+from gybe.timings import PHASES, timed_render
+from tests.test_example import (
+    EXPECTED_INVALID_TWO_POD_YAML,
+    EXPECTED_TWO_POD_MANIFEST,
+    INVALID_TWO_POD_YAML,
+    VALID_TWO_POD_YAML,
+    many_pods,
+    two_pods,
+)
+
+
+@pytest.mark.parametrize('chart', [two_pods, many_pods])
+def test_timed_render_writes_the_same_manifest(chart):
+    output = io.StringIO()
+    timings = timed_render(chart.transpiler, VALID_TWO_POD_YAML, output).to_dict()
+    assert output.getvalue() == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+    assert list(timings['phases']) == list(PHASES)
+    assert timings['phases']['unstructure']['calls'] == 2
+    # once per rendered resource, not once per phase it went through
+    assert timings['kinds']['Pod']['calls'] == 2
+    assert timings['phases']['yaml_dumps']['calls'] == 2
+    assert timings['seconds'] >= sum(p['seconds'] for p in timings['phases'].values())
+
+
+def test_timings_trace_allocations_freed_within_a_phase():
+    output = io.StringIO()
+    timings = timed_render(two_pods.transpiler, VALID_TWO_POD_YAML, output)
+    assert not tracemalloc.is_tracing()
+    for name in ('yaml_loads', 'structure', 'unstructure', 'yaml_dumps'):
+        phase = timings.phases[name]
+        # the parser's and emitter's working memory is freed before the phase ends
+        assert phase.peak_allocated_bytes > max(phase.net_allocated_bytes, 0)
+    assert timings.kinds['Pod'].peak_allocated_bytes > 0
+
+
+def test_timings_are_reported_as_json_on_stderr(tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(VALID_TWO_POD_YAML)
+    result = CliRunner().invoke(two_pods, [str(values_path), '--timings'])
+    assert result.exit_code == 0
+    assert result.stdout == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+    assert set(json.loads(result.stderr)) == {'seconds', 'phases', 'kinds'}
+
+
+def test_profile_dumps_pstats(tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(VALID_TWO_POD_YAML)
+    profile_path = tmp_path / 'render.pstats'
+    result = CliRunner().invoke(two_pods, [str(values_path), '--profile', str(profile_path)])
+    assert result.exit_code == 0
+    assert json.loads(result.stderr)['kinds']['Pod']['calls'] == 2
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+
+
+def test_timings_report_validation_errors(tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(INVALID_TWO_POD_YAML)
+    result = CliRunner().invoke(two_pods, [str(values_path), '--timings'])
+    assert result.exit_code == -1
+    assert result.stdout.strip() == EXPECTED_INVALID_TWO_POD_YAML.strip()
+
+
+def test_timings_cannot_be_combined_with_watch(tmp_path):
+    values_path = tmp_path / 'values.yaml'
+    values_path.write_text(VALID_TWO_POD_YAML)
+    assert CliRunner().invoke(two_pods, [str(values_path), '--timings', '--watch']).exit_code == 2
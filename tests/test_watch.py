@@ -0,0 +1,151 @@
+import importlib
+import os
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from gybe.watch import ChartWatcher, DocumentDirectory, document_file_names
+from tests.test_example import EXPECTED_TWO_POD_MANIFEST, VALID_TWO_POD_YAML, two_pods
+
+HELPER = """
+def pod_name(name):
+    return {prefix!r} + name
+"""
+
+CHART = """
+import gybe
+from watch_helper import pod_name
+
+
+@gybe.transpiler
+def watched(names: list[str]) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=pod_name(n))) for n in names]
+"""
+
+
+def _touch(path, content, tick):
+    path.write_text(content)
+    os.utime(path, ns=(0, tick * 10**9))
+
+
+@pytest.fixture
+def chart(tmp_path, monkeypatch):
+    _touch(tmp_path / 'watch_helper.py', HELPER.format(prefix='a-'), 1)
+    _touch(tmp_path / 'watch_chart.py', CHART, 1)
+    _touch(tmp_path / 'values.yaml', 'names: [x]', 1)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module('watch_chart')
+    for name in ('watch_chart', 'watch_helper'):
+        sys.modules.pop(name, None)
+
+
+def _watcher(chart, tmp_path):
+    renders, logs = [], []
+    watcher = ChartWatcher(chart.watched.transpiler, tmp_path / 'values.yaml', renders.append, logs.append)
+    return watcher, renders, logs
+
+
+def _names(documents):
+    return [d['metadata']['name'] for d in documents]
+
+
+def test_watcher_renders_on_values_change(chart, tmp_path):
+    watcher, renders, logs = _watcher(chart, tmp_path)
+    assert watcher.poll()
+    assert not watcher.poll()
+    _touch(tmp_path / 'values.yaml', 'names: [x, y]', 2)
+    assert watcher.poll()
+    assert [_names(r) for r in renders] == [['a-x'], ['a-x', 'a-y']]
+
+    _touch(tmp_path / 'values.yaml', 'names: 1', 3)
+    assert watcher.poll()
+    assert 'validation errors' in logs[-1]
+    assert len(renders) == 2
+
+
+def test_watcher_reloads_changed_helpers(chart, tmp_path):
+    watcher, renders, logs = _watcher(chart, tmp_path)
+    watcher.poll()
+    _touch(tmp_path / 'watch_helper.py', HELPER.format(prefix='b-'), 2)
+    assert watcher.poll()
+    assert _names(renders[-1]) == ['b-x']
+    assert 'reloaded' in logs[-1]
+
+    _touch(tmp_path / 'watch_chart.py', 'syntax error', 3)
+    assert watcher.poll()
+    assert 'SyntaxError' in logs[-1]
+    _touch(tmp_path / 'watch_chart.py', CHART.replace('watched', 'renamed'), 4)
+    assert watcher.poll()
+    assert "transpiler 'watched' no longer defined" in logs[-1]
+    _touch(tmp_path / 'watch_chart.py', CHART, 5)
+    assert watcher.poll()
+    assert _names(renders[-1]) == ['b-x']
+
+
+def test_document_file_names_are_unique():
+    documents = [
+        {'kind': 'Pod', 'metadata': {'name': 'web'}},
+        {'kind': 'Pod', 'metadata': {'name': 'web'}},
+        {'kind': 'Service', 'metadata': {'name': 'Web_1', 'namespace': 'prod'}},
+        {},
+    ]
+    assert document_file_names(documents) == [
+        'pod-web.yaml',
+        'pod-web-2.yaml',
+        'service-prod-web-1.yaml',
+        'document-3.yaml',
+    ]
+
+
+def test_document_directory_only_rewrites_changed_documents(tmp_path):
+    directory = DocumentDirectory(tmp_path / 'out')
+    a = {'kind': 'Pod', 'metadata': {'name': 'a'}}
+    b = {'kind': 'Pod', 'metadata': {'name': 'b'}}
+    assert directory.write([a, b]) == [tmp_path / 'out/pod-a.yaml', tmp_path / 'out/pod-b.yaml']
+    assert directory.write([a, b]) == []
+    assert DocumentDirectory(tmp_path / 'out').write([a, b]) == []
+    b['spec'] = {}
+    assert directory.write([a, b]) == [tmp_path / 'out/pod-b.yaml']
+    assert directory.write([a]) == [tmp_path / 'out/pod-b.yaml']
+    assert sorted(p.name for p in (tmp_path / 'out').iterdir()) == ['pod-a.yaml']
+
+
+def test_render_out_dir_writes_one_file_per_document(tmp_path):
+    values = tmp_path / 'values.yaml'
+    values.write_text(VALID_TWO_POD_YAML)
+    result = CliRunner().invoke(two_pods, [str(values), '--out-dir', str(tmp_path / 'out')])
+    assert result.exit_code == 0
+    assert sorted(p.name for p in (tmp_path / 'out').iterdir()) == ['pod-pod-1.yaml', 'pod-pod-2.yaml']
+
+
+def test_render_rejects_output_with_out_dir(tmp_path):
+    values = tmp_path / 'values.yaml'
+    values.write_text(VALID_TWO_POD_YAML)
+    args = [str(values), '--out-dir', str(tmp_path / 'out'), '-o', str(tmp_path / 'm.yaml')]
+    assert CliRunner().invoke(two_pods, args).exit_code == 2
+
+
+def test_watch_rejects_stdin():
+    result = CliRunner().invoke(two_pods, ['-', '--watch'], input=VALID_TWO_POD_YAML)
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize('target', [[], ['-o', 'manifest.yaml'], ['--out-dir', 'out']])
+def test_watch_renders_until_interrupted(monkeypatch, tmp_path, target):
+    def run_once(self, interval):
+        self.poll()
+        self.poll()
+        raise KeyboardInterrupt
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ChartWatcher, 'run', run_once)
+    (tmp_path / 'values.yaml').write_text(VALID_TWO_POD_YAML)
+    result = CliRunner().invoke(two_pods, ['values.yaml', '--watch', *target])
+    assert result.exit_code == 0
+    if not target:
+        assert result.stdout == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+    elif target[0] == '-o':
+        assert (tmp_path / 'manifest.yaml').read_text() == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+    else:
+        assert '2 of 2 documents changed' in result.stderr
@@ -0,0 +1,41 @@
+import yaml
+
+from gybe import yaml as gybe_yaml
+from gybe.yaml import YAML_BACKEND, yaml_dumps, yaml_loads
+
+DOCUMENT = {
+    'apiVersion': 'v1',
+    'kind': 'ConfigMap',
+    'metadata': {'name': 'config', 'labels': {'app': 'web', 'k k': 'needs quotes'}},
+    'data': {
+        'long': ' '.join(['word'] * 60),
+        'multiline': 'line1\nline2\n',
+        'unicode': 'héllo ✓ 日本 😀',
+        'quotes': 'it\'s "quoted"',
+        'numeric': '0123',
+        'boolean': 'yes',
+        'empty': '',
+        'special': '- *x &a # c',
+    },
+    'replicas': 3,
+    'ratio': 1.5,
+    'enabled': True,
+    'nothing': None,
+    'items': [[], {}, [1, {'a': None}]],
+}
+
+
+def test_yaml_backend_is_reported():
+    assert YAML_BACKEND in ('libyaml', 'python')
+    assert YAML_BACKEND == ('libyaml' if yaml.__with_libyaml__ else 'python')
+
+
+def test_yaml_backends_emit_identical_output():
+    python_output = yaml.dump(DOCUMENT, Dumper=yaml.SafeDumper, **gybe_yaml._dump_options)
+    assert yaml_dumps(DOCUMENT) == python_output
+    assert yaml_dumps(DOCUMENT) == yaml.dump(DOCUMENT, default_flow_style=False)
+
+
+def test_yaml_round_trip():
+    assert yaml_loads(yaml_dumps(DOCUMENT)) == DOCUMENT
+    assert yaml_loads('') is None